@@ -1,11 +1,165 @@
+import json
+import threading
+from collections.abc import Iterator
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from datetime import datetime, timedelta, timezone
 from typing import Any
+from loguru import logger
 from universal_mcp.applications import APIApplication
 from universal_mcp.integrations import Integration
 
+from universal_mcp_asana.audit import AuditLogTailer, backfill_audit_log_events
+from universal_mcp_asana.batch import HYDRATABLE_RESOURCES, BatchDispatcher, SingleFlight, execute_batched
+from universal_mcp_asana.cache import PersistentStore, ResponseCache, cache_key
+from universal_mcp_asana.events import CacheCoherence
+from universal_mcp_asana.importer import TaskImporter
+from universal_mcp_asana.mirror import ProjectMirror
+from universal_mcp_asana.resolver import CustomFieldCatalog, NameIndex, TypeaheadCache
+from universal_mcp_asana.utils import Handoff, format_timestamp, parse_timestamp
+from universal_mcp_asana.webhooks import WebhookReconciler
+
+MAX_PAGE_SIZE = 100
+SEARCH_RESULT_CAP = 100
+SEARCH_EPOCH = datetime(2008, 1, 1, tzinfo=timezone.utc)
+SEARCH_MIN_WINDOW = timedelta(milliseconds=1)
+
+
+def _is_gid_value(value) -> bool:
+    # Whether a custom field value needs no translation: a gid, a list of
+    # gids, a number, a boolean or a cleared value.
+    if isinstance(value, list):
+        return all(isinstance(item, str) and item.isdigit() for item in value)
+    return value is None or isinstance(value, (int, float)) or (isinstance(value, str) and value.isdigit())
+
+
 class AsanaApp(APIApplication):
-    def __init__(self, integration: Integration = None, **kwargs) -> None:
+    def __init__(self, integration: Integration = None, auto_batch: bool = False, batch_window: float = 0.005, cache: bool | ResponseCache = False, cache_path: str | None = None, coherence_interval: float | None = None, coalesce: bool = False, mirror_path: str | None = None, mirror_interval: float | None = None, **kwargs) -> None:
+        """
+        Args:
+            integration: Integration supplying the Asana credentials.
+            auto_batch: Pack concurrent single-resource GETs (`get_atask`, `get_auser`, `get_aproject`, ...) into `/batch` requests of up to 10 actions.
+            batch_window: Seconds a batched GET waits for others to join its batch.
+            cache: Serve repeated GETs from an in-process response cache. Pass True for the default TTLs and size cap, or a configured `ResponseCache`.
+            cache_path: SQLite file that keeps workspaces, users, teams, custom fields and time periods across restarts. Enables the response cache.
+            coherence_interval: Poll `/events` every this many seconds for the cached projects and tasks, evicting what changed and keeping the rest fresh past its TTL. Enables the response cache.
+            coalesce: Let concurrent identical GETs share one in-flight request and its response.
+            mirror_path: SQLite file holding the local mirror of the projects passed to `mirror_project`, which the `query_mirrored_tasks` and `get_mirrored_task` tools read from.
+            mirror_interval: Apply the `/events` of every mirrored project every this many seconds in the background.
+            **kwargs: Forwarded to `APIApplication`.
+        """
         super().__init__(name='asana', integration=integration, **kwargs)
         self.base_url = "https://app.asana.com/api/1.0"
+        self._batcher = BatchDispatcher(self, window=batch_window) if auto_batch else None
+        self._flights = SingleFlight() if coalesce else None
+        self.names = NameIndex(self)
+        self.custom_fields = CustomFieldCatalog(self)
+        if cache_path and not isinstance(cache, ResponseCache):
+            cache = ResponseCache(persistent=PersistentStore(cache_path))
+        if coherence_interval and not cache:
+            cache = True
+        self.cache = ResponseCache() if cache is True else (cache or None)
+        self.typeahead = TypeaheadCache() if self.cache is not None else None
+        self.mirror = ProjectMirror(self, mirror_path) if mirror_path else None
+        if self.mirror is not None and mirror_interval:
+            self.mirror.start(mirror_interval)
+        self.coherence = None
+        if coherence_interval:
+            self.coherence = CacheCoherence(self, self.cache, interval=coherence_interval)
+            self.coherence.start()
+
+    def _get(self, url, params=None):
+        """
+        Sends a GET, answering it from the response cache when enabled, joining an identical GET already in flight when coalescing is enabled, and routing it through the `/batch` dispatcher when auto-batching is enabled and the request qualifies.
+        """
+        if self.cache is not None:
+            response = self.cache.get(url, params)
+            if response is not None:
+                return response
+        if self._flights is not None:
+            return self._flights.do(cache_key(url, params), lambda: self._fetch(url, params))
+        return self._fetch(url, params)
+
+    def _fetch(self, url, params=None):
+        generation = self.cache.generation if self.cache is not None else None
+        response = self._batcher.get(url, params) if self._batcher is not None else None
+        if response is None:
+            response = super()._get(url, params=params)
+        if self.cache is not None:
+            self.cache.put(url, params, response, generation)
+        return response
+
+    def _post(self, url, data, params=None, content_type='application/json', files=None):
+        response = super()._post(url, data, params=params, content_type=content_type, files=files)
+        self._apply_write('POST', url, params, data, response)
+        return response
+
+    def _put(self, url, data, params=None, content_type='application/json', files=None):
+        response = super()._put(url, data, params=params, content_type=content_type, files=files)
+        self._apply_write('PUT', url, params, data, response)
+        return response
+
+    def _delete(self, url, params=None):
+        response = super()._delete(url, params=params)
+        self._apply_write('DELETE', url, params, None, response)
+        return response
+
+    def _apply_write(self, verb, url, params, data, response) -> None:
+        """
+        Brings local state in line with a successful write: evicts or refreshes the cached responses it made stale, folds the records it returned into the name index, and stops later reads from joining GETs that were in flight during it. Actions of a `/batch` request are applied one by one, skipping reads and failed actions.
+        """
+        if not url.startswith(self.base_url):
+            return
+        relative_path = url[len(self.base_url):]
+        try:
+            payload = response.json()
+        except ValueError:
+            payload = None
+        if relative_path != '/batch':
+            writes = [(verb, relative_path, url, params, data, payload)]
+        else:
+            actions = ((data or {}).get('data') or {}).get('actions') or []
+            results = (payload or {}).get('data') or []
+            writes = [
+                (
+                    action['method'].upper(),
+                    action['relative_path'],
+                    f"{self.base_url}{action['relative_path']}",
+                    {'opt_fields': ','.join(action['options']['fields'])} if (action.get('options') or {}).get('fields') else None,
+                    {'data': action.get('data')},
+                    result.get('body'),
+                )
+                for action, result in zip(actions, results)
+                if action.get('method', 'get').lower() != 'get' and 200 <= (result.get('status_code') or 0) < 300
+            ]
+        if writes and self._flights is not None:
+            # A read already in flight may have been answered before this write.
+            self._flights.forget()
+        for write_verb, write_path, write_url, write_params, body, write_payload in writes:
+            if self.cache is not None:
+                self.cache.apply_mutation(write_verb, write_path, write_url, write_params, body, write_payload)
+            self.names.observe(write_verb, write_path, write_payload)
+            self.custom_fields.observe(write_verb, write_path)
+        if writes and self.typeahead is not None:
+            self.typeahead.clear()
+
+    def _translate_custom_fields(self, data, task_gid=None):
+        """
+        Rewrites custom field names and enum option labels in the `data` of a task write to gids, using the cached custom field catalog of the task's projects and workspace. When `data` names neither a workspace nor projects, the workspace and projects of the task `task_gid` are fetched and used instead. `create_asubtask` passes the parent task's gid, so a new subtask's field names are resolved against the parent's projects.
+        """
+        custom_fields = (data or {}).get('custom_fields')
+        if not isinstance(custom_fields, dict) or not custom_fields:
+            return data
+        if all(str(key).isdigit() and _is_gid_value(value) for key, value in custom_fields.items()):
+            return data
+        workspace = data.get('workspace')
+        projects = data.get('projects') or []
+        if isinstance(projects, str):
+            projects = [projects]
+        if task_gid is not None and not workspace and not projects:
+            task = self.get_atask(task_gid, opt_fields='workspace,projects').get('data') or {}
+            workspace = (task.get('workspace') or {}).get('gid')
+            projects = [project['gid'] for project in task.get('projects') or []]
+        return {**data, 'custom_fields': self.custom_fields.translate(custom_fields, workspace, projects)}
 
     def get_an_allocation(self, allocation_gid, opt_fields=None, opt_pretty=None) -> dict[str, Any]:
         """
@@ -280,6 +434,67 @@ class AsanaApp(APIApplication):
         response.raise_for_status()
         return response.json()
 
+    def export_audit_log_events(self, workspace_gid, output_path, checkpoint_path, start_at=None, end_at=None, event_type=None, actor_type=None, actor_gid=None, resource_gid=None) -> dict[str, Any]:
+        """
+        Appends all currently available audit log events of a workspace to an NDJSON file, resuming from and updating a local checkpoint so repeated calls only export new events.
+
+        Args:
+            workspace_gid (string): workspace_gid
+            output_path (string): Path of the NDJSON file the events are appended to, one event per line. Example: 'audit.ndjson'.
+            checkpoint_path (string): Path of the JSON checkpoint holding the `start_at`/`offset` cursor and the gids already exported at `start_at`. When it exists, export resumes from it and `start_at` is ignored. Example: 'audit.checkpoint.json'.
+            start_at (string): Filter to events created after this time (inclusive), used only when there is no checkpoint yet. Example: '1983-07-10T20:31:48.443Z'.
+            end_at (string): Filter to events created before this time (exclusive). Example: '1983-07-10T20:31:48.443Z'.
+            event_type (string): Filter to events of this type. Example: 'task_deleted'.
+            actor_type (string): Filter to events with an actor of this type. Example: 'external_administrator'.
+            actor_gid (string): Filter to events triggered by the actor with this ID. Example: '12345'.
+            resource_gid (string): Filter to events with this resource ID. Example: '12345'.
+
+        Returns:
+            dict[str, Any]: The number of events written and the saved cursor.
+
+        Tags:
+            Audit log API
+        """
+        if workspace_gid is None:
+            raise ValueError("Missing required parameter 'workspace_gid'")
+        filters = {k: v for k, v in [('event_type', event_type), ('actor_type', actor_type), ('actor_gid', actor_gid), ('resource_gid', resource_gid)] if v is not None}
+        tailer = AuditLogTailer(self, workspace_gid, checkpoint_path, start_at=start_at, end_at=end_at, **filters)
+        with open(output_path, 'a', encoding='utf-8') as output:
+            written = tailer.run(output)
+        return {'events_written': written, 'cursor': tailer.cursor}
+
+    def backfill_audit_log_events(self, workspace_gid, output_path, start_at, end_at, shards=32, max_concurrency=4, event_type=None, actor_type=None, actor_gid=None, resource_gid=None) -> dict[str, Any]:
+        """
+        Exports a time range of a workspace's audit log to an NDJSON file in timestamp order, paging through time shards of the range concurrently.
+
+        Args:
+            workspace_gid (string): workspace_gid
+            output_path (string): Path of the NDJSON file the events are appended to, one event per line. Example: 'audit-backfill.ndjson'.
+            start_at (string): Start of the range to export (inclusive). Example: '2024-01-01T00:00:00.000Z'.
+            end_at (string): End of the range to export (exclusive). Example: '2024-04-01T00:00:00.000Z'.
+            shards (integer): Number of time slices the range is split into. Example: '32'.
+            max_concurrency (integer): Maximum number of slices paged through at the same time. Example: '4'.
+            event_type (string): Filter to events of this type. Example: 'task_deleted'.
+            actor_type (string): Filter to events with an actor of this type. Example: 'external_administrator'.
+            actor_gid (string): Filter to events triggered by the actor with this ID. Example: '12345'.
+            resource_gid (string): Filter to events with this resource ID. Example: '12345'.
+
+        Returns:
+            dict[str, Any]: The number of events written.
+
+        Tags:
+            Audit log API
+        """
+        if workspace_gid is None:
+            raise ValueError("Missing required parameter 'workspace_gid'")
+        filters = {k: v for k, v in [('event_type', event_type), ('actor_type', actor_type), ('actor_gid', actor_gid), ('resource_gid', resource_gid)] if v is not None}
+        written = 0
+        with open(output_path, 'a', encoding='utf-8') as output:
+            for event in backfill_audit_log_events(self, workspace_gid, start_at, end_at, shards=shards, max_concurrency=max_concurrency, **filters):
+                output.write(json.dumps(event, separators=(',', ':')) + '\n')
+                written += 1
+        return {'events_written': written}
+
     def submit_parallel_requests(self, opt_fields=None, opt_pretty=None, data=None) -> dict[str, Any]:
         """
         Processes a batch of API requests in a single call, allowing for efficient execution of multiple operations defined at the "/batch" path using the "POST" method.
@@ -347,6 +562,53 @@ class AsanaApp(APIApplication):
         response.raise_for_status()
         return response.json()
 
+    def hydrate(self, gids, resource_type, opt_fields=None, max_concurrency=4) -> dict[str, Any]:
+        """
+        Fetches the full records for a list of gids of one resource type through the Batch API, ten per `/batch` request with requests running concurrently, and returns them in the order the gids were given. Records already in the response cache are not fetched again.
+
+        Args:
+            gids (array): The gids to fetch, as a list or a comma-separated string. Duplicates are fetched once. Example: '["12345", "23456"]'.
+            resource_type (string): The type of every gid, such as `task`, `project`, `user`, `portfolio`, `section`, `tag` or `team`. Example: 'task'.
+            opt_fields (string): Comma-separated list of optional properties to include in every record. Example: 'name,assignee,due_on,notes'.
+            max_concurrency (integer): Number of `/batch` requests in flight at once. Example: '4'.
+
+        Returns:
+            dict[str, Any]: The records under `data`, aligned with the input gids and None where a gid could not be fetched, and the gid, status code and errors of every failure under `errors`.
+
+        Tags:
+            Batch API
+        """
+        if gids is None:
+            raise ValueError("Missing required parameter 'gids'")
+        if resource_type not in HYDRATABLE_RESOURCES:
+            raise ValueError(f"Unsupported resource_type {resource_type!r}; expected one of {', '.join(sorted(HYDRATABLE_RESOURCES))}")
+        if isinstance(gids, str):
+            gids = [gid.strip() for gid in gids.split(',') if gid.strip()]
+        gids = [str(gid) for gid in gids]
+        options = {'fields': [field for field in opt_fields.split(',') if field]} if opt_fields else {}
+        params = {'opt_fields': opt_fields} if opt_fields else None
+        collection = HYDRATABLE_RESOURCES[resource_type]
+        records = {}
+        missing = []
+        generation = self.cache.generation if self.cache is not None else None
+        for gid in dict.fromkeys(gids):
+            cached = self.cache.get_json(f"{self.base_url}/{collection}/{gid}", params) if self.cache is not None else None
+            if cached is not None:
+                records[gid] = cached.get('data')
+            else:
+                missing.append(gid)
+        actions = ((gid, {'relative_path': f"/{collection}/{gid}", 'method': 'get', 'options': options}) for gid in missing)
+        errors = []
+        for gid, result in execute_batched(self, actions, max_concurrency=max_concurrency):
+            body = result.get('body') or {}
+            if 200 <= (result.get('status_code') or 0) < 300:
+                records[gid] = body.get('data')
+                if self.cache is not None:
+                    self.cache.put_json(f"{self.base_url}/{collection}/{gid}", params, body, generation)
+            else:
+                errors.append({'gid': gid, 'status_code': result.get('status_code'), 'errors': body.get('errors')})
+        return {'data': [records.get(gid) for gid in gids], 'errors': errors}
+
     def create_acustom_field(self, opt_fields=None, opt_pretty=None, data=None) -> dict[str, Any]:
         """
         Creates a new custom field at the "/custom_fields" endpoint using the "POST" method, allowing for optional parameters to specify additional fields or formatting options.
@@ -5113,7 +5375,7 @@ class AsanaApp(APIApplication):
 
     def create_atask(self, opt_fields=None, opt_pretty=None, data=None) -> dict[str, Any]:
         """
-        Creates a new task using the API and returns a status message, allowing optional fields and pretty-printing configurations through query parameters.
+        Creates a new task using the API and returns a status message, allowing optional fields and pretty-printing configurations through query parameters. Custom field values in `data.custom_fields` may be keyed by field name and given as enum option labels; they are translated to gids from a cached catalog before sending.
 
         Args:
             opt_fields (string): This endpoint returns a compact resource, which excludes some properties by default. To include those optional properties, set this query parameter to a comma-separated list of the properties you wish to include. Example: 'actual_time_minutes,approval_status,assignee,assignee.name,assignee_section,assignee_section.name,assignee_status,completed,completed_at,completed_by,completed_by.name,created_at,created_by,custom_fields,custom_fields.asana_created_field,custom_fields.created_by,custom_fields.created_by.name,custom_fields.currency_code,custom_fields.custom_label,custom_fields.custom_label_position,custom_fields.date_value,custom_fields.date_value.date,custom_fields.date_value.date_time,custom_fields.description,custom_fields.display_value,custom_fields.enabled,custom_fields.enum_options,custom_fields.enum_options.color,custom_fields.enum_options.enabled,custom_fields.enum_options.name,custom_fields.enum_value,custom_fields.enum_value.color,custom_fields.enum_value.enabled,custom_fields.enum_value.name,custom_fields.format,custom_fields.has_notifications_enabled,custom_fields.id_prefix,custom_fields.is_formula_field,custom_fields.is_global_to_workspace,custom_fields.is_value_read_only,custom_fields.multi_enum_values,custom_fields.multi_enum_values.color,custom_fields.multi_enum_values.enabled,custom_fields.multi_enum_values.name,custom_fields.name,custom_fields.number_value,custom_fields.people_value,custom_fields.people_value.name,custom_fields.precision,custom_fields.representation_type,custom_fields.resource_subtype,custom_fields.text_value,custom_fields.type,dependencies,dependents,due_at,due_on,external,external.data,followers,followers.name,hearted,hearts,hearts.user,hearts.user.name,html_notes,is_rendered_as_separator,liked,likes,likes.user,likes.user.name,memberships,memberships.project,memberships.project.name,memberships.section,memberships.section.name,modified_at,name,notes,num_hearts,num_likes,num_subtasks,parent,parent.created_by,parent.name,parent.resource_subtype,permalink_url,projects,projects.name,resource_subtype,start_at,start_on,tags,tags.name,workspace,workspace.name'.
@@ -5269,6 +5531,7 @@ class AsanaApp(APIApplication):
         Tags:
             Tasks
         """
+        data = self._translate_custom_fields(data)
         request_body = {
             'data': data,
         }
@@ -5305,7 +5568,7 @@ class AsanaApp(APIApplication):
 
     def update_atask(self, task_gid, opt_fields=None, opt_pretty=None, data=None) -> dict[str, Any]:
         """
-        Updates an existing task specified by its ID using the PUT method, allowing for a complete replacement of the task resource.
+        Updates an existing task specified by its ID using the PUT method, allowing for a complete replacement of the task resource. Custom field values in `data.custom_fields` may be keyed by field name and given as enum option labels; they are translated to gids from a cached catalog before sending.
 
         Args:
             task_gid (string): task_gid
@@ -5464,6 +5727,7 @@ class AsanaApp(APIApplication):
         """
         if task_gid is None:
             raise ValueError("Missing required parameter 'task_gid'")
+        data = self._translate_custom_fields(data, task_gid)
         request_body = {
             'data': data,
         }
@@ -5474,6 +5738,40 @@ class AsanaApp(APIApplication):
         response.raise_for_status()
         return response.json()
 
+    def bulk_update_tasks(self, updates, max_concurrency=4, max_retries=3) -> dict[str, Any]:
+        """
+        Updates many tasks through the Batch API, packing ten `update_atask` calls into each `/batch` request, running the requests concurrently and retrying only the items that were rate limited or hit a server error.
+
+        Args:
+            updates (array): The updates to apply, each either a `[task_gid, data]` pair or an object with `task_gid` and `data` keys, where `data` holds the task fields to change as for `update_atask`. Example: '[{"task_gid": "12345", "data": {"completed": true}}]'.
+            max_concurrency (integer): Number of `/batch` requests in flight at once. Example: '4'.
+            max_retries (integer): Retry rounds for rate-limited or failed items before they are reported as failed. Example: '3'.
+
+        Returns:
+            dict[str, Any]: The number of updated tasks and, for every task that could not be updated, its gid, final status code and errors.
+
+        Tags:
+            Tasks, Batch API
+        """
+        if updates is None:
+            raise ValueError("Missing required parameter 'updates'")
+
+        def actions():
+            for update in updates:
+                task_gid, data = (update['task_gid'], update.get('data')) if isinstance(update, dict) else update
+                if isinstance(data, dict) and data.keys() == {'data'}:
+                    data = data['data']
+                yield task_gid, {'relative_path': f"/tasks/{task_gid}", 'method': 'put', 'data': data or {}}
+
+        report = {'succeeded': 0, 'failed': []}
+        for task_gid, result in execute_batched(self, actions(), max_concurrency=max_concurrency, max_retries=max_retries):
+            status_code = result.get('status_code')
+            if status_code is not None and 200 <= status_code < 300:
+                report['succeeded'] += 1
+            else:
+                report['failed'].append({'task_gid': task_gid, 'status_code': status_code, 'errors': (result.get('body') or {}).get('errors')})
+        return report
+
     def delete_atask(self, task_gid, opt_pretty=None) -> dict[str, Any]:
         """
         Deletes the specified task identified by the task_gid and returns an appropriate HTTP status code.
@@ -5565,6 +5863,120 @@ class AsanaApp(APIApplication):
         response.raise_for_status()
         return response.json()
 
+    def mirror_project(self, project_gid) -> dict[str, Any]:
+        """
+        Copies a project's sections, tasks, subtasks, custom field values and stories into the local SQLite mirror, replacing what the mirror held for it, and starts following its `/events` so `sync_mirrored_projects` can keep it current. Requires the app to be created with `mirror_path`.
+
+        Args:
+            project_gid (string): The project to mirror. Example: '12345'.
+
+        Returns:
+            dict[str, Any]: The number of tasks, sections and stories copied, and the project's freshness.
+
+        Tags:
+            Mirror, Projects
+        """
+        if project_gid is None:
+            raise ValueError("Missing required parameter 'project_gid'")
+        return self._require_mirror().load(project_gid)
+
+    def sync_mirrored_projects(self, project_gids=None) -> dict[str, Any]:
+        """
+        Applies the changes reported by `/events` since the last sync to mirrored projects, refetching only the tasks, sections and stories that changed. A project whose sync token expired is reloaded in full.
+
+        Args:
+            project_gids (array): The projects to sync, as a list or a comma-separated string. Every mirrored project when omitted. Example: '["12345"]'.
+
+        Returns:
+            dict[str, Any]: The number of events applied per project, the projects reloaded, the error of each project that could not be synced, and the freshness of each.
+
+        Tags:
+            Mirror, Events
+        """
+        if isinstance(project_gids, str):
+            project_gids = [gid.strip() for gid in project_gids.split(',') if gid.strip()]
+        return self._require_mirror().sync(project_gids)
+
+    def get_mirror_status(self) -> dict[str, Any]:
+        """
+        Lists the mirrored projects with their freshness: when each was loaded, when its events were last applied, how many seconds ago that was and how many events have been applied since loading.
+
+        Returns:
+            dict[str, Any]: The freshness of every mirrored project under `data`, keyed by project gid.
+
+        Tags:
+            Mirror
+        """
+        return {'data': self._require_mirror().freshness()}
+
+    def query_mirrored_tasks(self, project_gid, section=None, assignee=None, completed=None, due_before=None, due_after=None, text=None, custom_field=None, custom_field_value=None, include_subtasks=False, limit=100, offset=0) -> dict[str, Any]:
+        """
+        Finds tasks of a mirrored project in the local mirror instead of calling `get_tasks_from_aproject`, filtering by section, assignee, completion, due date, text and custom field value. Every answer reports how fresh the mirror is.
+
+        Args:
+            project_gid (string): A project previously passed to `mirror_project`. Example: '12345'.
+            section (string): Section gid or name. Example: 'In Progress'.
+            assignee (string): Assignee gid, name or email. Example: 'alice@example.com'.
+            completed (boolean): Only completed (true) or incomplete (false) tasks. Example: 'false'.
+            due_before (string): Only tasks due before this date. Example: '2024-07-01'.
+            due_after (string): Only tasks due after this date. Example: '2024-06-01'.
+            text (string): Substring of the task name or notes. Example: 'launch'.
+            custom_field (string): Only tasks with this custom field (gid or name) set. Example: 'Priority'.
+            custom_field_value (string): Only tasks whose `custom_field` displays this value. Example: 'High'.
+            include_subtasks (boolean): Also return subtasks, at any depth, under their top-level task's section. Example: 'true'.
+            limit (integer): Maximum number of tasks returned. Example: '100'.
+            offset (integer): Number of matching tasks skipped. Example: '0'.
+
+        Returns:
+            dict[str, Any]: The matching task records under `data`, in section order, and the project's `freshness`.
+
+        Tags:
+            Mirror, Tasks, important
+        """
+        if project_gid is None:
+            raise ValueError("Missing required parameter 'project_gid'")
+        mirror = self._require_mirror()
+        freshness = mirror.freshness([project_gid])[str(project_gid)]
+        if not freshness['mirrored']:
+            raise ValueError(f"Project {project_gid} is not mirrored; call mirror_project first")
+        if isinstance(completed, str):
+            completed = completed.lower() == 'true'
+        tasks = mirror.query_tasks(
+            project_gid,
+            section=section,
+            assignee=assignee,
+            completed=completed,
+            due_before=due_before,
+            due_after=due_after,
+            text=text,
+            custom_field=custom_field,
+            custom_field_value=custom_field_value,
+            include_subtasks=include_subtasks in (True, 'true'),
+            limit=int(limit),
+            offset=int(offset),
+        )
+        return {'data': tasks, 'freshness': freshness}
+
+    def get_mirrored_task(self, task_gid, include_stories=True) -> dict[str, Any]:
+        """
+        Reads a task of a mirrored project from the local mirror, with its custom field values, its subtasks and, optionally, its stories, along with the freshness of the projects it belongs to.
+
+        Args:
+            task_gid (string): The task to read. Example: '12345'.
+            include_stories (boolean): Include the task's stories. Example: 'true'.
+
+        Returns:
+            dict[str, Any]: The task record under `data`, or None when the task is not mirrored, and the `freshness` of its mirrored projects.
+
+        Tags:
+            Mirror, Tasks
+        """
+        if task_gid is None:
+            raise ValueError("Missing required parameter 'task_gid'")
+        mirror = self._require_mirror()
+        task = mirror.get_task(task_gid, include_stories=include_stories in (True, 'true'))
+        return {'data': task, 'freshness': mirror.freshness(mirror.projects_of(task_gid))}
+
     def get_tasks_from_asection(self, section_gid, opt_fields=None, opt_pretty=None, limit=None, offset=None, completed_since=None) -> dict[str, Any]:
         """
         Retrieves a list of tasks within a specified section using the Asana API and returns the data based on optional query parameters such as fields, formatting, limit, offset, and completion status.
@@ -5685,7 +6097,7 @@ class AsanaApp(APIApplication):
 
     def create_asubtask(self, task_gid, opt_fields=None, opt_pretty=None, data=None) -> dict[str, Any]:
         """
-        Creates a new subtask for the specified parent task and returns the created subtask details.
+        Creates a new subtask for the specified parent task and returns the created subtask details. Custom field values in `data.custom_fields` may be keyed by field name and given as enum option labels; they are translated to gids from a cached catalog before sending.
 
         Args:
             task_gid (string): task_gid
@@ -5844,6 +6256,7 @@ class AsanaApp(APIApplication):
         """
         if task_gid is None:
             raise ValueError("Missing required parameter 'task_gid'")
+        data = self._translate_custom_fields(data, task_gid)
         request_body = {
             'data': data,
         }
@@ -5854,6 +6267,31 @@ class AsanaApp(APIApplication):
         response.raise_for_status()
         return response.json()
 
+    def import_tasks_from_file(self, path, state_path, workspace=None, project=None, file_format=None, max_concurrency=4) -> dict[str, Any]:
+        """
+        Creates tasks, subtasks and dependencies from an NDJSON or CSV file in dependency order, creating each independent level concurrently through the Batch API and journaling created gids so a rerun resumes without duplicates.
+
+        Args:
+            path (string): The NDJSON or CSV file to import. Each record needs a local `id` and may name a `parent` and comma-separated or listed `dependencies`, given as local ids or existing task gids; all other fields are sent as task data. Example: 'plan.ndjson'.
+            state_path (string): Journal mapping local ids to created gids. Rerunning an import with the same journal skips everything already created. Example: 'plan.import-state.ndjson'.
+            workspace (string): Workspace for top-level tasks that name neither a workspace nor projects. Example: '12345'.
+            project (string): Project added to top-level tasks that name no projects. Example: '12345'.
+            file_format (string): `ndjson` or `csv`. Inferred from the file extension when omitted. Example: 'csv'.
+            max_concurrency (integer): Number of `/batch` requests in flight at once. Example: '4'.
+
+        Returns:
+            dict[str, Any]: Counts of created and previously created tasks, the records that failed with their status and errors, and the records skipped because their parent or a dependency failed.
+
+        Tags:
+            Tasks, Batch API
+        """
+        if path is None:
+            raise ValueError("Missing required parameter 'path'")
+        if state_path is None:
+            raise ValueError("Missing required parameter 'state_path'")
+        importer = TaskImporter(self, state_path, workspace=workspace, project=project, max_concurrency=max_concurrency)
+        return importer.import_file(path, file_format=file_format)
+
     def set_the_parent_of_atask(self, task_gid, opt_fields=None, opt_pretty=None, data=None) -> dict[str, Any]:
         """
         Changes the parent task of a specified task by submitting a POST request to the "/tasks/{task_gid}/setParent" endpoint.
@@ -6434,6 +6872,54 @@ class AsanaApp(APIApplication):
         response.raise_for_status()
         return response.json()
 
+    def search_all_tasks_in_aworkspace(self, workspace_gid, created_at_after=None, created_at_before=None, filters=None, opt_fields=None, max_workers=4) -> dict[str, Any]:
+        """
+        Exhaustively searches tasks in a workspace by splitting the query into `created_at` windows, bisecting any window that hits the 100-result search cap and deduplicating the results by gid.
+
+        Args:
+            workspace_gid (string): workspace_gid
+            created_at_after (string): Lower bound of the creation-time range to cover, as an ISO 8601 datetime. Defaults to 2008-01-01T00:00:00Z, before any Asana workspace existed. Example: '2019-04-15T01:01:46.055Z'.
+            created_at_before (string): Upper bound of the creation-time range to cover, as an ISO 8601 datetime. Defaults to the current time. Example: '2019-04-15T01:01:46.055Z'.
+            filters (object): Additional `search_tasks_in_aworkspace` arguments applied to every window, keyed by argument name. Example: '{"completed": "false", "due_on_before": "2024-01-01"}'.
+            opt_fields (string): Comma-separated list of optional task properties to include. Example: 'name,assignee,due_on'.
+            max_workers (integer): Number of windows searched concurrently. Example: '4'.
+
+        Returns:
+            dict[str, Any]: Every matching task, under the `data` key, in no particular order.
+
+        Tags:
+            Tasks
+        """
+        if workspace_gid is None:
+            raise ValueError("Missing required parameter 'workspace_gid'")
+        tasks = self.iter_search_tasks_in_aworkspace(workspace_gid, created_at_after=created_at_after, created_at_before=created_at_before, filters=filters, opt_fields=opt_fields, max_workers=max_workers)
+        return {'data': list(tasks)}
+
+    def dump_workspace_tasks(self, workspace_gid, output_path, opt_fields=None, completed_since=None, archived=None, max_workers=8) -> dict[str, Any]:
+        """
+        Writes every task of every project in a workspace to an NDJSON file, listing projects concurrently and writing tasks that live in several projects only once.
+
+        Args:
+            workspace_gid (string): workspace_gid
+            output_path (string): Path of the NDJSON file the tasks are appended to, one task per line. Example: 'tasks.ndjson'.
+            opt_fields (string): Comma-separated list of optional task properties to include. Example: 'name,assignee,due_on,completed'.
+            completed_since (string): Only return tasks that are either incomplete or that have been completed since this time. Accepts a date-time string or the keyword *now*. Example: 'now'.
+            archived (boolean): Only include projects with this archived state. Example: 'false'.
+            max_workers (integer): Number of projects paged through concurrently. Example: '8'.
+
+        Returns:
+            dict[str, Any]: The number of unique tasks written.
+
+        Tags:
+            Tasks
+        """
+        written = 0
+        with open(output_path, 'a', encoding='utf-8') as output:
+            for task in self.iter_workspace_tasks(workspace_gid, opt_fields=opt_fields, completed_since=completed_since, archived=archived, max_workers=max_workers):
+                output.write(json.dumps(task, separators=(',', ':')) + '\n')
+                written += 1
+        return {'tasks_written': written}
+
     def get_multiple_task_templates(self, limit=None, offset=None, project=None, opt_fields=None, opt_pretty=None) -> dict[str, Any]:
         """
         Retrieves a list of available task templates for standardized task creation, supporting optional filters like project, pagination (limit/offset), and field customization (opt_fields).
@@ -7117,7 +7603,7 @@ class AsanaApp(APIApplication):
 
     def get_objects_via_typeahead(self, workspace_gid, opt_fields=None, resource_type=None, type=None, query=None, count=None, opt_pretty=None) -> dict[str, Any]:
         """
-        Queries a workspace for typeahead results using the specified parameters and returns relevant objects or suggestions.
+        Queries a workspace for typeahead results using the specified parameters and returns relevant objects or suggestions. With the response cache enabled, a query that extends a recent query whose results were fewer than its `count` is answered by filtering those results locally.
 
         Args:
             workspace_gid (string): workspace_gid
@@ -7137,11 +7623,47 @@ class AsanaApp(APIApplication):
         """
         if workspace_gid is None:
             raise ValueError("Missing required parameter 'workspace_gid'")
+        kind = resource_type or type
+        if self.typeahead is not None and kind and query is not None:
+            results = self.typeahead.get(workspace_gid, kind, query, count, opt_fields)
+            if results is not None:
+                return {'data': results}
         url = f"{self.base_url}/workspaces/{workspace_gid}/typeahead"
         query_params = {k: v for k, v in [('opt_fields', opt_fields), ('resource_type', resource_type), ('type', type), ('query', query), ('count', count), ('opt_pretty', opt_pretty)] if v is not None}
         response = self._get(url, params=query_params)
         response.raise_for_status()
-        return response.json()
+        payload = response.json()
+        if self.typeahead is not None and kind and query is not None:
+            self.typeahead.put(workspace_gid, kind, query, count, opt_fields, payload.get('data') or [])
+        return payload
+
+    def resolve_names(self, names, resource_type, workspace_gid=None, project_gid=None, limit=5) -> dict[str, Any]:
+        """
+        Resolves user, project, tag, team or section names to gids from a local index instead of the typeahead or listing endpoints, trying an exact name, a case-insensitive name, an email address (users) and a name prefix in turn. The index lists a workspace or project once and then keeps itself current from the writes made through this app, relisting only when a name is not found.
+
+        Args:
+            names (array): The names to resolve, as a list or a comma-separated string. Gids and email addresses are accepted too. Example: '["Alice", "alice@example.com", "Q3 Launch"]'.
+            resource_type (string): What the names refer to: `user`, `project`, `tag`, `team` or `section`. Example: 'project'.
+            workspace_gid (string): The workspace the names belong to. Required for every type except `section`. Example: '12345'.
+            project_gid (string): The project whose sections are resolved. Required for `section`. Example: '12345'.
+            limit (integer): Maximum number of matches returned per name. Example: '5'.
+
+        Returns:
+            dict[str, Any]: One entry per name under `data`, with the `query` and its `matches`, each holding the `gid`, `name`, `resource_type` and how it matched (`gid`, `email`, `exact`, `casefold` or `prefix`).
+
+        Tags:
+            Typeahead, important
+        """
+        if names is None:
+            raise ValueError("Missing required parameter 'names'")
+        if resource_type is None:
+            raise ValueError("Missing required parameter 'resource_type'")
+        container = project_gid if resource_type == 'section' else workspace_gid
+        if container is None:
+            raise ValueError(f"Missing required parameter '{'project_gid' if resource_type == 'section' else 'workspace_gid'}'")
+        if isinstance(names, str):
+            names = [name.strip() for name in names.split(',') if name.strip()]
+        return {'data': [{'query': name, 'matches': self.names.resolve(name, resource_type, container, limit=limit)} for name in names]}
 
     def get_multiple_users(self, opt_fields=None, workspace=None, team=None, opt_pretty=None, limit=None, offset=None) -> dict[str, Any]:
         """
@@ -7519,6 +8041,35 @@ class AsanaApp(APIApplication):
         response.raise_for_status()
         return response.json()
 
+    def reconcile_webhooks(self, workspace, subscriptions, target, recreate_unhealthy=True, dry_run=False, max_concurrency=8) -> dict[str, Any]:
+        """
+        Converges a workspace's webhooks on a declared list of subscriptions, creating, updating and deleting only what differs, concurrently, and reporting or recreating webhooks whose last failure is more recent than their last success.
+
+        Args:
+            workspace (string): The workspace whose webhooks are reconciled. Example: '1331'.
+            subscriptions (array): The webhooks wanted, each with a `resource` gid and optional `filters` as for `establish_awebhook`. Example: '[{"resource": "12345", "filters": [{"resource_type": "task", "action": "changed", "fields": ["due_on"]}]}]'.
+            target (string): Target URL template containing `{resource}`. Only webhooks whose target starts like the template are managed; others in the workspace are left alone. Example: 'https://hooks.example.com/asana/{resource}'.
+            recreate_unhealthy (boolean): Delete and recreate unhealthy webhooks instead of only reporting them. Example: 'true'.
+            dry_run (boolean): Return the plan without applying it. Example: 'false'.
+            max_concurrency (integer): Requests in flight at once. Example: '8'.
+
+        Returns:
+            dict[str, Any]: With `dry_run`, the webhooks to create, update and delete, the unhealthy ones and the unchanged count; otherwise the gids created, updated and deleted, the unhealthy webhooks, the unchanged count and every change that failed.
+
+        Tags:
+            Webhooks
+        """
+        if workspace is None:
+            raise ValueError("Missing required parameter 'workspace'")
+        if subscriptions is None:
+            raise ValueError("Missing required parameter 'subscriptions'")
+        if target is None:
+            raise ValueError("Missing required parameter 'target'")
+        if isinstance(subscriptions, str):
+            subscriptions = json.loads(subscriptions)
+        reconciler = WebhookReconciler(self, workspace, target=target, recreate_unhealthy=recreate_unhealthy, max_concurrency=max_concurrency)
+        return reconciler.reconcile(subscriptions, dry_run=dry_run)
+
     def get_multiple_workspaces(self, opt_fields=None, opt_pretty=None, limit=None, offset=None) -> dict[str, Any]:
         """
         Retrieves a paginated list of workspaces with optional filtering and formatting parameters.
@@ -7764,6 +8315,1184 @@ class AsanaApp(APIApplication):
         response.raise_for_status()
         return response.json()
 
+    def get_response_cache_stats(self) -> dict[str, Any]:
+        """
+        Reports the state of the in-process response cache: whether it is enabled, its entry count and size in bytes against its cap, its hit, miss, eviction and invalidation counters, the typeahead trie's size and hits, and, with event-driven coherence on, the number of watched resources and expired sync tokens.
+
+        Returns:
+            dict[str, Any]: The cache counters, or only `enabled: false` when the cache is off.
+
+        Tags:
+            Cache
+        """
+        if self.cache is None:
+            return {'enabled': False}
+        stats = {'enabled': True, **self.cache.stats()}
+        if self.typeahead is not None:
+            stats['typeahead'] = self.typeahead.stats()
+        if self.coherence is not None:
+            stats['coherence'] = self.coherence.stats()
+        return stats
+
+    def _require_mirror(self) -> ProjectMirror:
+        if self.mirror is None:
+            raise ValueError("The project mirror is not enabled; create the app with mirror_path")
+        return self.mirror
+
+    def _fetch_page(self, list_method, offset, kwargs) -> tuple[list[dict[str, Any]], str | None]:
+        """
+        Requests a single page from an offset-paginated list method.
+
+        Args:
+            list_method (callable): A bound list method accepting an `offset` keyword and returning the raw Asana page envelope.
+            offset (string): The offset token of the page to fetch, or None for the first page.
+            kwargs (dict): Query arguments forwarded to `list_method`.
+
+        Returns:
+            tuple[list[dict[str, Any]], str | None]: The page's records and the offset of the next page, if any.
+        """
+        page = list_method(offset=offset, **kwargs)
+        next_page = page.get('next_page') or {}
+        return page.get('data') or [], next_page.get('offset')
+
+    def _paginate(self, list_method, prefetch=0, **kwargs) -> Iterator[dict[str, Any]]:
+        """
+        Drives an offset-paginated list method to exhaustion, yielding one record at a time.
+
+        Only the page currently being consumed is referenced, so memory stays bounded by the page size regardless of how many records the listing holds. With `prefetch` set, pages are requested on a worker thread that stays up to `prefetch` pages ahead of the consumer.
+
+        Args:
+            list_method (callable): A bound list method accepting an `offset` keyword and returning the raw Asana page envelope.
+            prefetch (integer): Number of pages to read ahead on a background thread. 0 fetches each page only once the previous one is consumed.
+            **kwargs: Query arguments forwarded to `list_method` on every request.
+
+        Returns:
+            Iterator[dict[str, Any]]: The `data` records of every page, in listing order.
+        """
+        if 'limit' in kwargs and kwargs['limit'] is None:
+            kwargs['limit'] = MAX_PAGE_SIZE
+        if prefetch and prefetch > 0:
+            yield from self._paginate_ahead(list_method, prefetch, kwargs)
+            return
+        offset = None
+        while True:
+            records, offset = self._fetch_page(list_method, offset, kwargs)
+            yield from records
+            if not offset:
+                return
+
+    def _paginate_ahead(self, list_method, depth, kwargs) -> Iterator[dict[str, Any]]:
+        """
+        Pages through a listing while a worker thread fetches the following pages.
+
+        The worker blocks once `depth` unconsumed pages are buffered, so at most `depth` + 1 pages are held at any time. Errors raised by the worker are re-raised in the consumer, and closing the iterator early stops the worker.
+
+        Args:
+            list_method (callable): A bound list method accepting an `offset` keyword.
+            depth (integer): Maximum number of fetched pages buffered ahead of the consumer.
+            kwargs (dict): Query arguments forwarded to `list_method`.
+
+        Returns:
+            Iterator[dict[str, Any]]: The `data` records of every page, in listing order.
+        """
+        pages = Handoff(depth)
+
+        def produce() -> None:
+            offset = None
+            try:
+                while True:
+                    records, offset = self._fetch_page(list_method, offset, kwargs)
+                    if not pages.put(records) or not offset:
+                        break
+            except Exception as exc:
+                pages.fail(exc)
+            pages.finish()
+
+        worker = threading.Thread(target=produce, name=f"asana-prefetch-{list_method.__name__}", daemon=True)
+        worker.start()
+        try:
+            for records in pages:
+                yield from records
+        finally:
+            pages.close()
+            worker.join()
+
+    def iter_multiple_allocations(self, parent=None, assignee=None, workspace=None, limit=None, opt_fields=None, opt_pretty=None) -> Iterator[dict[str, Any]]:
+        """
+        Lazily iterates over every record listed by `get_multiple_allocations`, following `next_page.offset` until the listing is exhausted and holding at most one page in memory.
+
+        Args:
+            parent (string): Globally unique identifier for the project to filter allocations by. Example: '77688'.
+            assignee (string): Globally unique identifier for the user the allocation is assigned to. Example: '12345'.
+            workspace (string): Globally unique identifier for the workspace. Example: '98765'.
+            limit (string): Results per page. Defaults to the maximum of 100 to minimise round trips.
+            opt_fields (string): This endpoint returns a compact resource, which excludes some properties by default. To include those optional properties, set this query parameter to a comma-separated list of the properties you wish to include. Example: 'assignee,assignee.name,created_by,created_by.name,effort,effort.type,effort.value,end_date,offset,parent,parent.name,path,resource_subtype,start_date,uri'.
+            opt_pretty (string): Provides “pretty” output.
+
+        Returns:
+            Iterator[dict[str, Any]]: The records of every page, one at a time.
+
+        Tags:
+            Allocations
+        """
+        yield from self._paginate(self.get_multiple_allocations, parent=parent, assignee=assignee, workspace=workspace, limit=limit, opt_fields=opt_fields, opt_pretty=opt_pretty)
+
+    def iter_attachments_from_an_object(self, limit=None, parent=None, opt_fields=None, opt_pretty=None) -> Iterator[dict[str, Any]]:
+        """
+        Lazily iterates over every record listed by `get_attachments_from_an_object`, following `next_page.offset` until the listing is exhausted and holding at most one page in memory.
+
+        Args:
+            limit (string): Results per page. Defaults to the maximum of 100 to minimise round trips.
+            parent (string): (Required) Globally unique identifier for object to fetch statuses from. Must be a GID for a `project`, `project_brief`, or `task`. Example: '159874'.
+            opt_fields (string): This endpoint returns a compact resource, which excludes some properties by default. To include those optional properties, set this query parameter to a comma-separated list of the properties you wish to include. Example: 'connected_to_app,created_at,download_url,host,name,offset,parent,parent.created_by,parent.name,parent.resource_subtype,path,permanent_url,resource_subtype,size,uri,view_url'.
+            opt_pretty (string): Provides “pretty” output.
+
+        Returns:
+            Iterator[dict[str, Any]]: The records of every page, one at a time.
+
+        Tags:
+            Attachments
+        """
+        yield from self._paginate(self.get_attachments_from_an_object, limit=limit, parent=parent, opt_fields=opt_fields, opt_pretty=opt_pretty)
+
+    def iter_audit_log_events(self, workspace_gid, start_at=None, end_at=None, event_type=None, actor_type=None, actor_gid=None, resource_gid=None, limit=None) -> Iterator[dict[str, Any]]:
+        """
+        Lazily iterates over every record listed by `get_audit_log_events`, following `next_page.offset` until the listing is exhausted and holding at most one page in memory.
+
+        Args:
+            workspace_gid (string): workspace_gid
+            start_at (string): Filter to events created after this time (inclusive). Example: '1983-07-10T20:31:48.443Z'.
+            end_at (string): Filter to events created before this time (exclusive). Example: '1983-07-10T20:31:48.443Z'.
+            event_type (string): Filter to events of this type.
+            actor_type (string): Filter to events with an actor of this type.
+            actor_gid (string): Filter to events triggered by the actor with this ID. Example: 'eiusmod irure commodo'.
+            resource_gid (string): Filter to events with this resource ID. Example: 'eiusmod irure commodo'.
+            limit (string): Results per page. Defaults to the maximum of 100 to minimise round trips.
+
+        Returns:
+            Iterator[dict[str, Any]]: The records of every page, one at a time.
+
+        Tags:
+            Audit log API
+        """
+        yield from self._paginate(self.get_audit_log_events, workspace_gid=workspace_gid, start_at=start_at, end_at=end_at, event_type=event_type, actor_type=actor_type, actor_gid=actor_gid, resource_gid=resource_gid, limit=limit)
+
+    def iter_aworkspace_scustom_fields(self, workspace_gid, opt_fields=None, opt_pretty=None, limit=None) -> Iterator[dict[str, Any]]:
+        """
+        Lazily iterates over every record listed by `get_aworkspace_scustom_fields`, following `next_page.offset` until the listing is exhausted and holding at most one page in memory.
+
+        Args:
+            workspace_gid (string): workspace_gid
+            opt_fields (string): This endpoint returns a compact resource, which excludes some properties by default. To include those optional properties, set this query parameter to a comma-separated list of the properties you wish to include. Example: 'asana_created_field,created_by,created_by.name,currency_code,custom_label,custom_label_position,date_value,date_value.date,date_value.date_time,description,display_value,enabled,enum_options,enum_options.color,enum_options.enabled,enum_options.name,enum_value,enum_value.color,enum_value.enabled,enum_value.name,format,has_notifications_enabled,id_prefix,is_formula_field,is_global_to_workspace,is_value_read_only,multi_enum_values,multi_enum_values.color,multi_enum_values.enabled,multi_enum_values.name,name,number_value,offset,path,people_value,people_value.name,precision,representation_type,resource_subtype,text_value,type,uri'.
+            opt_pretty (string): Provides “pretty” output.
+            limit (string): Results per page. Defaults to the maximum of 100 to minimise round trips.
+
+        Returns:
+            Iterator[dict[str, Any]]: The records of every page, one at a time.
+
+        Tags:
+            Custom fields
+        """
+        yield from self._paginate(self.get_aworkspace_scustom_fields, workspace_gid=workspace_gid, opt_fields=opt_fields, opt_pretty=opt_pretty, limit=limit)
+
+    def iter_aproject_scustom_fields(self, project_gid, opt_fields=None, opt_pretty=None, limit=None) -> Iterator[dict[str, Any]]:
+        """
+        Lazily iterates over every record listed by `get_aproject_scustom_fields`, following `next_page.offset` until the listing is exhausted and holding at most one page in memory.
+
+        Args:
+            project_gid (string): project_gid
+            opt_fields (string): This endpoint returns a compact resource, which excludes some properties by default. To include those optional properties, set this query parameter to a comma-separated list of the properties you wish to include. Example: 'custom_field,custom_field.asana_created_field,custom_field.created_by,custom_field.created_by.name,custom_field.currency_code,custom_field.custom_label,custom_field.custom_label_position,custom_field.date_value,custom_field.date_value.date,custom_field.date_value.date_time,custom_field.description,custom_field.display_value,custom_field.enabled,custom_field.enum_options,custom_field.enum_options.color,custom_field.enum_options.enabled,custom_field.enum_options.name,custom_field.enum_value,custom_field.enum_value.color,custom_field.enum_value.enabled,custom_field.enum_value.name,custom_field.format,custom_field.has_notifications_enabled,custom_field.id_prefix,custom_field.is_formula_field,custom_field.is_global_to_workspace,custom_field.is_value_read_only,custom_field.multi_enum_values,custom_field.multi_enum_values.color,custom_field.multi_enum_values.enabled,custom_field.multi_enum_values.name,custom_field.name,custom_field.number_value,custom_field.people_value,custom_field.people_value.name,custom_field.precision,custom_field.representation_type,custom_field.resource_subtype,custom_field.text_value,custom_field.type,is_important,offset,parent,parent.name,path,project,project.name,uri'.
+            opt_pretty (string): Provides “pretty” output.
+            limit (string): Results per page. Defaults to the maximum of 100 to minimise round trips.
+
+        Returns:
+            Iterator[dict[str, Any]]: The records of every page, one at a time.
+
+        Tags:
+            Custom field settings
+        """
+        yield from self._paginate(self.get_aproject_scustom_fields, project_gid=project_gid, opt_fields=opt_fields, opt_pretty=opt_pretty, limit=limit)
+
+    def iter_aportfolio_scustom_fields(self, portfolio_gid, opt_fields=None, opt_pretty=None, limit=None) -> Iterator[dict[str, Any]]:
+        """
+        Lazily iterates over every record listed by `get_aportfolio_scustom_fields`, following `next_page.offset` until the listing is exhausted and holding at most one page in memory.
+
+        Args:
+            portfolio_gid (string): portfolio_gid
+            opt_fields (string): This endpoint returns a compact resource, which excludes some properties by default. To include those optional properties, set this query parameter to a comma-separated list of the properties you wish to include. Example: 'custom_field,custom_field.asana_created_field,custom_field.created_by,custom_field.created_by.name,custom_field.currency_code,custom_field.custom_label,custom_field.custom_label_position,custom_field.date_value,custom_field.date_value.date,custom_field.date_value.date_time,custom_field.description,custom_field.display_value,custom_field.enabled,custom_field.enum_options,custom_field.enum_options.color,custom_field.enum_options.enabled,custom_field.enum_options.name,custom_field.enum_value,custom_field.enum_value.color,custom_field.enum_value.enabled,custom_field.enum_value.name,custom_field.format,custom_field.has_notifications_enabled,custom_field.id_prefix,custom_field.is_formula_field,custom_field.is_global_to_workspace,custom_field.is_value_read_only,custom_field.multi_enum_values,custom_field.multi_enum_values.color,custom_field.multi_enum_values.enabled,custom_field.multi_enum_values.name,custom_field.name,custom_field.number_value,custom_field.people_value,custom_field.people_value.name,custom_field.precision,custom_field.representation_type,custom_field.resource_subtype,custom_field.text_value,custom_field.type,is_important,offset,parent,parent.name,path,project,project.name,uri'.
+            opt_pretty (string): Provides “pretty” output.
+            limit (string): Results per page. Defaults to the maximum of 100 to minimise round trips.
+
+        Returns:
+            Iterator[dict[str, Any]]: The records of every page, one at a time.
+
+        Tags:
+            Custom field settings
+        """
+        yield from self._paginate(self.get_aportfolio_scustom_fields, portfolio_gid=portfolio_gid, opt_fields=opt_fields, opt_pretty=opt_pretty, limit=limit)
+
+    def iter_goals(self, portfolio=None, project=None, task=None, is_workspace_level=None, team=None, workspace=None, time_periods=None, limit=None, opt_fields=None, opt_pretty=None) -> Iterator[dict[str, Any]]:
+        """
+        Lazily iterates over every record listed by `get_goals`, following `next_page.offset` until the listing is exhausted and holding at most one page in memory.
+
+        Args:
+            portfolio (string): Globally unique identifier for supporting portfolio. Example: '159874'.
+            project (string): Globally unique identifier for supporting project. Example: '512241'.
+            task (string): Globally unique identifier for supporting task. Example: '78424'.
+            is_workspace_level (string): Filter to goals with is_workspace_level set to query value. Must be used with the workspace parameter. Example: 'false'.
+            team (string): Globally unique identifier for the team. Example: '31326'.
+            workspace (string): Globally unique identifier for the workspace. Example: '31326'.
+            time_periods (string): Globally unique identifiers for the time periods. Example: '221693,506165'.
+            limit (string): Results per page. Defaults to the maximum of 100 to minimise round trips.
+            opt_fields (string): This endpoint returns a compact resource, which excludes some properties by default. To include those optional properties, set this query parameter to a comma-separated list of the properties you wish to include. Example: 'current_status_update,current_status_update.resource_subtype,current_status_update.title,due_on,followers,followers.name,html_notes,is_workspace_level,liked,likes,likes.user,likes.user.name,metric,metric.can_manage,metric.currency_code,metric.current_display_value,metric.current_number_value,metric.initial_number_value,metric.is_custom_weight,metric.precision,metric.progress_source,metric.resource_subtype,metric.target_number_value,metric.unit,name,notes,num_likes,offset,owner,owner.name,path,start_on,status,team,team.name,time_period,time_period.display_name,time_period.end_on,time_period.period,time_period.start_on,uri,workspace,workspace.name'.
+            opt_pretty (string): Provides “pretty” output.
+
+        Returns:
+            Iterator[dict[str, Any]]: The records of every page, one at a time.
+
+        Tags:
+            Goals
+        """
+        yield from self._paginate(self.get_goals, portfolio=portfolio, project=project, task=task, is_workspace_level=is_workspace_level, team=team, workspace=workspace, time_periods=time_periods, limit=limit, opt_fields=opt_fields, opt_pretty=opt_pretty)
+
+    def iter_goal_relationships(self, opt_pretty=None, limit=None, supported_goal=None, resource_subtype=None, opt_fields=None) -> Iterator[dict[str, Any]]:
+        """
+        Lazily iterates over every record listed by `get_goal_relationships`, following `next_page.offset` until the listing is exhausted and holding at most one page in memory.
+
+        Args:
+            opt_pretty (string): Provides “pretty” output.
+            limit (string): Results per page. Defaults to the maximum of 100 to minimise round trips.
+            supported_goal (string): (Required) Globally unique identifier for the supported goal in the goal relationship. Example: '12345'.
+            resource_subtype (string): If provided, filter to goal relationships with a given resource_subtype. Example: 'subgoal'.
+            opt_fields (string): This endpoint returns a compact resource, which excludes some properties by default. To include those optional properties, set this query parameter to a comma-separated list of the properties you wish to include. Example: 'contribution_weight,offset,path,resource_subtype,supported_goal,supported_goal.name,supported_goal.owner,supported_goal.owner.name,supporting_resource,supporting_resource.name,uri'.
+
+        Returns:
+            Iterator[dict[str, Any]]: The records of every page, one at a time.
+
+        Tags:
+            Goal relationships
+        """
+        yield from self._paginate(self.get_goal_relationships, opt_pretty=opt_pretty, limit=limit, supported_goal=supported_goal, resource_subtype=resource_subtype, opt_fields=opt_fields)
+
+    def iter_multiple_memberships(self, parent=None, member=None, limit=None, opt_fields=None, opt_pretty=None) -> Iterator[dict[str, Any]]:
+        """
+        Lazily iterates over every record listed by `get_multiple_memberships`, following `next_page.offset` until the listing is exhausted and holding at most one page in memory.
+
+        Args:
+            parent (string): Globally unique identifier for `goal`, `project`, or `portfolio`. Example: '159874'.
+            member (string): Globally unique identifier for `team` or `user`. Example: '1061493'.
+            limit (string): Results per page. Defaults to the maximum of 100 to minimise round trips.
+            opt_fields (string): This endpoint returns a compact resource, which excludes some properties by default. To include those optional properties, set this query parameter to a comma-separated list of the properties you wish to include. Example: 'offset,path,uri'.
+            opt_pretty (string): Provides “pretty” output.
+
+        Returns:
+            Iterator[dict[str, Any]]: The records of every page, one at a time.
+
+        Tags:
+            Memberships
+        """
+        yield from self._paginate(self.get_multiple_memberships, parent=parent, member=member, limit=limit, opt_fields=opt_fields, opt_pretty=opt_pretty)
+
+    def iter_multiple_portfolios(self, limit=None, workspace=None, owner=None, opt_fields=None, opt_pretty=None) -> Iterator[dict[str, Any]]:
+        """
+        Lazily iterates over every record listed by `get_multiple_portfolios`, following `next_page.offset` until the listing is exhausted and holding at most one page in memory.
+
+        Args:
+            limit (string): Results per page. Defaults to the maximum of 100 to minimise round trips.
+            workspace (string): (Required) The workspace or organization to filter portfolios on. Example: '1331'.
+            owner (string): The user who owns the portfolio. Currently, API users can only get a list of portfolios that they themselves own, unless the request is made from a Service Account. In the case of a Service Account, if this parameter is specified, then all portfolios owned by this parameter are returned. Otherwise, all portfolios across the workspace are returned. Example: '14916'.
+            opt_fields (string): This endpoint returns a compact resource, which excludes some properties by default. To include those optional properties, set this query parameter to a comma-separated list of the properties you wish to include. Example: 'color,created_at,created_by,created_by.name,current_status_update,current_status_update.resource_subtype,current_status_update.title,custom_field_settings,custom_field_settings.custom_field,custom_field_settings.custom_field.asana_created_field,custom_field_settings.custom_field.created_by,custom_field_settings.custom_field.created_by.name,custom_field_settings.custom_field.currency_code,custom_field_settings.custom_field.custom_label,custom_field_settings.custom_field.custom_label_position,custom_field_settings.custom_field.date_value,custom_field_settings.custom_field.date_value.date,custom_field_settings.custom_field.date_value.date_time,custom_field_settings.custom_field.description,custom_field_settings.custom_field.display_value,custom_field_settings.custom_field.enabled,custom_field_settings.custom_field.enum_options,custom_field_settings.custom_field.enum_options.color,custom_field_settings.custom_field.enum_options.enabled,custom_field_settings.custom_field.enum_options.name,custom_field_settings.custom_field.enum_value,custom_field_settings.custom_field.enum_value.color,custom_field_settings.custom_field.enum_value.enabled,custom_field_settings.custom_field.enum_value.name,custom_field_settings.custom_field.format,custom_field_settings.custom_field.has_notifications_enabled,custom_field_settings.custom_field.id_prefix,custom_field_settings.custom_field.is_formula_field,custom_field_settings.custom_field.is_global_to_workspace,custom_field_settings.custom_field.is_value_read_only,custom_field_settings.custom_field.multi_enum_values,custom_field_settings.custom_field.multi_enum_values.color,custom_field_settings.custom_field.multi_enum_values.enabled,custom_field_settings.custom_field.multi_enum_values.name,custom_field_settings.custom_field.name,custom_field_settings.custom_field.number_value,custom_field_settings.custom_field.people_value,custom_field_settings.custom_field.people_value.name,custom_field_settings.custom_field.precision,custom_field_settings.custom_field.representation_type,custom_field_settings.custom_field.resource_subtype,custom_field_settings.custom_field.text_value,custom_field_settings.custom_field.type,custom_field_settings.is_important,custom_field_settings.parent,custom_field_settings.parent.name,custom_field_settings.project,custom_field_settings.project.name,custom_fields,custom_fields.date_value,custom_fields.date_value.date,custom_fields.date_value.date_time,custom_fields.display_value,custom_fields.enabled,custom_fields.enum_options,custom_fields.enum_options.color,custom_fields.enum_options.enabled,custom_fields.enum_options.name,custom_fields.enum_value,custom_fields.enum_value.color,custom_fields.enum_value.enabled,custom_fields.enum_value.name,custom_fields.id_prefix,custom_fields.is_formula_field,custom_fields.multi_enum_values,custom_fields.multi_enum_values.color,custom_fields.multi_enum_values.enabled,custom_fields.multi_enum_values.name,custom_fields.name,custom_fields.number_value,custom_fields.representation_type,custom_fields.resource_subtype,custom_fields.text_value,custom_fields.type,default_access_level,due_on,members,members.name,name,offset,owner,owner.name,path,permalink_url,privacy_setting,project_templates,project_templates.name,public,start_on,uri,workspace,workspace.name'.
+            opt_pretty (string): Provides “pretty” output.
+
+        Returns:
+            Iterator[dict[str, Any]]: The records of every page, one at a time.
+
+        Tags:
+            Portfolios
+        """
+        yield from self._paginate(self.get_multiple_portfolios, limit=limit, workspace=workspace, owner=owner, opt_fields=opt_fields, opt_pretty=opt_pretty)
+
+    def iter_portfolio_items(self, portfolio_gid, opt_fields=None, opt_pretty=None, limit=None) -> Iterator[dict[str, Any]]:
+        """
+        Lazily iterates over every record listed by `get_portfolio_items`, following `next_page.offset` until the listing is exhausted and holding at most one page in memory.
+
+        Args:
+            portfolio_gid (string): portfolio_gid
+            opt_fields (string): This endpoint returns a compact resource, which excludes some properties by default. To include those optional properties, set this query parameter to a comma-separated list of the properties you wish to include. Example: 'archived,color,completed,completed_at,completed_by,completed_by.name,created_at,created_from_template,created_from_template.name,current_status,current_status.author,current_status.author.name,current_status.color,current_status.created_at,current_status.created_by,current_status.created_by.name,current_status.html_text,current_status.modified_at,current_status.text,current_status.title,current_status_update,current_status_update.resource_subtype,current_status_update.title,custom_field_settings,custom_field_settings.custom_field,custom_field_settings.custom_field.asana_created_field,custom_field_settings.custom_field.created_by,custom_field_settings.custom_field.created_by.name,custom_field_settings.custom_field.currency_code,custom_field_settings.custom_field.custom_label,custom_field_settings.custom_field.custom_label_position,custom_field_settings.custom_field.date_value,custom_field_settings.custom_field.date_value.date,custom_field_settings.custom_field.date_value.date_time,custom_field_settings.custom_field.description,custom_field_settings.custom_field.display_value,custom_field_settings.custom_field.enabled,custom_field_settings.custom_field.enum_options,custom_field_settings.custom_field.enum_options.color,custom_field_settings.custom_field.enum_options.enabled,custom_field_settings.custom_field.enum_options.name,custom_field_settings.custom_field.enum_value,custom_field_settings.custom_field.enum_value.color,custom_field_settings.custom_field.enum_value.enabled,custom_field_settings.custom_field.enum_value.name,custom_field_settings.custom_field.format,custom_field_settings.custom_field.has_notifications_enabled,custom_field_settings.custom_field.id_prefix,custom_field_settings.custom_field.is_formula_field,custom_field_settings.custom_field.is_global_to_workspace,custom_field_settings.custom_field.is_value_read_only,custom_field_settings.custom_field.multi_enum_values,custom_field_settings.custom_field.multi_enum_values.color,custom_field_settings.custom_field.multi_enum_values.enabled,custom_field_settings.custom_field.multi_enum_values.name,custom_field_settings.custom_field.name,custom_field_settings.custom_field.number_value,custom_field_settings.custom_field.people_value,custom_field_settings.custom_field.people_value.name,custom_field_settings.custom_field.precision,custom_field_settings.custom_field.representation_type,custom_field_settings.custom_field.resource_subtype,custom_field_settings.custom_field.text_value,custom_field_settings.custom_field.type,custom_field_settings.is_important,custom_field_settings.parent,custom_field_settings.parent.name,custom_field_settings.project,custom_field_settings.project.name,custom_fields,custom_fields.date_value,custom_fields.date_value.date,custom_fields.date_value.date_time,custom_fields.display_value,custom_fields.enabled,custom_fields.enum_options,custom_fields.enum_options.color,custom_fields.enum_options.enabled,custom_fields.enum_options.name,custom_fields.enum_value,custom_fields.enum_value.color,custom_fields.enum_value.enabled,custom_fields.enum_value.name,custom_fields.id_prefix,custom_fields.is_formula_field,custom_fields.multi_enum_values,custom_fields.multi_enum_values.color,custom_fields.multi_enum_values.enabled,custom_fields.multi_enum_values.name,custom_fields.name,custom_fields.number_value,custom_fields.representation_type,custom_fields.resource_subtype,custom_fields.text_value,custom_fields.type,default_access_level,default_view,due_date,due_on,followers,followers.name,html_notes,icon,members,members.name,minimum_access_level_for_customization,minimum_access_level_for_sharing,modified_at,name,notes,offset,owner,path,permalink_url,privacy_setting,project_brief,public,start_on,team,team.name,uri,workspace,workspace.name'.
+            opt_pretty (string): Provides “pretty” output.
+            limit (string): Results per page. Defaults to the maximum of 100 to minimise round trips.
+
+        Returns:
+            Iterator[dict[str, Any]]: The records of every page, one at a time.
+
+        Tags:
+            Portfolios
+        """
+        yield from self._paginate(self.get_portfolio_items, portfolio_gid=portfolio_gid, opt_fields=opt_fields, opt_pretty=opt_pretty, limit=limit)
+
+    def iter_multiple_portfolio_memberships(self, opt_fields=None, portfolio=None, workspace=None, user=None, opt_pretty=None, limit=None) -> Iterator[dict[str, Any]]:
+        """
+        Lazily iterates over every record listed by `get_multiple_portfolio_memberships`, following `next_page.offset` until the listing is exhausted and holding at most one page in memory.
+
+        Args:
+            opt_fields (string): This endpoint returns a compact resource, which excludes some properties by default. To include those optional properties, set this query parameter to a comma-separated list of the properties you wish to include. Example: 'access_level,offset,path,portfolio,portfolio.name,uri,user,user.name'.
+            portfolio (string): The portfolio to filter results on. Example: '12345'.
+            workspace (string): The workspace to filter results on. Example: '12345'.
+            user (string): A string identifying a user. This can either be the string "me", an email, or the gid of a user. Example: 'me'.
+            opt_pretty (string): Provides “pretty” output.
+            limit (string): Results per page. Defaults to the maximum of 100 to minimise round trips.
+
+        Returns:
+            Iterator[dict[str, Any]]: The records of every page, one at a time.
+
+        Tags:
+            Portfolio memberships
+        """
+        yield from self._paginate(self.get_multiple_portfolio_memberships, opt_fields=opt_fields, portfolio=portfolio, workspace=workspace, user=user, opt_pretty=opt_pretty, limit=limit)
+
+    def iter_memberships_from_aportfolio(self, portfolio_gid, opt_fields=None, user=None, opt_pretty=None, limit=None) -> Iterator[dict[str, Any]]:
+        """
+        Lazily iterates over every record listed by `get_memberships_from_aportfolio`, following `next_page.offset` until the listing is exhausted and holding at most one page in memory.
+
+        Args:
+            portfolio_gid (string): portfolio_gid
+            opt_fields (string): This endpoint returns a compact resource, which excludes some properties by default. To include those optional properties, set this query parameter to a comma-separated list of the properties you wish to include. Example: 'access_level,offset,path,portfolio,portfolio.name,uri,user,user.name'.
+            user (string): A string identifying a user. This can either be the string "me", an email, or the gid of a user. Example: 'me'.
+            opt_pretty (string): Provides “pretty” output.
+            limit (string): Results per page. Defaults to the maximum of 100 to minimise round trips.
+
+        Returns:
+            Iterator[dict[str, Any]]: The records of every page, one at a time.
+
+        Tags:
+            Portfolio memberships
+        """
+        yield from self._paginate(self.get_memberships_from_aportfolio, portfolio_gid=portfolio_gid, opt_fields=opt_fields, user=user, opt_pretty=opt_pretty, limit=limit)
+
+    def iter_multiple_projects(self, limit=None, workspace=None, team=None, archived=None, opt_fields=None, opt_pretty=None) -> Iterator[dict[str, Any]]:
+        """
+        Lazily iterates over every record listed by `get_multiple_projects`, following `next_page.offset` until the listing is exhausted and holding at most one page in memory.
+
+        Args:
+            limit (string): Results per page. Defaults to the maximum of 100 to minimise round trips.
+            workspace (string): The workspace or organization to filter projects on. Example: '1331'.
+            team (string): The team to filter projects on. Example: '14916'.
+            archived (string): Only return projects whose `archived` field takes on the value of this parameter. Example: 'false'.
+            opt_fields (string): This endpoint returns a compact resource, which excludes some properties by default. To include those optional properties, set this query parameter to a comma-separated list of the properties you wish to include. Example: 'archived,color,completed,completed_at,completed_by,completed_by.name,created_at,created_from_template,created_from_template.name,current_status,current_status.author,current_status.author.name,current_status.color,current_status.created_at,current_status.created_by,current_status.created_by.name,current_status.html_text,current_status.modified_at,current_status.text,current_status.title,current_status_update,current_status_update.resource_subtype,current_status_update.title,custom_field_settings,custom_field_settings.custom_field,custom_field_settings.custom_field.asana_created_field,custom_field_settings.custom_field.created_by,custom_field_settings.custom_field.created_by.name,custom_field_settings.custom_field.currency_code,custom_field_settings.custom_field.custom_label,custom_field_settings.custom_field.custom_label_position,custom_field_settings.custom_field.date_value,custom_field_settings.custom_field.date_value.date,custom_field_settings.custom_field.date_value.date_time,custom_field_settings.custom_field.description,custom_field_settings.custom_field.display_value,custom_field_settings.custom_field.enabled,custom_field_settings.custom_field.enum_options,custom_field_settings.custom_field.enum_options.color,custom_field_settings.custom_field.enum_options.enabled,custom_field_settings.custom_field.enum_options.name,custom_field_settings.custom_field.enum_value,custom_field_settings.custom_field.enum_value.color,custom_field_settings.custom_field.enum_value.enabled,custom_field_settings.custom_field.enum_value.name,custom_field_settings.custom_field.format,custom_field_settings.custom_field.has_notifications_enabled,custom_field_settings.custom_field.id_prefix,custom_field_settings.custom_field.is_formula_field,custom_field_settings.custom_field.is_global_to_workspace,custom_field_settings.custom_field.is_value_read_only,custom_field_settings.custom_field.multi_enum_values,custom_field_settings.custom_field.multi_enum_values.color,custom_field_settings.custom_field.multi_enum_values.enabled,custom_field_settings.custom_field.multi_enum_values.name,custom_field_settings.custom_field.name,custom_field_settings.custom_field.number_value,custom_field_settings.custom_field.people_value,custom_field_settings.custom_field.people_value.name,custom_field_settings.custom_field.precision,custom_field_settings.custom_field.representation_type,custom_field_settings.custom_field.resource_subtype,custom_field_settings.custom_field.text_value,custom_field_settings.custom_field.type,custom_field_settings.is_important,custom_field_settings.parent,custom_field_settings.parent.name,custom_field_settings.project,custom_field_settings.project.name,custom_fields,custom_fields.date_value,custom_fields.date_value.date,custom_fields.date_value.date_time,custom_fields.display_value,custom_fields.enabled,custom_fields.enum_options,custom_fields.enum_options.color,custom_fields.enum_options.enabled,custom_fields.enum_options.name,custom_fields.enum_value,custom_fields.enum_value.color,custom_fields.enum_value.enabled,custom_fields.enum_value.name,custom_fields.id_prefix,custom_fields.is_formula_field,custom_fields.multi_enum_values,custom_fields.multi_enum_values.color,custom_fields.multi_enum_values.enabled,custom_fields.multi_enum_values.name,custom_fields.name,custom_fields.number_value,custom_fields.representation_type,custom_fields.resource_subtype,custom_fields.text_value,custom_fields.type,default_access_level,default_view,due_date,due_on,followers,followers.name,html_notes,icon,members,members.name,minimum_access_level_for_customization,minimum_access_level_for_sharing,modified_at,name,notes,offset,owner,path,permalink_url,privacy_setting,project_brief,public,start_on,team,team.name,uri,workspace,workspace.name'.
+            opt_pretty (string): Provides “pretty” output.
+
+        Returns:
+            Iterator[dict[str, Any]]: The records of every page, one at a time.
+
+        Tags:
+            Projects
+        """
+        yield from self._paginate(self.get_multiple_projects, limit=limit, workspace=workspace, team=team, archived=archived, opt_fields=opt_fields, opt_pretty=opt_pretty)
+
+    def iter_projects_atask_is_in(self, task_gid, opt_fields=None, opt_pretty=None, limit=None) -> Iterator[dict[str, Any]]:
+        """
+        Lazily iterates over every record listed by `get_projects_atask_is_in`, following `next_page.offset` until the listing is exhausted and holding at most one page in memory.
+
+        Args:
+            task_gid (string): task_gid
+            opt_fields (string): This endpoint returns a compact resource, which excludes some properties by default. To include those optional properties, set this query parameter to a comma-separated list of the properties you wish to include. Example: 'archived,color,completed,completed_at,completed_by,completed_by.name,created_at,created_from_template,created_from_template.name,current_status,current_status.author,current_status.author.name,current_status.color,current_status.created_at,current_status.created_by,current_status.created_by.name,current_status.html_text,current_status.modified_at,current_status.text,current_status.title,current_status_update,current_status_update.resource_subtype,current_status_update.title,custom_field_settings,custom_field_settings.custom_field,custom_field_settings.custom_field.asana_created_field,custom_field_settings.custom_field.created_by,custom_field_settings.custom_field.created_by.name,custom_field_settings.custom_field.currency_code,custom_field_settings.custom_field.custom_label,custom_field_settings.custom_field.custom_label_position,custom_field_settings.custom_field.date_value,custom_field_settings.custom_field.date_value.date,custom_field_settings.custom_field.date_value.date_time,custom_field_settings.custom_field.description,custom_field_settings.custom_field.display_value,custom_field_settings.custom_field.enabled,custom_field_settings.custom_field.enum_options,custom_field_settings.custom_field.enum_options.color,custom_field_settings.custom_field.enum_options.enabled,custom_field_settings.custom_field.enum_options.name,custom_field_settings.custom_field.enum_value,custom_field_settings.custom_field.enum_value.color,custom_field_settings.custom_field.enum_value.enabled,custom_field_settings.custom_field.enum_value.name,custom_field_settings.custom_field.format,custom_field_settings.custom_field.has_notifications_enabled,custom_field_settings.custom_field.id_prefix,custom_field_settings.custom_field.is_formula_field,custom_field_settings.custom_field.is_global_to_workspace,custom_field_settings.custom_field.is_value_read_only,custom_field_settings.custom_field.multi_enum_values,custom_field_settings.custom_field.multi_enum_values.color,custom_field_settings.custom_field.multi_enum_values.enabled,custom_field_settings.custom_field.multi_enum_values.name,custom_field_settings.custom_field.name,custom_field_settings.custom_field.number_value,custom_field_settings.custom_field.people_value,custom_field_settings.custom_field.people_value.name,custom_field_settings.custom_field.precision,custom_field_settings.custom_field.representation_type,custom_field_settings.custom_field.resource_subtype,custom_field_settings.custom_field.text_value,custom_field_settings.custom_field.type,custom_field_settings.is_important,custom_field_settings.parent,custom_field_settings.parent.name,custom_field_settings.project,custom_field_settings.project.name,custom_fields,custom_fields.date_value,custom_fields.date_value.date,custom_fields.date_value.date_time,custom_fields.display_value,custom_fields.enabled,custom_fields.enum_options,custom_fields.enum_options.color,custom_fields.enum_options.enabled,custom_fields.enum_options.name,custom_fields.enum_value,custom_fields.enum_value.color,custom_fields.enum_value.enabled,custom_fields.enum_value.name,custom_fields.id_prefix,custom_fields.is_formula_field,custom_fields.multi_enum_values,custom_fields.multi_enum_values.color,custom_fields.multi_enum_values.enabled,custom_fields.multi_enum_values.name,custom_fields.name,custom_fields.number_value,custom_fields.representation_type,custom_fields.resource_subtype,custom_fields.text_value,custom_fields.type,default_access_level,default_view,due_date,due_on,followers,followers.name,html_notes,icon,members,members.name,minimum_access_level_for_customization,minimum_access_level_for_sharing,modified_at,name,notes,offset,owner,path,permalink_url,privacy_setting,project_brief,public,start_on,team,team.name,uri,workspace,workspace.name'.
+            opt_pretty (string): Provides “pretty” output.
+            limit (string): Results per page. Defaults to the maximum of 100 to minimise round trips.
+
+        Returns:
+            Iterator[dict[str, Any]]: The records of every page, one at a time.
+
+        Tags:
+            Projects
+        """
+        yield from self._paginate(self.get_projects_atask_is_in, task_gid=task_gid, opt_fields=opt_fields, opt_pretty=opt_pretty, limit=limit)
+
+    def iter_ateam_sprojects(self, team_gid, limit=None, archived=None, opt_fields=None, opt_pretty=None) -> Iterator[dict[str, Any]]:
+        """
+        Lazily iterates over every record listed by `get_ateam_sprojects`, following `next_page.offset` until the listing is exhausted and holding at most one page in memory.
+
+        Args:
+            team_gid (string): team_gid
+            limit (string): Results per page. Defaults to the maximum of 100 to minimise round trips.
+            archived (string): Only return projects whose `archived` field takes on the value of this parameter. Example: 'false'.
+            opt_fields (string): This endpoint returns a compact resource, which excludes some properties by default. To include those optional properties, set this query parameter to a comma-separated list of the properties you wish to include. Example: 'archived,color,completed,completed_at,completed_by,completed_by.name,created_at,created_from_template,created_from_template.name,current_status,current_status.author,current_status.author.name,current_status.color,current_status.created_at,current_status.created_by,current_status.created_by.name,current_status.html_text,current_status.modified_at,current_status.text,current_status.title,current_status_update,current_status_update.resource_subtype,current_status_update.title,custom_field_settings,custom_field_settings.custom_field,custom_field_settings.custom_field.asana_created_field,custom_field_settings.custom_field.created_by,custom_field_settings.custom_field.created_by.name,custom_field_settings.custom_field.currency_code,custom_field_settings.custom_field.custom_label,custom_field_settings.custom_field.custom_label_position,custom_field_settings.custom_field.date_value,custom_field_settings.custom_field.date_value.date,custom_field_settings.custom_field.date_value.date_time,custom_field_settings.custom_field.description,custom_field_settings.custom_field.display_value,custom_field_settings.custom_field.enabled,custom_field_settings.custom_field.enum_options,custom_field_settings.custom_field.enum_options.color,custom_field_settings.custom_field.enum_options.enabled,custom_field_settings.custom_field.enum_options.name,custom_field_settings.custom_field.enum_value,custom_field_settings.custom_field.enum_value.color,custom_field_settings.custom_field.enum_value.enabled,custom_field_settings.custom_field.enum_value.name,custom_field_settings.custom_field.format,custom_field_settings.custom_field.has_notifications_enabled,custom_field_settings.custom_field.id_prefix,custom_field_settings.custom_field.is_formula_field,custom_field_settings.custom_field.is_global_to_workspace,custom_field_settings.custom_field.is_value_read_only,custom_field_settings.custom_field.multi_enum_values,custom_field_settings.custom_field.multi_enum_values.color,custom_field_settings.custom_field.multi_enum_values.enabled,custom_field_settings.custom_field.multi_enum_values.name,custom_field_settings.custom_field.name,custom_field_settings.custom_field.number_value,custom_field_settings.custom_field.people_value,custom_field_settings.custom_field.people_value.name,custom_field_settings.custom_field.precision,custom_field_settings.custom_field.representation_type,custom_field_settings.custom_field.resource_subtype,custom_field_settings.custom_field.text_value,custom_field_settings.custom_field.type,custom_field_settings.is_important,custom_field_settings.parent,custom_field_settings.parent.name,custom_field_settings.project,custom_field_settings.project.name,custom_fields,custom_fields.date_value,custom_fields.date_value.date,custom_fields.date_value.date_time,custom_fields.display_value,custom_fields.enabled,custom_fields.enum_options,custom_fields.enum_options.color,custom_fields.enum_options.enabled,custom_fields.enum_options.name,custom_fields.enum_value,custom_fields.enum_value.color,custom_fields.enum_value.enabled,custom_fields.enum_value.name,custom_fields.id_prefix,custom_fields.is_formula_field,custom_fields.multi_enum_values,custom_fields.multi_enum_values.color,custom_fields.multi_enum_values.enabled,custom_fields.multi_enum_values.name,custom_fields.name,custom_fields.number_value,custom_fields.representation_type,custom_fields.resource_subtype,custom_fields.text_value,custom_fields.type,default_access_level,default_view,due_date,due_on,followers,followers.name,html_notes,icon,members,members.name,minimum_access_level_for_customization,minimum_access_level_for_sharing,modified_at,name,notes,offset,owner,path,permalink_url,privacy_setting,project_brief,public,start_on,team,team.name,uri,workspace,workspace.name'.
+            opt_pretty (string): Provides “pretty” output.
+
+        Returns:
+            Iterator[dict[str, Any]]: The records of every page, one at a time.
+
+        Tags:
+            Projects
+        """
+        yield from self._paginate(self.get_ateam_sprojects, team_gid=team_gid, limit=limit, archived=archived, opt_fields=opt_fields, opt_pretty=opt_pretty)
+
+    def iter_all_projects_in_aworkspace(self, workspace_gid, limit=None, archived=None, opt_fields=None, opt_pretty=None) -> Iterator[dict[str, Any]]:
+        """
+        Lazily iterates over every record listed by `get_all_projects_in_aworkspace`, following `next_page.offset` until the listing is exhausted and holding at most one page in memory.
+
+        Args:
+            workspace_gid (string): workspace_gid
+            limit (string): Results per page. Defaults to the maximum of 100 to minimise round trips.
+            archived (string): Only return projects whose `archived` field takes on the value of this parameter. Example: 'false'.
+            opt_fields (string): This endpoint returns a compact resource, which excludes some properties by default. To include those optional properties, set this query parameter to a comma-separated list of the properties you wish to include. Example: 'archived,color,completed,completed_at,completed_by,completed_by.name,created_at,created_from_template,created_from_template.name,current_status,current_status.author,current_status.author.name,current_status.color,current_status.created_at,current_status.created_by,current_status.created_by.name,current_status.html_text,current_status.modified_at,current_status.text,current_status.title,current_status_update,current_status_update.resource_subtype,current_status_update.title,custom_field_settings,custom_field_settings.custom_field,custom_field_settings.custom_field.asana_created_field,custom_field_settings.custom_field.created_by,custom_field_settings.custom_field.created_by.name,custom_field_settings.custom_field.currency_code,custom_field_settings.custom_field.custom_label,custom_field_settings.custom_field.custom_label_position,custom_field_settings.custom_field.date_value,custom_field_settings.custom_field.date_value.date,custom_field_settings.custom_field.date_value.date_time,custom_field_settings.custom_field.description,custom_field_settings.custom_field.display_value,custom_field_settings.custom_field.enabled,custom_field_settings.custom_field.enum_options,custom_field_settings.custom_field.enum_options.color,custom_field_settings.custom_field.enum_options.enabled,custom_field_settings.custom_field.enum_options.name,custom_field_settings.custom_field.enum_value,custom_field_settings.custom_field.enum_value.color,custom_field_settings.custom_field.enum_value.enabled,custom_field_settings.custom_field.enum_value.name,custom_field_settings.custom_field.format,custom_field_settings.custom_field.has_notifications_enabled,custom_field_settings.custom_field.id_prefix,custom_field_settings.custom_field.is_formula_field,custom_field_settings.custom_field.is_global_to_workspace,custom_field_settings.custom_field.is_value_read_only,custom_field_settings.custom_field.multi_enum_values,custom_field_settings.custom_field.multi_enum_values.color,custom_field_settings.custom_field.multi_enum_values.enabled,custom_field_settings.custom_field.multi_enum_values.name,custom_field_settings.custom_field.name,custom_field_settings.custom_field.number_value,custom_field_settings.custom_field.people_value,custom_field_settings.custom_field.people_value.name,custom_field_settings.custom_field.precision,custom_field_settings.custom_field.representation_type,custom_field_settings.custom_field.resource_subtype,custom_field_settings.custom_field.text_value,custom_field_settings.custom_field.type,custom_field_settings.is_important,custom_field_settings.parent,custom_field_settings.parent.name,custom_field_settings.project,custom_field_settings.project.name,custom_fields,custom_fields.date_value,custom_fields.date_value.date,custom_fields.date_value.date_time,custom_fields.display_value,custom_fields.enabled,custom_fields.enum_options,custom_fields.enum_options.color,custom_fields.enum_options.enabled,custom_fields.enum_options.name,custom_fields.enum_value,custom_fields.enum_value.color,custom_fields.enum_value.enabled,custom_fields.enum_value.name,custom_fields.id_prefix,custom_fields.is_formula_field,custom_fields.multi_enum_values,custom_fields.multi_enum_values.color,custom_fields.multi_enum_values.enabled,custom_fields.multi_enum_values.name,custom_fields.name,custom_fields.number_value,custom_fields.representation_type,custom_fields.resource_subtype,custom_fields.text_value,custom_fields.type,default_access_level,default_view,due_date,due_on,followers,followers.name,html_notes,icon,members,members.name,minimum_access_level_for_customization,minimum_access_level_for_sharing,modified_at,name,notes,offset,owner,path,permalink_url,privacy_setting,project_brief,public,start_on,team,team.name,uri,workspace,workspace.name'.
+            opt_pretty (string): Provides “pretty” output.
+
+        Returns:
+            Iterator[dict[str, Any]]: The records of every page, one at a time.
+
+        Tags:
+            Projects
+        """
+        yield from self._paginate(self.get_all_projects_in_aworkspace, workspace_gid=workspace_gid, limit=limit, archived=archived, opt_fields=opt_fields, opt_pretty=opt_pretty)
+
+    def iter_memberships_from_aproject(self, project_gid, opt_fields=None, user=None, opt_pretty=None, limit=None) -> Iterator[dict[str, Any]]:
+        """
+        Lazily iterates over every record listed by `get_memberships_from_aproject`, following `next_page.offset` until the listing is exhausted and holding at most one page in memory.
+
+        Args:
+            project_gid (string): project_gid
+            opt_fields (string): This endpoint returns a compact resource, which excludes some properties by default. To include those optional properties, set this query parameter to a comma-separated list of the properties you wish to include. Example: 'access_level,member,member.name,offset,parent,parent.name,path,uri'.
+            user (string): A string identifying a user. This can either be the string "me", an email, or the gid of a user. Example: 'me'.
+            opt_pretty (string): Provides “pretty” output.
+            limit (string): Results per page. Defaults to the maximum of 100 to minimise round trips.
+
+        Returns:
+            Iterator[dict[str, Any]]: The records of every page, one at a time.
+
+        Tags:
+            Project memberships
+        """
+        yield from self._paginate(self.get_memberships_from_aproject, project_gid=project_gid, opt_fields=opt_fields, user=user, opt_pretty=opt_pretty, limit=limit)
+
+    def iter_statuses_from_aproject(self, project_gid, opt_pretty=None, limit=None, opt_fields=None) -> Iterator[dict[str, Any]]:
+        """
+        Lazily iterates over every record listed by `get_statuses_from_aproject`, following `next_page.offset` until the listing is exhausted and holding at most one page in memory.
+
+        Args:
+            project_gid (string): project_gid
+            opt_pretty (string): Provides “pretty” output.
+            limit (string): Results per page. Defaults to the maximum of 100 to minimise round trips.
+            opt_fields (string): This endpoint returns a compact resource, which excludes some properties by default. To include those optional properties, set this query parameter to a comma-separated list of the properties you wish to include. Example: 'author,author.name,color,created_at,created_by,created_by.name,html_text,modified_at,offset,path,text,title,uri'.
+
+        Returns:
+            Iterator[dict[str, Any]]: The records of every page, one at a time.
+
+        Tags:
+            Project statuses
+        """
+        yield from self._paginate(self.get_statuses_from_aproject, project_gid=project_gid, opt_pretty=opt_pretty, limit=limit, opt_fields=opt_fields)
+
+    def iter_multiple_project_templates(self, workspace=None, team=None, limit=None, opt_fields=None, opt_pretty=None) -> Iterator[dict[str, Any]]:
+        """
+        Lazily iterates over every record listed by `get_multiple_project_templates`, following `next_page.offset` until the listing is exhausted and holding at most one page in memory.
+
+        Args:
+            workspace (string): The workspace to filter results on. Example: '12345'.
+            team (string): The team to filter projects on. Example: '14916'.
+            limit (string): Results per page. Defaults to the maximum of 100 to minimise round trips.
+            opt_fields (string): This endpoint returns a compact resource, which excludes some properties by default. To include those optional properties, set this query parameter to a comma-separated list of the properties you wish to include. Example: 'color,description,html_description,name,offset,owner,path,public,requested_dates,requested_dates.description,requested_dates.name,requested_roles,requested_roles.name,team,team.name,uri'.
+            opt_pretty (string): Provides “pretty” output.
+
+        Returns:
+            Iterator[dict[str, Any]]: The records of every page, one at a time.
+
+        Tags:
+            Project templates
+        """
+        yield from self._paginate(self.get_multiple_project_templates, workspace=workspace, team=team, limit=limit, opt_fields=opt_fields, opt_pretty=opt_pretty)
+
+    def iter_ateam_sproject_templates(self, team_gid, limit=None, opt_fields=None, opt_pretty=None) -> Iterator[dict[str, Any]]:
+        """
+        Lazily iterates over every record listed by `get_ateam_sproject_templates`, following `next_page.offset` until the listing is exhausted and holding at most one page in memory.
+
+        Args:
+            team_gid (string): team_gid
+            limit (string): Results per page. Defaults to the maximum of 100 to minimise round trips.
+            opt_fields (string): This endpoint returns a compact resource, which excludes some properties by default. To include those optional properties, set this query parameter to a comma-separated list of the properties you wish to include. Example: 'color,description,html_description,name,offset,owner,path,public,requested_dates,requested_dates.description,requested_dates.name,requested_roles,requested_roles.name,team,team.name,uri'.
+            opt_pretty (string): Provides “pretty” output.
+
+        Returns:
+            Iterator[dict[str, Any]]: The records of every page, one at a time.
+
+        Tags:
+            Project templates
+        """
+        yield from self._paginate(self.get_ateam_sproject_templates, team_gid=team_gid, limit=limit, opt_fields=opt_fields, opt_pretty=opt_pretty)
+
+    def iter_sections_in_aproject(self, project_gid, limit=None, opt_fields=None, opt_pretty=None) -> Iterator[dict[str, Any]]:
+        """
+        Lazily iterates over every record listed by `get_sections_in_aproject`, following `next_page.offset` until the listing is exhausted and holding at most one page in memory.
+
+        Args:
+            project_gid (string): project_gid
+            limit (string): Results per page. Defaults to the maximum of 100 to minimise round trips.
+            opt_fields (string): This endpoint returns a compact resource, which excludes some properties by default. To include those optional properties, set this query parameter to a comma-separated list of the properties you wish to include. Example: 'created_at,name,offset,path,project,project.name,projects,projects.name,uri'.
+            opt_pretty (string): Provides “pretty” output.
+
+        Returns:
+            Iterator[dict[str, Any]]: The records of every page, one at a time.
+
+        Tags:
+            Sections
+        """
+        yield from self._paginate(self.get_sections_in_aproject, project_gid=project_gid, limit=limit, opt_fields=opt_fields, opt_pretty=opt_pretty)
+
+    def iter_status_updates_from_an_object(self, parent=None, created_since=None, opt_fields=None, opt_pretty=None, limit=None) -> Iterator[dict[str, Any]]:
+        """
+        Lazily iterates over every record listed by `get_status_updates_from_an_object`, following `next_page.offset` until the listing is exhausted and holding at most one page in memory.
+
+        Args:
+            parent (string): (Required) Globally unique identifier for object to fetch statuses from. Must be a GID for a project, portfolio, or goal. Example: '159874'.
+            created_since (string): Only return statuses that have been created since the given time. Example: '2012-02-22T02:06:58.158Z'.
+            opt_fields (string): This endpoint returns a compact resource, which excludes some properties by default. To include those optional properties, set this query parameter to a comma-separated list of the properties you wish to include. Example: 'author,author.name,created_at,created_by,created_by.name,hearted,hearts,hearts.user,hearts.user.name,html_text,liked,likes,likes.user,likes.user.name,modified_at,num_hearts,num_likes,offset,parent,parent.name,path,resource_subtype,status_type,text,title,uri'.
+            opt_pretty (string): Provides “pretty” output.
+            limit (string): Results per page. Defaults to the maximum of 100 to minimise round trips.
+
+        Returns:
+            Iterator[dict[str, Any]]: The records of every page, one at a time.
+
+        Tags:
+            Status updates
+        """
+        yield from self._paginate(self.get_status_updates_from_an_object, parent=parent, created_since=created_since, opt_fields=opt_fields, opt_pretty=opt_pretty, limit=limit)
+
+    def iter_stories_from_atask(self, task_gid, limit=None, opt_fields=None, opt_pretty=None) -> Iterator[dict[str, Any]]:
+        """
+        Lazily iterates over every record listed by `get_stories_from_atask`, following `next_page.offset` until the listing is exhausted and holding at most one page in memory.
+
+        Args:
+            task_gid (string): task_gid
+            limit (string): Results per page. Defaults to the maximum of 100 to minimise round trips.
+            opt_fields (string): This endpoint returns a compact resource, which excludes some properties by default. To include those optional properties, set this query parameter to a comma-separated list of the properties you wish to include. Example: 'assignee,assignee.name,created_at,created_by,created_by.name,custom_field,custom_field.date_value,custom_field.date_value.date,custom_field.date_value.date_time,custom_field.display_value,custom_field.enabled,custom_field.enum_options,custom_field.enum_options.color,custom_field.enum_options.enabled,custom_field.enum_options.name,custom_field.enum_value,custom_field.enum_value.color,custom_field.enum_value.enabled,custom_field.enum_value.name,custom_field.id_prefix,custom_field.is_formula_field,custom_field.multi_enum_values,custom_field.multi_enum_values.color,custom_field.multi_enum_values.enabled,custom_field.multi_enum_values.name,custom_field.name,custom_field.number_value,custom_field.representation_type,custom_field.resource_subtype,custom_field.text_value,custom_field.type,dependency,dependency.created_by,dependency.name,dependency.resource_subtype,duplicate_of,duplicate_of.created_by,duplicate_of.name,duplicate_of.resource_subtype,duplicated_from,duplicated_from.created_by,duplicated_from.name,duplicated_from.resource_subtype,follower,follower.name,hearted,hearts,hearts.user,hearts.user.name,html_text,is_editable,is_edited,is_pinned,liked,likes,likes.user,likes.user.name,new_approval_status,new_date_value,new_dates,new_dates.due_at,new_dates.due_on,new_dates.start_on,new_enum_value,new_enum_value.color,new_enum_value.enabled,new_enum_value.name,new_multi_enum_values,new_multi_enum_values.color,new_multi_enum_values.enabled,new_multi_enum_values.name,new_name,new_number_value,new_people_value,new_people_value.name,new_resource_subtype,new_section,new_section.name,new_text_value,num_hearts,num_likes,offset,old_approval_status,old_date_value,old_dates,old_dates.due_at,old_dates.due_on,old_dates.start_on,old_enum_value,old_enum_value.color,old_enum_value.enabled,old_enum_value.name,old_multi_enum_values,old_multi_enum_values.color,old_multi_enum_values.enabled,old_multi_enum_values.name,old_name,old_number_value,old_people_value,old_people_value.name,old_resource_subtype,old_section,old_section.name,old_text_value,path,previews,previews.fallback,previews.footer,previews.header,previews.header_link,previews.html_text,previews.text,previews.title,previews.title_link,project,project.name,resource_subtype,source,sticker_name,story,story.created_at,story.created_by,story.created_by.name,story.resource_subtype,story.text,tag,tag.name,target,target.created_by,target.name,target.resource_subtype,task,task.created_by,task.name,task.resource_subtype,text,type,uri'.
+            opt_pretty (string): Provides “pretty” output.
+
+        Returns:
+            Iterator[dict[str, Any]]: The records of every page, one at a time.
+
+        Tags:
+            Stories
+        """
+        yield from self._paginate(self.get_stories_from_atask, task_gid=task_gid, limit=limit, opt_fields=opt_fields, opt_pretty=opt_pretty)
+
+    def iter_multiple_tags(self, limit=None, workspace=None, opt_fields=None, opt_pretty=None) -> Iterator[dict[str, Any]]:
+        """
+        Lazily iterates over every record listed by `get_multiple_tags`, following `next_page.offset` until the listing is exhausted and holding at most one page in memory.
+
+        Args:
+            limit (string): Results per page. Defaults to the maximum of 100 to minimise round trips.
+            workspace (string): The workspace to filter tags on. Example: '1331'.
+            opt_fields (string): This endpoint returns a compact resource, which excludes some properties by default. To include those optional properties, set this query parameter to a comma-separated list of the properties you wish to include. Example: 'color,created_at,followers,followers.name,name,notes,offset,path,permalink_url,uri,workspace,workspace.name'.
+            opt_pretty (string): Provides “pretty” output.
+
+        Returns:
+            Iterator[dict[str, Any]]: The records of every page, one at a time.
+
+        Tags:
+            Tags
+        """
+        yield from self._paginate(self.get_multiple_tags, limit=limit, workspace=workspace, opt_fields=opt_fields, opt_pretty=opt_pretty)
+
+    def iter_atask_stags(self, task_gid, opt_fields=None, opt_pretty=None, limit=None) -> Iterator[dict[str, Any]]:
+        """
+        Lazily iterates over every record listed by `get_atask_stags`, following `next_page.offset` until the listing is exhausted and holding at most one page in memory.
+
+        Args:
+            task_gid (string): task_gid
+            opt_fields (string): This endpoint returns a compact resource, which excludes some properties by default. To include those optional properties, set this query parameter to a comma-separated list of the properties you wish to include. Example: 'color,created_at,followers,followers.name,name,notes,offset,path,permalink_url,uri,workspace,workspace.name'.
+            opt_pretty (string): Provides “pretty” output.
+            limit (string): Results per page. Defaults to the maximum of 100 to minimise round trips.
+
+        Returns:
+            Iterator[dict[str, Any]]: The records of every page, one at a time.
+
+        Tags:
+            Tags
+        """
+        yield from self._paginate(self.get_atask_stags, task_gid=task_gid, opt_fields=opt_fields, opt_pretty=opt_pretty, limit=limit)
+
+    def iter_tags_in_aworkspace(self, workspace_gid, limit=None, opt_fields=None, opt_pretty=None) -> Iterator[dict[str, Any]]:
+        """
+        Lazily iterates over every record listed by `get_tags_in_aworkspace`, following `next_page.offset` until the listing is exhausted and holding at most one page in memory.
+
+        Args:
+            workspace_gid (string): workspace_gid
+            limit (string): Results per page. Defaults to the maximum of 100 to minimise round trips.
+            opt_fields (string): This endpoint returns a compact resource, which excludes some properties by default. To include those optional properties, set this query parameter to a comma-separated list of the properties you wish to include. Example: 'color,created_at,followers,followers.name,name,notes,offset,path,permalink_url,uri,workspace,workspace.name'.
+            opt_pretty (string): Provides “pretty” output.
+
+        Returns:
+            Iterator[dict[str, Any]]: The records of every page, one at a time.
+
+        Tags:
+            Tags
+        """
+        yield from self._paginate(self.get_tags_in_aworkspace, workspace_gid=workspace_gid, limit=limit, opt_fields=opt_fields, opt_pretty=opt_pretty)
+
+    def iter_multiple_tasks(self, limit=None, assignee=None, project=None, section=None, workspace=None, completed_since=None, modified_since=None, opt_fields=None, opt_pretty=None, prefetch=0) -> Iterator[dict[str, Any]]:
+        """
+        Lazily iterates over every record listed by `get_multiple_tasks`, following `next_page.offset` until the listing is exhausted. It holds at most one page in memory, or up to `prefetch` + 1 pages when `prefetch` is set.
+
+        Args:
+            limit (string): Results per page. Defaults to the maximum of 100 to minimise round trips.
+            assignee (string): The assignee to filter tasks on. If searching for unassigned tasks, assignee.any = null can be specified.
+            project (string): The project to filter tasks on. Example: '321654'.
+            section (string): The section to filter tasks on. Example: '321654'.
+            workspace (string): The workspace to filter tasks on.
+            completed_since (string): Only return tasks that are either incomplete or that have been completed since this time. Example: '2012-02-22T02:06:58.158Z'.
+            modified_since (string): Only return tasks that have been modified since the given time. *Note: A task is considered “modified” if any of its properties
+            opt_fields (string): This endpoint returns a compact resource, which excludes some properties by default. To include those optional properties, set this query parameter to a comma-separated list of the properties you wish to include. Example: 'actual_time_minutes,approval_status,assignee,assignee.name,assignee_section,assignee_section.name,assignee_status,completed,completed_at,completed_by,completed_by.name,created_at,created_by,custom_fields,custom_fields.asana_created_field,custom_fields.created_by,custom_fields.created_by.name,custom_fields.currency_code,custom_fields.custom_label,custom_fields.custom_label_position,custom_fields.date_value,custom_fields.date_value.date,custom_fields.date_value.date_time,custom_fields.description,custom_fields.display_value,custom_fields.enabled,custom_fields.enum_options,custom_fields.enum_options.color,custom_fields.enum_options.enabled,custom_fields.enum_options.name,custom_fields.enum_value,custom_fields.enum_value.color,custom_fields.enum_value.enabled,custom_fields.enum_value.name,custom_fields.format,custom_fields.has_notifications_enabled,custom_fields.id_prefix,custom_fields.is_formula_field,custom_fields.is_global_to_workspace,custom_fields.is_value_read_only,custom_fields.multi_enum_values,custom_fields.multi_enum_values.color,custom_fields.multi_enum_values.enabled,custom_fields.multi_enum_values.name,custom_fields.name,custom_fields.number_value,custom_fields.people_value,custom_fields.people_value.name,custom_fields.precision,custom_fields.representation_type,custom_fields.resource_subtype,custom_fields.text_value,custom_fields.type,dependencies,dependents,due_at,due_on,external,external.data,followers,followers.name,hearted,hearts,hearts.user,hearts.user.name,html_notes,is_rendered_as_separator,liked,likes,likes.user,likes.user.name,memberships,memberships.project,memberships.project.name,memberships.section,memberships.section.name,modified_at,name,notes,num_hearts,num_likes,num_subtasks,offset,parent,parent.created_by,parent.name,parent.resource_subtype,path,permalink_url,projects,projects.name,resource_subtype,start_at,start_on,tags,tags.name,uri,workspace,workspace.name'.
+            opt_pretty (string): Provides “pretty” output.
+            prefetch (integer): Number of pages to request ahead on a background thread while the current page is consumed. 0 disables read-ahead.
+
+        Returns:
+            Iterator[dict[str, Any]]: The records of every page, one at a time.
+
+        Tags:
+            Tasks
+        """
+        yield from self._paginate(self.get_multiple_tasks, prefetch=prefetch, limit=limit, assignee=assignee, project=project, section=section, workspace=workspace, completed_since=completed_since, modified_since=modified_since, opt_fields=opt_fields, opt_pretty=opt_pretty)
+
+    def iter_tasks_from_aproject(self, project_gid, opt_fields=None, completed_since=None, opt_pretty=None, limit=None, prefetch=0) -> Iterator[dict[str, Any]]:
+        """
+        Lazily iterates over every record listed by `get_tasks_from_aproject`, following `next_page.offset` until the listing is exhausted. It holds at most one page in memory, or up to `prefetch` + 1 pages when `prefetch` is set.
+
+        Args:
+            project_gid (string): project_gid
+            opt_fields (string): This endpoint returns a compact resource, which excludes some properties by default. To include those optional properties, set this query parameter to a comma-separated list of the properties you wish to include. Example: 'actual_time_minutes,approval_status,assignee,assignee.name,assignee_section,assignee_section.name,assignee_status,completed,completed_at,completed_by,completed_by.name,created_at,created_by,custom_fields,custom_fields.asana_created_field,custom_fields.created_by,custom_fields.created_by.name,custom_fields.currency_code,custom_fields.custom_label,custom_fields.custom_label_position,custom_fields.date_value,custom_fields.date_value.date,custom_fields.date_value.date_time,custom_fields.description,custom_fields.display_value,custom_fields.enabled,custom_fields.enum_options,custom_fields.enum_options.color,custom_fields.enum_options.enabled,custom_fields.enum_options.name,custom_fields.enum_value,custom_fields.enum_value.color,custom_fields.enum_value.enabled,custom_fields.enum_value.name,custom_fields.format,custom_fields.has_notifications_enabled,custom_fields.id_prefix,custom_fields.is_formula_field,custom_fields.is_global_to_workspace,custom_fields.is_value_read_only,custom_fields.multi_enum_values,custom_fields.multi_enum_values.color,custom_fields.multi_enum_values.enabled,custom_fields.multi_enum_values.name,custom_fields.name,custom_fields.number_value,custom_fields.people_value,custom_fields.people_value.name,custom_fields.precision,custom_fields.representation_type,custom_fields.resource_subtype,custom_fields.text_value,custom_fields.type,dependencies,dependents,due_at,due_on,external,external.data,followers,followers.name,hearted,hearts,hearts.user,hearts.user.name,html_notes,is_rendered_as_separator,liked,likes,likes.user,likes.user.name,memberships,memberships.project,memberships.project.name,memberships.section,memberships.section.name,modified_at,name,notes,num_hearts,num_likes,num_subtasks,offset,parent,parent.created_by,parent.name,parent.resource_subtype,path,permalink_url,projects,projects.name,resource_subtype,start_at,start_on,tags,tags.name,uri,workspace,workspace.name'.
+            completed_since (string): Only return tasks that are either incomplete or that have been completed since this time. Accepts a date-time string or the keyword *now*. Example: '2012-02-22T02:06:58.158Z'.
+            opt_pretty (string): Provides “pretty” output.
+            limit (string): Results per page. Defaults to the maximum of 100 to minimise round trips.
+            prefetch (integer): Number of pages to request ahead on a background thread while the current page is consumed. 0 disables read-ahead.
+
+        Returns:
+            Iterator[dict[str, Any]]: The records of every page, one at a time.
+
+        Tags:
+            Tasks
+        """
+        yield from self._paginate(self.get_tasks_from_aproject, prefetch=prefetch, project_gid=project_gid, opt_fields=opt_fields, completed_since=completed_since, opt_pretty=opt_pretty, limit=limit)
+
+    def iter_tasks_from_asection(self, section_gid, opt_fields=None, opt_pretty=None, limit=None, completed_since=None) -> Iterator[dict[str, Any]]:
+        """
+        Lazily iterates over every record listed by `get_tasks_from_asection`, following `next_page.offset` until the listing is exhausted and holding at most one page in memory.
+
+        Args:
+            section_gid (string): section_gid
+            opt_fields (string): This endpoint returns a compact resource, which excludes some properties by default. To include those optional properties, set this query parameter to a comma-separated list of the properties you wish to include. Example: 'actual_time_minutes,approval_status,assignee,assignee.name,assignee_section,assignee_section.name,assignee_status,completed,completed_at,completed_by,completed_by.name,created_at,created_by,custom_fields,custom_fields.asana_created_field,custom_fields.created_by,custom_fields.created_by.name,custom_fields.currency_code,custom_fields.custom_label,custom_fields.custom_label_position,custom_fields.date_value,custom_fields.date_value.date,custom_fields.date_value.date_time,custom_fields.description,custom_fields.display_value,custom_fields.enabled,custom_fields.enum_options,custom_fields.enum_options.color,custom_fields.enum_options.enabled,custom_fields.enum_options.name,custom_fields.enum_value,custom_fields.enum_value.color,custom_fields.enum_value.enabled,custom_fields.enum_value.name,custom_fields.format,custom_fields.has_notifications_enabled,custom_fields.id_prefix,custom_fields.is_formula_field,custom_fields.is_global_to_workspace,custom_fields.is_value_read_only,custom_fields.multi_enum_values,custom_fields.multi_enum_values.color,custom_fields.multi_enum_values.enabled,custom_fields.multi_enum_values.name,custom_fields.name,custom_fields.number_value,custom_fields.people_value,custom_fields.people_value.name,custom_fields.precision,custom_fields.representation_type,custom_fields.resource_subtype,custom_fields.text_value,custom_fields.type,dependencies,dependents,due_at,due_on,external,external.data,followers,followers.name,hearted,hearts,hearts.user,hearts.user.name,html_notes,is_rendered_as_separator,liked,likes,likes.user,likes.user.name,memberships,memberships.project,memberships.project.name,memberships.section,memberships.section.name,modified_at,name,notes,num_hearts,num_likes,num_subtasks,offset,parent,parent.created_by,parent.name,parent.resource_subtype,path,permalink_url,projects,projects.name,resource_subtype,start_at,start_on,tags,tags.name,uri,workspace,workspace.name'.
+            opt_pretty (string): Provides “pretty” output.
+            limit (string): Results per page. Defaults to the maximum of 100 to minimise round trips.
+            completed_since (string): Only return tasks that are either incomplete or that have been completed since this time. Accepts a date-time string or the keyword *now*. Example: '2012-02-22T02:06:58.158Z'.
+
+        Returns:
+            Iterator[dict[str, Any]]: The records of every page, one at a time.
+
+        Tags:
+            Tasks
+        """
+        yield from self._paginate(self.get_tasks_from_asection, section_gid=section_gid, opt_fields=opt_fields, opt_pretty=opt_pretty, limit=limit, completed_since=completed_since)
+
+    def iter_tasks_from_atag(self, tag_gid, opt_fields=None, opt_pretty=None, limit=None) -> Iterator[dict[str, Any]]:
+        """
+        Lazily iterates over every record listed by `get_tasks_from_atag`, following `next_page.offset` until the listing is exhausted and holding at most one page in memory.
+
+        Args:
+            tag_gid (string): tag_gid
+            opt_fields (string): This endpoint returns a compact resource, which excludes some properties by default. To include those optional properties, set this query parameter to a comma-separated list of the properties you wish to include. Example: 'actual_time_minutes,approval_status,assignee,assignee.name,assignee_section,assignee_section.name,assignee_status,completed,completed_at,completed_by,completed_by.name,created_at,created_by,custom_fields,custom_fields.asana_created_field,custom_fields.created_by,custom_fields.created_by.name,custom_fields.currency_code,custom_fields.custom_label,custom_fields.custom_label_position,custom_fields.date_value,custom_fields.date_value.date,custom_fields.date_value.date_time,custom_fields.description,custom_fields.display_value,custom_fields.enabled,custom_fields.enum_options,custom_fields.enum_options.color,custom_fields.enum_options.enabled,custom_fields.enum_options.name,custom_fields.enum_value,custom_fields.enum_value.color,custom_fields.enum_value.enabled,custom_fields.enum_value.name,custom_fields.format,custom_fields.has_notifications_enabled,custom_fields.id_prefix,custom_fields.is_formula_field,custom_fields.is_global_to_workspace,custom_fields.is_value_read_only,custom_fields.multi_enum_values,custom_fields.multi_enum_values.color,custom_fields.multi_enum_values.enabled,custom_fields.multi_enum_values.name,custom_fields.name,custom_fields.number_value,custom_fields.people_value,custom_fields.people_value.name,custom_fields.precision,custom_fields.representation_type,custom_fields.resource_subtype,custom_fields.text_value,custom_fields.type,dependencies,dependents,due_at,due_on,external,external.data,followers,followers.name,hearted,hearts,hearts.user,hearts.user.name,html_notes,is_rendered_as_separator,liked,likes,likes.user,likes.user.name,memberships,memberships.project,memberships.project.name,memberships.section,memberships.section.name,modified_at,name,notes,num_hearts,num_likes,num_subtasks,offset,parent,parent.created_by,parent.name,parent.resource_subtype,path,permalink_url,projects,projects.name,resource_subtype,start_at,start_on,tags,tags.name,uri,workspace,workspace.name'.
+            opt_pretty (string): Provides “pretty” output.
+            limit (string): Results per page. Defaults to the maximum of 100 to minimise round trips.
+
+        Returns:
+            Iterator[dict[str, Any]]: The records of every page, one at a time.
+
+        Tags:
+            Tasks
+        """
+        yield from self._paginate(self.get_tasks_from_atag, tag_gid=tag_gid, opt_fields=opt_fields, opt_pretty=opt_pretty, limit=limit)
+
+    def iter_tasks_from_auser_task_list(self, user_task_list_gid, opt_fields=None, completed_since=None, opt_pretty=None, limit=None) -> Iterator[dict[str, Any]]:
+        """
+        Lazily iterates over every record listed by `get_tasks_from_auser_task_list`, following `next_page.offset` until the listing is exhausted and holding at most one page in memory.
+
+        Args:
+            user_task_list_gid (string): user_task_list_gid
+            opt_fields (string): This endpoint returns a compact resource, which excludes some properties by default. To include those optional properties, set this query parameter to a comma-separated list of the properties you wish to include. Example: 'actual_time_minutes,approval_status,assignee,assignee.name,assignee_section,assignee_section.name,assignee_status,completed,completed_at,completed_by,completed_by.name,created_at,created_by,custom_fields,custom_fields.asana_created_field,custom_fields.created_by,custom_fields.created_by.name,custom_fields.currency_code,custom_fields.custom_label,custom_fields.custom_label_position,custom_fields.date_value,custom_fields.date_value.date,custom_fields.date_value.date_time,custom_fields.description,custom_fields.display_value,custom_fields.enabled,custom_fields.enum_options,custom_fields.enum_options.color,custom_fields.enum_options.enabled,custom_fields.enum_options.name,custom_fields.enum_value,custom_fields.enum_value.color,custom_fields.enum_value.enabled,custom_fields.enum_value.name,custom_fields.format,custom_fields.has_notifications_enabled,custom_fields.id_prefix,custom_fields.is_formula_field,custom_fields.is_global_to_workspace,custom_fields.is_value_read_only,custom_fields.multi_enum_values,custom_fields.multi_enum_values.color,custom_fields.multi_enum_values.enabled,custom_fields.multi_enum_values.name,custom_fields.name,custom_fields.number_value,custom_fields.people_value,custom_fields.people_value.name,custom_fields.precision,custom_fields.representation_type,custom_fields.resource_subtype,custom_fields.text_value,custom_fields.type,dependencies,dependents,due_at,due_on,external,external.data,followers,followers.name,hearted,hearts,hearts.user,hearts.user.name,html_notes,is_rendered_as_separator,liked,likes,likes.user,likes.user.name,memberships,memberships.project,memberships.project.name,memberships.section,memberships.section.name,modified_at,name,notes,num_hearts,num_likes,num_subtasks,offset,parent,parent.created_by,parent.name,parent.resource_subtype,path,permalink_url,projects,projects.name,resource_subtype,start_at,start_on,tags,tags.name,uri,workspace,workspace.name'.
+            completed_since (string): Only return tasks that are either incomplete or that have been completed since this time. Accepts a date-time string or the keyword *now*. Example: '2012-02-22T02:06:58.158Z'.
+            opt_pretty (string): Provides “pretty” output.
+            limit (string): Results per page. Defaults to the maximum of 100 to minimise round trips.
+
+        Returns:
+            Iterator[dict[str, Any]]: The records of every page, one at a time.
+
+        Tags:
+            Tasks
+        """
+        yield from self._paginate(self.get_tasks_from_auser_task_list, user_task_list_gid=user_task_list_gid, opt_fields=opt_fields, completed_since=completed_since, opt_pretty=opt_pretty, limit=limit)
+
+    def iter_subtasks_from_atask(self, task_gid, limit=None, opt_fields=None, opt_pretty=None) -> Iterator[dict[str, Any]]:
+        """
+        Lazily iterates over every record listed by `get_subtasks_from_atask`, following `next_page.offset` until the listing is exhausted and holding at most one page in memory.
+
+        Args:
+            task_gid (string): task_gid
+            limit (string): Results per page. Defaults to the maximum of 100 to minimise round trips.
+            opt_fields (string): This endpoint returns a compact resource, which excludes some properties by default. To include those optional properties, set this query parameter to a comma-separated list of the properties you wish to include. Example: 'actual_time_minutes,approval_status,assignee,assignee.name,assignee_section,assignee_section.name,assignee_status,completed,completed_at,completed_by,completed_by.name,created_at,created_by,custom_fields,custom_fields.asana_created_field,custom_fields.created_by,custom_fields.created_by.name,custom_fields.currency_code,custom_fields.custom_label,custom_fields.custom_label_position,custom_fields.date_value,custom_fields.date_value.date,custom_fields.date_value.date_time,custom_fields.description,custom_fields.display_value,custom_fields.enabled,custom_fields.enum_options,custom_fields.enum_options.color,custom_fields.enum_options.enabled,custom_fields.enum_options.name,custom_fields.enum_value,custom_fields.enum_value.color,custom_fields.enum_value.enabled,custom_fields.enum_value.name,custom_fields.format,custom_fields.has_notifications_enabled,custom_fields.id_prefix,custom_fields.is_formula_field,custom_fields.is_global_to_workspace,custom_fields.is_value_read_only,custom_fields.multi_enum_values,custom_fields.multi_enum_values.color,custom_fields.multi_enum_values.enabled,custom_fields.multi_enum_values.name,custom_fields.name,custom_fields.number_value,custom_fields.people_value,custom_fields.people_value.name,custom_fields.precision,custom_fields.representation_type,custom_fields.resource_subtype,custom_fields.text_value,custom_fields.type,dependencies,dependents,due_at,due_on,external,external.data,followers,followers.name,hearted,hearts,hearts.user,hearts.user.name,html_notes,is_rendered_as_separator,liked,likes,likes.user,likes.user.name,memberships,memberships.project,memberships.project.name,memberships.section,memberships.section.name,modified_at,name,notes,num_hearts,num_likes,num_subtasks,offset,parent,parent.created_by,parent.name,parent.resource_subtype,path,permalink_url,projects,projects.name,resource_subtype,start_at,start_on,tags,tags.name,uri,workspace,workspace.name'.
+            opt_pretty (string): Provides “pretty” output.
+
+        Returns:
+            Iterator[dict[str, Any]]: The records of every page, one at a time.
+
+        Tags:
+            Tasks
+        """
+        yield from self._paginate(self.get_subtasks_from_atask, task_gid=task_gid, limit=limit, opt_fields=opt_fields, opt_pretty=opt_pretty)
+
+    def iter_dependencies_from_atask(self, task_gid, opt_fields=None, opt_pretty=None, limit=None) -> Iterator[dict[str, Any]]:
+        """
+        Lazily iterates over every record listed by `get_dependencies_from_atask`, following `next_page.offset` until the listing is exhausted and holding at most one page in memory.
+
+        Args:
+            task_gid (string): task_gid
+            opt_fields (string): This endpoint returns a compact resource, which excludes some properties by default. To include those optional properties, set this query parameter to a comma-separated list of the properties you wish to include. Example: 'actual_time_minutes,approval_status,assignee,assignee.name,assignee_section,assignee_section.name,assignee_status,completed,completed_at,completed_by,completed_by.name,created_at,created_by,custom_fields,custom_fields.asana_created_field,custom_fields.created_by,custom_fields.created_by.name,custom_fields.currency_code,custom_fields.custom_label,custom_fields.custom_label_position,custom_fields.date_value,custom_fields.date_value.date,custom_fields.date_value.date_time,custom_fields.description,custom_fields.display_value,custom_fields.enabled,custom_fields.enum_options,custom_fields.enum_options.color,custom_fields.enum_options.enabled,custom_fields.enum_options.name,custom_fields.enum_value,custom_fields.enum_value.color,custom_fields.enum_value.enabled,custom_fields.enum_value.name,custom_fields.format,custom_fields.has_notifications_enabled,custom_fields.id_prefix,custom_fields.is_formula_field,custom_fields.is_global_to_workspace,custom_fields.is_value_read_only,custom_fields.multi_enum_values,custom_fields.multi_enum_values.color,custom_fields.multi_enum_values.enabled,custom_fields.multi_enum_values.name,custom_fields.name,custom_fields.number_value,custom_fields.people_value,custom_fields.people_value.name,custom_fields.precision,custom_fields.representation_type,custom_fields.resource_subtype,custom_fields.text_value,custom_fields.type,dependencies,dependents,due_at,due_on,external,external.data,followers,followers.name,hearted,hearts,hearts.user,hearts.user.name,html_notes,is_rendered_as_separator,liked,likes,likes.user,likes.user.name,memberships,memberships.project,memberships.project.name,memberships.section,memberships.section.name,modified_at,name,notes,num_hearts,num_likes,num_subtasks,offset,parent,parent.created_by,parent.name,parent.resource_subtype,path,permalink_url,projects,projects.name,resource_subtype,start_at,start_on,tags,tags.name,uri,workspace,workspace.name'.
+            opt_pretty (string): Provides “pretty” output.
+            limit (string): Results per page. Defaults to the maximum of 100 to minimise round trips.
+
+        Returns:
+            Iterator[dict[str, Any]]: The records of every page, one at a time.
+
+        Tags:
+            Tasks
+        """
+        yield from self._paginate(self.get_dependencies_from_atask, task_gid=task_gid, opt_fields=opt_fields, opt_pretty=opt_pretty, limit=limit)
+
+    def iter_dependents_from_atask(self, task_gid, opt_fields=None, opt_pretty=None, limit=None) -> Iterator[dict[str, Any]]:
+        """
+        Lazily iterates over every record listed by `get_dependents_from_atask`, following `next_page.offset` until the listing is exhausted and holding at most one page in memory.
+
+        Args:
+            task_gid (string): task_gid
+            opt_fields (string): This endpoint returns a compact resource, which excludes some properties by default. To include those optional properties, set this query parameter to a comma-separated list of the properties you wish to include. Example: 'actual_time_minutes,approval_status,assignee,assignee.name,assignee_section,assignee_section.name,assignee_status,completed,completed_at,completed_by,completed_by.name,created_at,created_by,custom_fields,custom_fields.asana_created_field,custom_fields.created_by,custom_fields.created_by.name,custom_fields.currency_code,custom_fields.custom_label,custom_fields.custom_label_position,custom_fields.date_value,custom_fields.date_value.date,custom_fields.date_value.date_time,custom_fields.description,custom_fields.display_value,custom_fields.enabled,custom_fields.enum_options,custom_fields.enum_options.color,custom_fields.enum_options.enabled,custom_fields.enum_options.name,custom_fields.enum_value,custom_fields.enum_value.color,custom_fields.enum_value.enabled,custom_fields.enum_value.name,custom_fields.format,custom_fields.has_notifications_enabled,custom_fields.id_prefix,custom_fields.is_formula_field,custom_fields.is_global_to_workspace,custom_fields.is_value_read_only,custom_fields.multi_enum_values,custom_fields.multi_enum_values.color,custom_fields.multi_enum_values.enabled,custom_fields.multi_enum_values.name,custom_fields.name,custom_fields.number_value,custom_fields.people_value,custom_fields.people_value.name,custom_fields.precision,custom_fields.representation_type,custom_fields.resource_subtype,custom_fields.text_value,custom_fields.type,dependencies,dependents,due_at,due_on,external,external.data,followers,followers.name,hearted,hearts,hearts.user,hearts.user.name,html_notes,is_rendered_as_separator,liked,likes,likes.user,likes.user.name,memberships,memberships.project,memberships.project.name,memberships.section,memberships.section.name,modified_at,name,notes,num_hearts,num_likes,num_subtasks,offset,parent,parent.created_by,parent.name,parent.resource_subtype,path,permalink_url,projects,projects.name,resource_subtype,start_at,start_on,tags,tags.name,uri,workspace,workspace.name'.
+            opt_pretty (string): Provides “pretty” output.
+            limit (string): Results per page. Defaults to the maximum of 100 to minimise round trips.
+
+        Returns:
+            Iterator[dict[str, Any]]: The records of every page, one at a time.
+
+        Tags:
+            Tasks
+        """
+        yield from self._paginate(self.get_dependents_from_atask, task_gid=task_gid, opt_fields=opt_fields, opt_pretty=opt_pretty, limit=limit)
+
+    def iter_multiple_task_templates(self, limit=None, project=None, opt_fields=None, opt_pretty=None) -> Iterator[dict[str, Any]]:
+        """
+        Lazily iterates over every record listed by `get_multiple_task_templates`, following `next_page.offset` until the listing is exhausted and holding at most one page in memory.
+
+        Args:
+            limit (string): Results per page. Defaults to the maximum of 100 to minimise round trips.
+            project (string): The project to filter task templates on. Example: '321654'.
+            opt_fields (string): This endpoint returns a compact resource, which excludes some properties by default. To include those optional properties, set this query parameter to a comma-separated list of the properties you wish to include. Example: 'created_at,created_by,name,project,template'.
+            opt_pretty (string): Provides “pretty” output.
+
+        Returns:
+            Iterator[dict[str, Any]]: The records of every page, one at a time.
+
+        Tags:
+            Task templates
+        """
+        yield from self._paginate(self.get_multiple_task_templates, limit=limit, project=project, opt_fields=opt_fields, opt_pretty=opt_pretty)
+
+    def iter_teams_in_aworkspace(self, workspace_gid, opt_fields=None, opt_pretty=None, limit=None) -> Iterator[dict[str, Any]]:
+        """
+        Lazily iterates over every record listed by `get_teams_in_aworkspace`, following `next_page.offset` until the listing is exhausted and holding at most one page in memory.
+
+        Args:
+            workspace_gid (string): workspace_gid
+            opt_fields (string): This endpoint returns a compact resource, which excludes some properties by default. To include those optional properties, set this query parameter to a comma-separated list of the properties you wish to include. Example: 'description,edit_team_name_or_description_access_level,edit_team_visibility_or_trash_team_access_level,guest_invite_management_access_level,html_description,join_request_management_access_level,member_invite_management_access_level,name,offset,organization,organization.name,path,permalink_url,team_content_management_access_level,team_member_removal_access_level,uri,visibility'.
+            opt_pretty (string): Provides “pretty” output.
+            limit (string): Results per page. Defaults to the maximum of 100 to minimise round trips.
+
+        Returns:
+            Iterator[dict[str, Any]]: The records of every page, one at a time.
+
+        Tags:
+            Teams
+        """
+        yield from self._paginate(self.get_teams_in_aworkspace, workspace_gid=workspace_gid, opt_fields=opt_fields, opt_pretty=opt_pretty, limit=limit)
+
+    def iter_teams_for_auser(self, user_gid, opt_fields=None, opt_pretty=None, limit=None, organization=None) -> Iterator[dict[str, Any]]:
+        """
+        Lazily iterates over every record listed by `get_teams_for_auser`, following `next_page.offset` until the listing is exhausted and holding at most one page in memory.
+
+        Args:
+            user_gid (string): user_gid
+            opt_fields (string): This endpoint returns a compact resource, which excludes some properties by default. To include those optional properties, set this query parameter to a comma-separated list of the properties you wish to include. Example: 'description,edit_team_name_or_description_access_level,edit_team_visibility_or_trash_team_access_level,guest_invite_management_access_level,html_description,join_request_management_access_level,member_invite_management_access_level,name,offset,organization,organization.name,path,permalink_url,team_content_management_access_level,team_member_removal_access_level,uri,visibility'.
+            opt_pretty (string): Provides “pretty” output.
+            limit (string): Results per page. Defaults to the maximum of 100 to minimise round trips.
+            organization (string): (Required) The workspace or organization to filter teams on. Example: '1331'.
+
+        Returns:
+            Iterator[dict[str, Any]]: The records of every page, one at a time.
+
+        Tags:
+            Teams
+        """
+        yield from self._paginate(self.get_teams_for_auser, user_gid=user_gid, opt_fields=opt_fields, opt_pretty=opt_pretty, limit=limit, organization=organization)
+
+    def iter_team_memberships(self, team=None, user=None, workspace=None, opt_fields=None, opt_pretty=None, limit=None) -> Iterator[dict[str, Any]]:
+        """
+        Lazily iterates over every record listed by `get_team_memberships`, following `next_page.offset` until the listing is exhausted and holding at most one page in memory.
+
+        Args:
+            team (string): Globally unique identifier for the team. Example: '159874'.
+            user (string): A string identifying a user. This can either be the string "me", an email, or the gid of a user. This parameter must be used with the workspace parameter. Example: '512241'.
+            workspace (string): Globally unique identifier for the workspace. This parameter must be used with the user parameter. Example: '31326'.
+            opt_fields (string): This endpoint returns a compact resource, which excludes some properties by default. To include those optional properties, set this query parameter to a comma-separated list of the properties you wish to include. Example: 'is_admin,is_guest,is_limited_access,offset,path,team,team.name,uri,user,user.name'.
+            opt_pretty (string): Provides “pretty” output.
+            limit (string): Results per page. Defaults to the maximum of 100 to minimise round trips.
+
+        Returns:
+            Iterator[dict[str, Any]]: The records of every page, one at a time.
+
+        Tags:
+            Team memberships
+        """
+        yield from self._paginate(self.get_team_memberships, team=team, user=user, workspace=workspace, opt_fields=opt_fields, opt_pretty=opt_pretty, limit=limit)
+
+    def iter_memberships_from_ateam(self, team_gid, opt_fields=None, opt_pretty=None, limit=None) -> Iterator[dict[str, Any]]:
+        """
+        Lazily iterates over every record listed by `get_memberships_from_ateam`, following `next_page.offset` until the listing is exhausted and holding at most one page in memory.
+
+        Args:
+            team_gid (string): team_gid
+            opt_fields (string): This endpoint returns a compact resource, which excludes some properties by default. To include those optional properties, set this query parameter to a comma-separated list of the properties you wish to include. Example: 'is_admin,is_guest,is_limited_access,offset,path,team,team.name,uri,user,user.name'.
+            opt_pretty (string): Provides “pretty” output.
+            limit (string): Results per page. Defaults to the maximum of 100 to minimise round trips.
+
+        Returns:
+            Iterator[dict[str, Any]]: The records of every page, one at a time.
+
+        Tags:
+            Team memberships
+        """
+        yield from self._paginate(self.get_memberships_from_ateam, team_gid=team_gid, opt_fields=opt_fields, opt_pretty=opt_pretty, limit=limit)
+
+    def iter_memberships_from_auser(self, user_gid, workspace=None, opt_fields=None, opt_pretty=None, limit=None) -> Iterator[dict[str, Any]]:
+        """
+        Lazily iterates over every record listed by `get_memberships_from_auser`, following `next_page.offset` until the listing is exhausted and holding at most one page in memory.
+
+        Args:
+            user_gid (string): user_gid
+            workspace (string): (Required) Globally unique identifier for the workspace. Example: '31326'.
+            opt_fields (string): This endpoint returns a compact resource, which excludes some properties by default. To include those optional properties, set this query parameter to a comma-separated list of the properties you wish to include. Example: 'is_admin,is_guest,is_limited_access,offset,path,team,team.name,uri,user,user.name'.
+            opt_pretty (string): Provides “pretty” output.
+            limit (string): Results per page. Defaults to the maximum of 100 to minimise round trips.
+
+        Returns:
+            Iterator[dict[str, Any]]: The records of every page, one at a time.
+
+        Tags:
+            Team memberships
+        """
+        yield from self._paginate(self.get_memberships_from_auser, user_gid=user_gid, workspace=workspace, opt_fields=opt_fields, opt_pretty=opt_pretty, limit=limit)
+
+    def iter_time_periods(self, start_on=None, end_on=None, workspace=None, opt_fields=None, opt_pretty=None, limit=None) -> Iterator[dict[str, Any]]:
+        """
+        Lazily iterates over every record listed by `get_time_periods`, following `next_page.offset` until the listing is exhausted and holding at most one page in memory.
+
+        Args:
+            start_on (string): ISO 8601 date string Example: '2019-09-15'.
+            end_on (string): ISO 8601 date string Example: '2019-09-15'.
+            workspace (string): (Required) Globally unique identifier for the workspace. Example: '31326'.
+            opt_fields (string): This endpoint returns a compact resource, which excludes some properties by default. To include those optional properties, set this query parameter to a comma-separated list of the properties you wish to include. Example: 'display_name,end_on,offset,parent,parent.display_name,parent.end_on,parent.period,parent.start_on,path,period,start_on,uri'.
+            opt_pretty (string): Provides “pretty” output.
+            limit (string): Results per page. Defaults to the maximum of 100 to minimise round trips.
+
+        Returns:
+            Iterator[dict[str, Any]]: The records of every page, one at a time.
+
+        Tags:
+            Time periods
+        """
+        yield from self._paginate(self.get_time_periods, start_on=start_on, end_on=end_on, workspace=workspace, opt_fields=opt_fields, opt_pretty=opt_pretty, limit=limit)
+
+    def iter_time_tracking_entries_for_atask(self, task_gid, limit=None, opt_fields=None, opt_pretty=None) -> Iterator[dict[str, Any]]:
+        """
+        Lazily iterates over every record listed by `get_time_tracking_entries_for_atask`, following `next_page.offset` until the listing is exhausted and holding at most one page in memory.
+
+        Args:
+            task_gid (string): task_gid
+            limit (string): Results per page. Defaults to the maximum of 100 to minimise round trips.
+            opt_fields (string): This endpoint returns a compact resource, which excludes some properties by default. To include those optional properties, set this query parameter to a comma-separated list of the properties you wish to include. Example: 'created_by,created_by.name,duration_minutes,entered_on,offset,path,uri'.
+            opt_pretty (string): Provides “pretty” output.
+
+        Returns:
+            Iterator[dict[str, Any]]: The records of every page, one at a time.
+
+        Tags:
+            Time tracking entries
+        """
+        yield from self._paginate(self.get_time_tracking_entries_for_atask, task_gid=task_gid, limit=limit, opt_fields=opt_fields, opt_pretty=opt_pretty)
+
+    def iter_multiple_users(self, opt_fields=None, workspace=None, team=None, opt_pretty=None, limit=None) -> Iterator[dict[str, Any]]:
+        """
+        Lazily iterates over every record listed by `get_multiple_users`, following `next_page.offset` until the listing is exhausted and holding at most one page in memory.
+
+        Args:
+            opt_fields (string): This endpoint returns a compact resource, which excludes some properties by default. To include those optional properties, set this query parameter to a comma-separated list of the properties you wish to include. Example: 'email,name,offset,path,photo,photo.image_1024x1024,photo.image_128x128,photo.image_21x21,photo.image_27x27,photo.image_36x36,photo.image_60x60,uri,workspaces,workspaces.name'.
+            workspace (string): The workspace or organization ID to filter users on. Example: '1331'.
+            team (string): The team ID to filter users on. Example: '15627'.
+            opt_pretty (string): Provides “pretty” output.
+            limit (string): Results per page. Defaults to the maximum of 100 to minimise round trips.
+
+        Returns:
+            Iterator[dict[str, Any]]: The records of every page, one at a time.
+
+        Tags:
+            Users
+        """
+        yield from self._paginate(self.get_multiple_users, opt_fields=opt_fields, workspace=workspace, team=team, opt_pretty=opt_pretty, limit=limit)
+
+    def iter_auser_sfavorites(self, user_gid, opt_fields=None, opt_pretty=None, limit=None, resource_type=None, workspace=None) -> Iterator[dict[str, Any]]:
+        """
+        Lazily iterates over every record listed by `get_auser_sfavorites`, following `next_page.offset` until the listing is exhausted and holding at most one page in memory.
+
+        Args:
+            user_gid (string): user_gid
+            opt_fields (string): This endpoint returns a compact resource, which excludes some properties by default. To include those optional properties, set this query parameter to a comma-separated list of the properties you wish to include. Example: 'name,offset,path,uri'.
+            opt_pretty (string): Provides “pretty” output.
+            limit (string): Results per page. Defaults to the maximum of 100 to minimise round trips.
+            resource_type (string): (Required) The resource type of favorites to be returned. Example: 'project'.
+            workspace (string): (Required) The workspace in which to get favorites. Example: '1234'.
+
+        Returns:
+            Iterator[dict[str, Any]]: The records of every page, one at a time.
+
+        Tags:
+            Users
+        """
+        yield from self._paginate(self.get_auser_sfavorites, user_gid=user_gid, opt_fields=opt_fields, opt_pretty=opt_pretty, limit=limit, resource_type=resource_type, workspace=workspace)
+
+    def iter_users_in_ateam(self, team_gid, opt_fields=None, opt_pretty=None) -> Iterator[dict[str, Any]]:
+        """
+        Lazily iterates over every record listed by `get_users_in_ateam`, following `next_page.offset` until the listing is exhausted and holding at most one page in memory.
+
+        Args:
+            team_gid (string): team_gid
+            opt_fields (string): This endpoint returns a compact resource, which excludes some properties by default. To include those optional properties, set this query parameter to a comma-separated list of the properties you wish to include. Example: 'email,name,photo,photo.image_1024x1024,photo.image_128x128,photo.image_21x21,photo.image_27x27,photo.image_36x36,photo.image_60x60,workspaces,workspaces.name'.
+            opt_pretty (string): Provides “pretty” output.
+
+        Returns:
+            Iterator[dict[str, Any]]: The records of every page, one at a time.
+
+        Tags:
+            Users
+        """
+        yield from self._paginate(self.get_users_in_ateam, team_gid=team_gid, opt_fields=opt_fields, opt_pretty=opt_pretty)
+
+    def iter_users_in_aworkspace_or_organization(self, workspace_gid, opt_fields=None, opt_pretty=None) -> Iterator[dict[str, Any]]:
+        """
+        Lazily iterates over every record listed by `get_users_in_aworkspace_or_organization`, following `next_page.offset` until the listing is exhausted and holding at most one page in memory.
+
+        Args:
+            workspace_gid (string): workspace_gid
+            opt_fields (string): This endpoint returns a compact resource, which excludes some properties by default. To include those optional properties, set this query parameter to a comma-separated list of the properties you wish to include. Example: 'email,name,photo,photo.image_1024x1024,photo.image_128x128,photo.image_21x21,photo.image_27x27,photo.image_36x36,photo.image_60x60,workspaces,workspaces.name'.
+            opt_pretty (string): Provides “pretty” output.
+
+        Returns:
+            Iterator[dict[str, Any]]: The records of every page, one at a time.
+
+        Tags:
+            Users
+        """
+        yield from self._paginate(self.get_users_in_aworkspace_or_organization, workspace_gid=workspace_gid, opt_fields=opt_fields, opt_pretty=opt_pretty)
+
+    def iter_multiple_webhooks(self, limit=None, workspace=None, resource=None, opt_fields=None, opt_pretty=None) -> Iterator[dict[str, Any]]:
+        """
+        Lazily iterates over every record listed by `get_multiple_webhooks`, following `next_page.offset` until the listing is exhausted and holding at most one page in memory.
+
+        Args:
+            limit (string): Results per page. Defaults to the maximum of 100 to minimise round trips.
+            workspace (string): (Required) The workspace to query for webhooks in. Example: '1331'.
+            resource (string): Only return webhooks for the given resource. Example: '51648'.
+            opt_fields (string): This endpoint returns a compact resource, which excludes some properties by default. To include those optional properties, set this query parameter to a comma-separated list of the properties you wish to include. Example: 'active,created_at,delivery_retry_count,failure_deletion_timestamp,filters,filters.action,filters.fields,filters.resource_subtype,last_failure_at,last_failure_content,last_success_at,next_attempt_after,offset,path,resource,resource.name,target,uri'.
+            opt_pretty (string): Provides “pretty” output.
+
+        Returns:
+            Iterator[dict[str, Any]]: The records of every page, one at a time.
+
+        Tags:
+            Webhooks
+        """
+        yield from self._paginate(self.get_multiple_webhooks, limit=limit, workspace=workspace, resource=resource, opt_fields=opt_fields, opt_pretty=opt_pretty)
+
+    def iter_multiple_workspaces(self, opt_fields=None, opt_pretty=None, limit=None) -> Iterator[dict[str, Any]]:
+        """
+        Lazily iterates over every record listed by `get_multiple_workspaces`, following `next_page.offset` until the listing is exhausted and holding at most one page in memory.
+
+        Args:
+            opt_fields (string): This endpoint returns a compact resource, which excludes some properties by default. To include those optional properties, set this query parameter to a comma-separated list of the properties you wish to include. Example: 'email_domains,is_organization,name,offset,path,uri'.
+            opt_pretty (string): Provides “pretty” output.
+            limit (string): Results per page. Defaults to the maximum of 100 to minimise round trips.
+
+        Returns:
+            Iterator[dict[str, Any]]: The records of every page, one at a time.
+
+        Tags:
+            Workspaces
+        """
+        yield from self._paginate(self.get_multiple_workspaces, opt_fields=opt_fields, opt_pretty=opt_pretty, limit=limit)
+
+    def iter_workspace_memberships_for_auser(self, user_gid, opt_fields=None, opt_pretty=None, limit=None) -> Iterator[dict[str, Any]]:
+        """
+        Lazily iterates over every record listed by `get_workspace_memberships_for_auser`, following `next_page.offset` until the listing is exhausted and holding at most one page in memory.
+
+        Args:
+            user_gid (string): user_gid
+            opt_fields (string): This endpoint returns a compact resource, which excludes some properties by default. To include those optional properties, set this query parameter to a comma-separated list of the properties you wish to include. Example: 'created_at,is_active,is_admin,is_guest,offset,path,uri,user,user.name,user_task_list,user_task_list.name,user_task_list.owner,user_task_list.workspace,vacation_dates,vacation_dates.end_on,vacation_dates.start_on,workspace,workspace.name'.
+            opt_pretty (string): Provides “pretty” output.
+            limit (string): Results per page. Defaults to the maximum of 100 to minimise round trips.
+
+        Returns:
+            Iterator[dict[str, Any]]: The records of every page, one at a time.
+
+        Tags:
+            Workspace memberships
+        """
+        yield from self._paginate(self.get_workspace_memberships_for_auser, user_gid=user_gid, opt_fields=opt_fields, opt_pretty=opt_pretty, limit=limit)
+
+    def iter_the_workspace_memberships_for_aworkspace(self, workspace_gid, opt_fields=None, user=None, opt_pretty=None, limit=None) -> Iterator[dict[str, Any]]:
+        """
+        Lazily iterates over every record listed by `get_the_workspace_memberships_for_aworkspace`, following `next_page.offset` until the listing is exhausted and holding at most one page in memory.
+
+        Args:
+            workspace_gid (string): workspace_gid
+            opt_fields (string): This endpoint returns a compact resource, which excludes some properties by default. To include those optional properties, set this query parameter to a comma-separated list of the properties you wish to include. Example: 'created_at,is_active,is_admin,is_guest,offset,path,uri,user,user.name,user_task_list,user_task_list.name,user_task_list.owner,user_task_list.workspace,vacation_dates,vacation_dates.end_on,vacation_dates.start_on,workspace,workspace.name'.
+            user (string): A string identifying a user. This can either be the string "me", an email, or the gid of a user. Example: 'me'.
+            opt_pretty (string): Provides “pretty” output.
+            limit (string): Results per page. Defaults to the maximum of 100 to minimise round trips.
+
+        Returns:
+            Iterator[dict[str, Any]]: The records of every page, one at a time.
+
+        Tags:
+            Workspace memberships
+        """
+        yield from self._paginate(self.get_the_workspace_memberships_for_aworkspace, workspace_gid=workspace_gid, opt_fields=opt_fields, user=user, opt_pretty=opt_pretty, limit=limit)
+
+
+    def iter_search_tasks_in_aworkspace(self, workspace_gid, created_at_after=None, created_at_before=None, filters=None, opt_fields=None, max_workers=4) -> Iterator[dict[str, Any]]:
+        """
+        Lazily iterates over every task matching a workspace search, working around the search endpoint's lack of pagination.
+
+        The creation-time range is searched in windows on a thread pool. Both window bounds are exclusive, so a window whose result count reaches the search cap is split at its midpoint into one half ending a millisecond past the midpoint and one starting at it. Both halves are searched again until every window comes back below the cap, and tasks are deduplicated by gid.
+
+        Args:
+            workspace_gid (string): workspace_gid
+            created_at_after (string): Lower bound of the creation-time range to cover. Defaults to 2008-01-01T00:00:00Z.
+            created_at_before (string): Upper bound of the creation-time range to cover. Defaults to the current time.
+            filters (object): Additional `search_tasks_in_aworkspace` arguments applied to every window.
+            opt_fields (string): Comma-separated list of optional task properties to include.
+            max_workers (integer): Number of windows searched concurrently.
+
+        Returns:
+            Iterator[dict[str, Any]]: Each matching task exactly once, in completion order of the windows.
+
+        Tags:
+            Tasks
+        """
+        filters = dict(filters or {})
+        overlap = {'created_at_after', 'created_at_before', 'workspace_gid', 'opt_fields'} & filters.keys()
+        if overlap:
+            raise ValueError(f"Pass {', '.join(sorted(overlap))} as arguments, not filters")
+        lower = parse_timestamp(created_at_after) if created_at_after else SEARCH_EPOCH
+        upper = parse_timestamp(created_at_before) if created_at_before else datetime.now(timezone.utc).replace(microsecond=0)
+        if lower >= upper:
+            raise ValueError("created_at_after must be earlier than created_at_before")
+
+        def search_window(after, before) -> list[dict[str, Any]]:
+            page = self.search_tasks_in_aworkspace(workspace_gid, opt_fields=opt_fields, created_at_after=format_timestamp(after), created_at_before=format_timestamp(before), **filters)
+            return page.get('data') or []
+
+        seen = set()
+        pool = ThreadPoolExecutor(max_workers=max(1, max_workers), thread_name_prefix='asana-search')
+        try:
+            pending = {pool.submit(search_window, lower, upper): (lower, upper)}
+            while pending:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    after, before = pending.pop(future)
+                    tasks = future.result()
+                    if len(tasks) >= SEARCH_RESULT_CAP:
+                        if before - after > 2 * SEARCH_MIN_WINDOW:
+                            middle = after + (before - after) // 2 // SEARCH_MIN_WINDOW * SEARCH_MIN_WINDOW
+                            for window in ((after, middle + SEARCH_MIN_WINDOW), (middle, before)):
+                                pending[pool.submit(search_window, *window)] = window
+                        else:
+                            logger.warning(f"Search window {format_timestamp(after)}..{format_timestamp(before)} still holds {len(tasks)} tasks and cannot be split further; results may be truncated")
+                    for task in tasks:
+                        if task['gid'] not in seen:
+                            seen.add(task['gid'])
+                            yield task
+        finally:
+            pool.shutdown(wait=False, cancel_futures=True)
+
+    def iter_workspace_tasks(self, workspace_gid, opt_fields=None, completed_since=None, archived=None, max_workers=8) -> Iterator[dict[str, Any]]:
+        """
+        Lazily iterates over every task in every project of a workspace, listing the projects concurrently and yielding each multi-homed task only once.
+
+        Projects are streamed from `iter_all_projects_in_aworkspace` and their tasks paged through on a pool of `max_workers` threads. Tasks are yielded as soon as any project produces them, and gids already seen are kept as integers in a set so the dedup state stays small for large workspaces.
+
+        Args:
+            workspace_gid (string): workspace_gid
+            opt_fields (string): Comma-separated list of optional task properties to include.
+            completed_since (string): Only return tasks that are either incomplete or that have been completed since this time, or *now* for incomplete tasks only.
+            archived (boolean): Only include projects with this archived state.
+            max_workers (integer): Number of projects paged through concurrently.
+
+        Returns:
+            Iterator[dict[str, Any]]: Each task of the workspace's projects exactly once.
+
+        Tags:
+            Tasks
+        """
+        if workspace_gid is None:
+            raise ValueError("Missing required parameter 'workspace_gid'")
+        workers = max(1, max_workers)
+        tasks = Handoff(workers * MAX_PAGE_SIZE)
+
+        def dump_project(project_gid) -> None:
+            if tasks.closed:
+                return
+            try:
+                for task in self.iter_tasks_from_aproject(project_gid, opt_fields=opt_fields, completed_since=completed_since):
+                    if not tasks.put(task):
+                        return
+            except Exception as exc:
+                tasks.fail(exc)
+
+        def fan_out() -> None:
+            with ThreadPoolExecutor(max_workers=workers, thread_name_prefix='asana-dump') as pool:
+                try:
+                    for project in self.iter_all_projects_in_aworkspace(workspace_gid, archived=archived):
+                        if tasks.closed:
+                            break
+                        pool.submit(dump_project, project['gid'])
+                except Exception as exc:
+                    tasks.fail(exc)
+            tasks.finish()
+
+        feeder = threading.Thread(target=fan_out, name='asana-dump-feeder', daemon=True)
+        feeder.start()
+        seen = set()
+        try:
+            for task in tasks:
+                key = int(task['gid'])
+                if key not in seen:
+                    seen.add(key)
+                    yield task
+        finally:
+            tasks.close()
+            feeder.join()
+
     def list_tools(self):
         return [
             self.get_an_allocation,
@@ -7775,7 +9504,10 @@ class AsanaApp(APIApplication):
             self.delete_an_attachment,
             self.get_attachments_from_an_object,
             self.get_audit_log_events,
+            self.export_audit_log_events,
+            self.backfill_audit_log_events,
             self.submit_parallel_requests,
+            self.hydrate,
             self.create_acustom_field,
             self.get_acustom_field,
             self.update_acustom_field,
@@ -7888,14 +9620,21 @@ class AsanaApp(APIApplication):
             self.create_atask,
             self.get_atask,
             self.update_atask,
+            self.bulk_update_tasks,
             self.delete_atask,
             self.duplicate_atask,
             self.get_tasks_from_aproject,
+            self.mirror_project,
+            self.sync_mirrored_projects,
+            self.get_mirror_status,
+            self.query_mirrored_tasks,
+            self.get_mirrored_task,
             self.get_tasks_from_asection,
             self.get_tasks_from_atag,
             self.get_tasks_from_auser_task_list,
             self.get_subtasks_from_atask,
             self.create_asubtask,
+            self.import_tasks_from_file,
             self.set_the_parent_of_atask,
             self.get_dependencies_from_atask,
             self.set_dependencies_for_atask,
@@ -7911,6 +9650,8 @@ class AsanaApp(APIApplication):
             self.remove_followers_from_atask,
             self.get_atask_for_agiven_custom_id,
             self.search_tasks_in_aworkspace,
+            self.search_all_tasks_in_aworkspace,
+            self.dump_workspace_tasks,
             self.get_multiple_task_templates,
             self.get_atask_template,
             self.delete_atask_template,
@@ -7934,6 +9675,7 @@ class AsanaApp(APIApplication):
             self.update_atime_tracking_entry,
             self.delete_atime_tracking_entry,
             self.get_objects_via_typeahead,
+            self.resolve_names,
             self.get_multiple_users,
             self.get_auser,
             self.get_auser_sfavorites,
@@ -7946,6 +9688,7 @@ class AsanaApp(APIApplication):
             self.get_awebhook,
             self.update_awebhook,
             self.delete_awebhook,
+            self.reconcile_webhooks,
             self.get_multiple_workspaces,
             self.get_aworkspace,
             self.update_aworkspace,
@@ -7953,5 +9696,6 @@ class AsanaApp(APIApplication):
             self.remove_auser_from_aworkspace_or_organization,
             self.get_aworkspace_membership,
             self.get_workspace_memberships_for_auser,
-            self.get_the_workspace_memberships_for_aworkspace
+            self.get_the_workspace_memberships_for_aworkspace,
+            self.get_response_cache_stats
         ]
@@ -0,0 +1,256 @@
+import heapq
+import json
+import os
+import tempfile
+import threading
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor, wait
+from datetime import datetime, timedelta
+from typing import IO, Any
+
+from loguru import logger
+
+from universal_mcp_asana.utils import format_timestamp, parse_timestamp
+
+
+class AuditLogTailer:
+    """
+    Streams a workspace's audit log to NDJSON, resuming from a checkpoint file.
+
+    The cursor (`start_at` plus the last `offset` token) is persisted after every
+    page has been written and flushed, so a restarted tailer picks up at the
+    first page it had not finished. When a page ends without an offset the range
+    restarts at its last `created_at`, and the gids already written at that
+    instant are kept in the cursor as `seen` and skipped when they come back.
+    Delivery is at-least-once: a crash between writing a page and saving the
+    checkpoint replays that page. Only one page of events is held in memory at
+    a time.
+    """
+
+    def __init__(
+        self,
+        app: Any,
+        workspace_gid: str,
+        checkpoint_path: str,
+        start_at: str | None = None,
+        end_at: str | None = None,
+        page_size: int = 100,
+        **filters: Any,
+    ) -> None:
+        """
+        Args:
+            app: The `AsanaApp` used to call `get_audit_log_events`.
+            workspace_gid: Workspace whose audit log is read.
+            checkpoint_path: JSON file holding the cursor. Created on the first
+                checkpoint; when it already exists its cursor wins over `start_at`.
+            start_at: Where to start when there is no checkpoint yet.
+            end_at: Optional exclusive upper bound for the events read.
+            page_size: Events requested per page, at most 100.
+            **filters: Extra `get_audit_log_events` filters such as `event_type`,
+                `actor_type`, `actor_gid` or `resource_gid`.
+        """
+        self.app = app
+        self.workspace_gid = workspace_gid
+        self.checkpoint_path = checkpoint_path
+        self.end_at = end_at
+        self.page_size = page_size
+        self.filters = filters
+        self.cursor = self._load_checkpoint() or {"start_at": start_at, "offset": None}
+
+    def _load_checkpoint(self) -> dict[str, Any] | None:
+        try:
+            with open(self.checkpoint_path, encoding="utf-8") as handle:
+                cursor = json.load(handle)
+        except FileNotFoundError:
+            return None
+        logger.debug(f"Resuming audit log tail from checkpoint {cursor}")
+        return cursor
+
+    def _save_checkpoint(self) -> None:
+        temporary = f"{self.checkpoint_path}.tmp"
+        with open(temporary, "w", encoding="utf-8") as handle:
+            json.dump(self.cursor, handle)
+            handle.flush()
+            os.fsync(handle.fileno())
+        os.replace(temporary, self.checkpoint_path)
+
+    def poll(self, output: IO[str]) -> int:
+        """
+        Fetches one page at the current cursor, writes it and advances the checkpoint.
+
+        Args:
+            output: Text stream the events are appended to, one JSON object per line.
+
+        Returns:
+            int: The number of events written, not counting those skipped as already written.
+        """
+        page = self.app.get_audit_log_events(
+            self.workspace_gid,
+            start_at=self.cursor.get("start_at"),
+            end_at=self.end_at,
+            limit=self.page_size,
+            offset=self.cursor.get("offset"),
+            **self.filters,
+        )
+        events = page.get("data") or []
+        start_at, seen = self.cursor.get("start_at"), set(self.cursor.get("seen") or ())
+        fresh = [event for event in events if not (event.get("created_at") == start_at and event.get("gid") in seen)]
+        for event in fresh:
+            output.write(json.dumps(event, separators=(",", ":")))
+            output.write("\n")
+        output.flush()
+        next_page = page.get("next_page") or {}
+        if next_page.get("offset"):
+            self.cursor["offset"] = next_page["offset"]
+        elif events:
+            # No offset to continue from: restart the range at the last event
+            # instead of replaying the whole window. `start_at` is inclusive, so
+            # the events written at that instant are remembered and skipped.
+            last = events[-1]["created_at"]
+            at_last = {event["gid"] for event in events if event.get("created_at") == last}
+            self.cursor = {"start_at": last, "offset": None, "seen": sorted(at_last | seen if last == start_at else at_last)}
+        self._save_checkpoint()
+        return len(fresh)
+
+    def run(self, output: IO[str]) -> int:
+        """
+        Writes every event available right now, stopping at the first short page.
+
+        Args:
+            output: Text stream the events are appended to.
+
+        Returns:
+            int: The number of events written.
+        """
+        written = 0
+        while True:
+            count = self.poll(output)
+            written += count
+            if count < self.page_size:
+                return written
+
+    def follow(
+        self,
+        output: IO[str],
+        min_interval: float = 1.0,
+        max_interval: float = 60.0,
+        stop: threading.Event | None = None,
+    ) -> int:
+        """
+        Tails the audit log until `stop` is set, polling for new events.
+
+        Full pages are fetched back to back. While the log is quiet the wait between
+        polls doubles from `min_interval` up to `max_interval`, and it drops back to
+        `min_interval` as soon as events arrive again.
+
+        Args:
+            output: Text stream the events are appended to.
+            min_interval: Shortest wait between polls, in seconds.
+            max_interval: Longest wait between polls, in seconds.
+            stop: Event that ends the loop when set.
+
+        Returns:
+            int: The number of events written.
+        """
+        stop = stop or threading.Event()
+        written = 0
+        interval = min_interval
+        while not stop.is_set():
+            count = self.poll(output)
+            written += count
+            if count >= self.page_size:
+                interval = min_interval
+                continue
+            interval = min_interval if count else min(interval * 2, max_interval)
+            stop.wait(interval)
+        return written
+
+
+def backfill_audit_log_events(
+    app: Any,
+    workspace_gid: str,
+    start_at: str,
+    end_at: str,
+    shards: int = 32,
+    max_concurrency: int = 4,
+    page_size: int = 100,
+    **filters: Any,
+) -> Iterator[dict[str, Any]]:
+    """
+    Reads a time range of the audit log with parallel offset chains, in timestamp order.
+
+    `[start_at, end_at)` is cut into `shards` consecutive, non-overlapping slices,
+    and `max_concurrency` workers page through them concurrently, each slice to
+    completion. Every slice is spooled to a temporary NDJSON file of its own, so
+    no worker ever waits for the consumer. Once every slice is finished, a k-way
+    heap merge on `created_at` interleaves the spooled streams into one ordered
+    stream. Memory holds one page per worker while paging and one event per
+    slice while merging, however large the range.
+
+    Args:
+        app: The `AsanaApp` used to call `get_audit_log_events`.
+        workspace_gid: Workspace whose audit log is read.
+        start_at: Inclusive start of the range, as an ISO 8601 datetime.
+        end_at: Exclusive end of the range, as an ISO 8601 datetime.
+        shards: Number of time slices the range is cut into.
+        max_concurrency: Number of slices paged through at once, and therefore
+            the cap on concurrent requests.
+        page_size: Events requested per page, at most 100.
+        **filters: Extra `get_audit_log_events` filters.
+
+    Returns:
+        Iterator[dict[str, Any]]: The events ordered by `created_at`.
+    """
+    lower, upper = parse_timestamp(start_at), parse_timestamp(end_at)
+    if lower >= upper:
+        raise ValueError("start_at must be earlier than end_at")
+    step = max((upper - lower) / max(shards, 1), timedelta(milliseconds=1))
+    bounds = []
+    cursor = lower
+    while cursor < upper:
+        bounds.append((cursor, min(cursor + step, upper)))
+        cursor = bounds[-1][1]
+    workers = max(1, min(max_concurrency, len(bounds)))
+    failed = threading.Event()
+
+    def spool(after: datetime, before: datetime) -> IO[str]:
+        spooled = tempfile.TemporaryFile("w+", encoding="utf-8")
+        try:
+            offset = None
+            while not failed.is_set():
+                page = app.get_audit_log_events(
+                    workspace_gid,
+                    start_at=format_timestamp(after),
+                    end_at=format_timestamp(before),
+                    limit=page_size,
+                    offset=offset,
+                    **filters,
+                )
+                events = page.get("data") or []
+                offset = (page.get("next_page") or {}).get("offset")
+                spooled.writelines(json.dumps(event) + "\n" for event in events)
+                # The audit log hands out an offset even at the end of a
+                # range; a short page is what marks the slice as drained.
+                if not offset or len(events) < page_size:
+                    break
+            spooled.seek(0)
+            return spooled
+        except BaseException:
+            failed.set()
+            spooled.close()
+            raise
+
+    logger.debug(f"Backfilling audit log {start_at}..{end_at} in {len(bounds)} slices on {workers} workers")
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="asana-audit-backfill") as pool:
+        futures = [pool.submit(spool, after, before) for after, before in bounds]
+        wait(futures)
+    spools = [future.result() for future in futures if future.exception() is None]
+    try:
+        for future in futures:
+            if future.exception() is not None:
+                raise future.exception()
+        streams = [(json.loads(line) for line in spooled) for spooled in spools]
+        yield from heapq.merge(*streams, key=lambda event: event["created_at"])
+    finally:
+        for spooled in spools:
+            spooled.close()
@@ -0,0 +1,337 @@
+import re
+import threading
+import time
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from itertools import islice
+from typing import Any
+
+import httpx
+from loguru import logger
+
+MAX_BATCH_ACTIONS = 10
+RETRYABLE_STATUS = {429, 500, 502, 503, 504}
+
+# Single-resource reads such as /tasks/123 or /users/me.
+BATCHABLE_PATH = re.compile(r"^/[a-z_]+/[^/]+$")
+
+# Query parameters that map onto batch action options; requests carrying any
+# other parameter are sent directly.
+_OPTION_PARAMS = {"opt_fields": "fields", "opt_pretty": "pretty"}
+
+# Resource types `hydrate` can fetch, mapped to their collection path.
+HYDRATABLE_RESOURCES = {
+    "allocation": "allocations",
+    "attachment": "attachments",
+    "custom_field": "custom_fields",
+    "goal": "goals",
+    "goal_relationship": "goal_relationships",
+    "membership": "memberships",
+    "portfolio": "portfolios",
+    "portfolio_membership": "portfolio_memberships",
+    "project": "projects",
+    "project_brief": "project_briefs",
+    "project_membership": "project_memberships",
+    "project_status": "project_statuses",
+    "project_template": "project_templates",
+    "section": "sections",
+    "status_update": "status_updates",
+    "story": "stories",
+    "tag": "tags",
+    "task": "tasks",
+    "task_template": "task_templates",
+    "team": "teams",
+    "team_membership": "team_memberships",
+    "time_period": "time_periods",
+    "time_tracking_entry": "time_tracking_entries",
+    "user": "users",
+    "user_task_list": "user_task_lists",
+    "webhook": "webhooks",
+    "workspace": "workspaces",
+    "workspace_membership": "workspace_memberships",
+}
+
+
+class BatchDispatcher:
+    """
+    Packs concurrent single-resource GETs into `/batch` requests.
+
+    The first request to arrive opens a collection window of `window` seconds.
+    Requests arriving within it join the same batch, which is sent as soon as it
+    holds `max_actions` actions or when the window closes, whichever is first.
+    Every caller blocks until its own action's result is routed back, so the
+    dispatcher is transparent to code running on several threads but only adds
+    latency to a caller issuing requests one after another.
+    """
+
+    def __init__(self, app: Any, window: float = 0.005, max_actions: int = MAX_BATCH_ACTIONS) -> None:
+        """
+        Args:
+            app: The `AsanaApp` whose `submit_parallel_requests` sends the batches.
+            window: Seconds to hold the first request of a batch for others to join.
+            max_actions: Actions per batch, at most 10.
+        """
+        self.app = app
+        self.window = window
+        self.max_actions = min(max_actions, MAX_BATCH_ACTIONS)
+        self._lock = threading.Lock()
+        self._pending: list[tuple[dict[str, Any], Future]] = []
+        self._generation = 0
+
+    def action_for(self, url: str, params: dict[str, Any] | None) -> dict[str, Any] | None:
+        """
+        Builds the batch action for a GET, or returns None if it cannot be batched.
+
+        Args:
+            url: Absolute request URL under the app's `base_url`.
+            params: Query parameters of the request.
+
+        Returns:
+            dict[str, Any] | None: The action for `/batch`, or None.
+        """
+        if not url.startswith(self.app.base_url):
+            return None
+        relative_path = url[len(self.app.base_url) :]
+        if not BATCHABLE_PATH.match(relative_path):
+            return None
+        params = params or {}
+        if not params.keys() <= _OPTION_PARAMS.keys():
+            return None
+        options = {}
+        if "opt_fields" in params:
+            options["fields"] = [field for field in str(params["opt_fields"]).split(",") if field]
+        if "opt_pretty" in params:
+            options["pretty"] = params["opt_pretty"] in (True, "true")
+        action = {"relative_path": relative_path, "method": "get"}
+        if options:
+            action["options"] = options
+        return action
+
+    def get(self, url: str, params: dict[str, Any] | None = None) -> httpx.Response | None:
+        """
+        Sends a GET through the next batch and waits for its result.
+
+        Args:
+            url: Absolute request URL.
+            params: Query parameters of the request.
+
+        Returns:
+            httpx.Response | None: The response rebuilt from the batch result, or None
+            when the request is not batchable and should be sent directly.
+
+        Raises:
+            httpx.HTTPStatusError: If the batched action failed.
+        """
+        action = self.action_for(url, params)
+        if action is None:
+            return None
+        result = self.submit(action).result()
+        response = httpx.Response(
+            result.get("status_code", 500),
+            json=result.get("body"),
+            request=httpx.Request("GET", url, params=params),
+        )
+        response.raise_for_status()
+        return response
+
+    def submit(self, action: dict[str, Any]) -> Future:
+        """
+        Queues an action for the next batch.
+
+        Args:
+            action: A `/batch` action.
+
+        Returns:
+            Future: Resolves to the action's `{status_code, headers, body}` result.
+        """
+        future = Future()
+        batch = None
+        with self._lock:
+            self._pending.append((action, future))
+            if len(self._pending) >= self.max_actions:
+                batch = self._take()
+            elif len(self._pending) == 1:
+                timer = threading.Timer(self.window, self._flush_due, args=(self._generation,))
+                timer.daemon = True
+                timer.start()
+        if batch:
+            threading.Thread(target=self._send, args=(batch,), name="asana-batch", daemon=True).start()
+        return future
+
+    def _take(self) -> list[tuple[dict[str, Any], Future]]:
+        batch, self._pending = self._pending, []
+        self._generation += 1
+        return batch
+
+    def _flush_due(self, generation: int) -> None:
+        with self._lock:
+            # A full batch may already have been sent, and a new window opened,
+            # since this timer was armed.
+            if generation != self._generation or not self._pending:
+                return
+            batch = self._take()
+        self._send(batch)
+
+    def _send(self, batch: list[tuple[dict[str, Any], Future]]) -> None:
+        logger.debug(f"Sending {len(batch)} batched GET requests")
+        try:
+            response = self.app.submit_parallel_requests(data={"actions": [action for action, _ in batch]})
+            results = response.get("data") or []
+            if len(results) != len(batch):
+                raise ValueError(f"Batch returned {len(results)} results for {len(batch)} actions")
+            for (_, future), result in zip(batch, results, strict=True):
+                future.set_result(result)
+        except Exception as exc:
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(exc)
+
+
+class SingleFlight:
+    """
+    Coalesces concurrent identical calls into one.
+
+    The first caller for a key runs the call; callers arriving with the same
+    key while it is in flight wait for it and receive the same result, or the
+    same exception. Once it completes the key is forgotten, so later callers
+    start a new call.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._flights: dict[Any, Future] = {}
+        self.coalesced = 0
+
+    def do(self, key: Any, call: Callable[[], Any]) -> Any:
+        """
+        Runs `call`, or joins the call already in flight for `key`.
+
+        Args:
+            key: Hashable identity of the call.
+            call: Produces the result when this caller leads.
+
+        Returns:
+            Any: The result shared by everyone who asked for `key` meanwhile.
+        """
+        with self._lock:
+            flight = self._flights.get(key)
+            leader = flight is None
+            if leader:
+                flight = self._flights[key] = Future()
+            else:
+                self.coalesced += 1
+        if not leader:
+            return flight.result()
+        try:
+            flight.set_result(call())
+        except BaseException as exc:
+            flight.set_exception(exc)
+        finally:
+            with self._lock:
+                if self._flights.get(key) is flight:
+                    del self._flights[key]
+        return flight.result()
+
+    def forget(self) -> None:
+        """Lets later callers start new calls instead of joining those in flight, e.g. after a write."""
+        with self._lock:
+            self._flights.clear()
+
+
+def execute_batched(
+    app: Any,
+    items: Iterable[tuple[Any, dict[str, Any]]],
+    max_concurrency: int = 4,
+    max_retries: int = 3,
+    backoff: float = 1.0,
+    retry_statuses: frozenset[int] | set[int] = RETRYABLE_STATUS,
+) -> Iterator[tuple[Any, dict[str, Any]]]:
+    """
+    Runs a stream of `/batch` actions in chunks of 10 on a bounded thread pool.
+
+    Chunks are submitted as pool capacity frees up, so an arbitrarily long
+    iterable is never materialised. Actions that come back rate limited or with
+    a server error, including every action of a `/batch` call that failed as a
+    whole, are collected and retried in further rounds, after waiting for the
+    longest `Retry-After` seen or an exponential backoff. Only those actions are
+    resent; the rest of their chunk is not. A `/batch` response that cannot be
+    read at all fails each of its actions without a status code and without a
+    retry, since they may have run.
+
+    Args:
+        app: The `AsanaApp` whose `submit_parallel_requests` sends the chunks.
+        items: `(key, action)` pairs; the key is handed back with the result.
+        max_concurrency: Number of `/batch` requests in flight at once.
+        max_retries: Extra rounds for retryable failures before giving up.
+        backoff: Base wait in seconds before a retry round, doubled every round.
+        retry_statuses: Status codes that are retried. Writes that must not run
+            twice pass `{429}`, since a server error, or a transport error
+            reported as 503, may come after the action already ran.
+
+    Returns:
+        Iterator[tuple[Any, dict[str, Any]]]: `(key, result)` pairs in completion
+        order, where `result` holds the final `status_code` and `body`.
+    """
+    attempt = 0
+    round_items = iter(items)
+    while True:
+        retry = []
+        delay = 0.0
+        for (key, action), result in _run_round(app, round_items, max(1, max_concurrency)):
+            if result.get("status_code") in retry_statuses and attempt < max_retries:
+                retry.append((key, action))
+                delay = max(delay, _retry_after(result))
+            else:
+                yield key, result
+        if not retry:
+            return
+        attempt += 1
+        delay = max(delay, backoff * 2 ** (attempt - 1))
+        logger.debug(f"Retrying {len(retry)} batched actions in {delay:.1f}s (round {attempt}/{max_retries})")
+        time.sleep(delay)
+        round_items = iter(retry)
+
+
+def _run_round(app: Any, items: Iterator[tuple[Any, dict[str, Any]]], max_concurrency: int) -> Iterator[tuple]:
+    def send(chunk: list[tuple[Any, dict[str, Any]]]) -> list[tuple]:
+        try:
+            response = app.submit_parallel_requests(data={"actions": [action for _, action in chunk]})
+            results = response.get("data") or []
+            if len(results) != len(chunk):
+                raise ValueError(f"Batch returned {len(results)} results for {len(chunk)} actions")
+            return list(zip(chunk, results, strict=True))
+        except httpx.HTTPStatusError as exc:
+            result = {
+                "status_code": exc.response.status_code,
+                "headers": dict(exc.response.headers),
+                "body": {"errors": [{"message": str(exc)}]},
+            }
+        except httpx.TransportError as exc:
+            result = {"status_code": 503, "body": {"errors": [{"message": str(exc)}]}}
+        except Exception as exc:
+            # A malformed or undecodable response: it is not known whether the
+            # actions ran, so they are reported rather than resent.
+            result = {"status_code": None, "body": {"errors": [{"message": f"{type(exc).__name__}: {exc}"}]}}
+        return [(item, result) for item in chunk]
+
+    with ThreadPoolExecutor(max_workers=max_concurrency, thread_name_prefix="asana-batch") as pool:
+        in_flight = set()
+        while True:
+            while len(in_flight) < max_concurrency:
+                chunk = list(islice(items, MAX_BATCH_ACTIONS))
+                if not chunk:
+                    break
+                in_flight.add(pool.submit(send, chunk))
+            if not in_flight:
+                return
+            done, in_flight = wait(in_flight, return_when=FIRST_COMPLETED)
+            for future in done:
+                yield from future.result()
+
+
+def _retry_after(result: dict[str, Any]) -> float:
+    headers = {name.lower(): value for name, value in (result.get("headers") or {}).items()}
+    try:
+        return float(headers.get("retry-after", 0))
+    except ValueError:
+        return 0.0
@@ -0,0 +1,808 @@
+import json
+import re
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Iterable
+from dataclasses import dataclass, field
+from typing import Any
+
+import httpx
+from loguru import logger
+
+# Seconds a response stays fresh, by the kind of resource it returns. Kinds
+# mapped to 0 are never cached: the events and audit log endpoints are cursors
+# rather than resources, and jobs and exports are polled for progress.
+DEFAULT_TTLS = {
+    "workspaces": 3600,
+    "time_periods": 3600,
+    "users": 900,
+    "teams": 900,
+    "custom_fields": 900,
+    "custom_field_settings": 300,
+    "tags": 300,
+    "portfolios": 120,
+    "projects": 120,
+    "sections": 120,
+    "tasks": 30,
+    "subtasks": 30,
+    "stories": 30,
+    "typeahead": 10,
+    "events": 0,
+    "audit_log_events": 0,
+    "jobs": 0,
+    "organization_exports": 0,
+}
+DEFAULT_TTL = 60
+DEFAULT_MAX_BYTES = 32 * 1024 * 1024
+
+# Seconds a response stays fresh on disk, by kind. Only these kinds change so
+# rarely that serving them across restarts is worth it.
+PERSISTENT_TTLS = {
+    "workspaces": 86400,
+    "time_periods": 86400,
+    "users": 21600,
+    "teams": 21600,
+    "custom_fields": 21600,
+}
+
+# Query parameters that change how a response is printed but not what it holds.
+_IGNORED_PARAMS = {"opt_pretty"}
+_ID_SEGMENTS = {"me", "search"}
+
+# What every mutating endpoint touches besides the resources it names. Entries
+# whose path, query or top-level records mention a gid from the mutation's
+# path, request body or response are always evicted; the kinds listed here are
+# the listings whose membership or order can change without mentioning any of
+# those gids, such as a workspace's tag list gaining a new tag. All cached
+# listings of those kinds are evicted.
+MUTATION_EFFECTS: dict[tuple[str, str], tuple[str, ...]] = {
+    ("POST", "/allocations"): ("allocations",),
+    ("PUT", "/allocations/{allocation_gid}"): (),
+    ("DELETE", "/allocations/{allocation_gid}"): (),
+    ("DELETE", "/attachments/{attachment_gid}"): (),
+    ("POST", "/custom_fields"): ("custom_fields",),
+    ("PUT", "/custom_fields/{custom_field_gid}"): ("custom_field_settings",),
+    ("DELETE", "/custom_fields/{custom_field_gid}"): ("custom_field_settings",),
+    ("POST", "/custom_fields/{custom_field_gid}/enum_options"): ("custom_field_settings",),
+    ("POST", "/custom_fields/{custom_field_gid}/enum_options/insert"): ("custom_field_settings",),
+    ("PUT", "/enum_options/{enum_option_gid}"): ("custom_fields", "custom_field_settings"),
+    ("POST", "/goals"): ("goals",),
+    ("PUT", "/goals/{goal_gid}"): ("goals",),
+    ("DELETE", "/goals/{goal_gid}"): ("goal_relationships", "parentGoals"),
+    ("POST", "/goals/{goal_gid}/setMetric"): (),
+    ("POST", "/goals/{goal_gid}/setMetricCurrentValue"): (),
+    ("POST", "/goals/{goal_gid}/addFollowers"): (),
+    ("POST", "/goals/{goal_gid}/removeFollowers"): (),
+    ("POST", "/goals/{goal_gid}/addSupportingRelationship"): ("goal_relationships", "parentGoals"),
+    ("POST", "/goals/{goal_gid}/removeSupportingRelationship"): ("goal_relationships", "parentGoals"),
+    ("PUT", "/goal_relationships/{goal_relationship_gid}"): (),
+    ("POST", "/memberships"): ("memberships", "project_memberships", "portfolio_memberships"),
+    ("PUT", "/memberships/{membership_gid}"): ("project_memberships", "portfolio_memberships"),
+    ("DELETE", "/memberships/{membership_gid}"): ("project_memberships", "portfolio_memberships"),
+    ("POST", "/organization_exports"): (),
+    ("POST", "/portfolios"): ("portfolios",),
+    ("PUT", "/portfolios/{portfolio_gid}"): ("portfolios",),
+    ("DELETE", "/portfolios/{portfolio_gid}"): (),
+    ("POST", "/portfolios/{portfolio_gid}/addItem"): ("portfolios",),
+    ("POST", "/portfolios/{portfolio_gid}/removeItem"): ("portfolios",),
+    ("POST", "/portfolios/{portfolio_gid}/addCustomFieldSetting"): (),
+    ("POST", "/portfolios/{portfolio_gid}/removeCustomFieldSetting"): (),
+    ("POST", "/portfolios/{portfolio_gid}/addMembers"): ("portfolios", "memberships", "portfolio_memberships"),
+    ("POST", "/portfolios/{portfolio_gid}/removeMembers"): ("portfolios", "memberships", "portfolio_memberships"),
+    ("POST", "/projects"): ("projects", "typeahead"),
+    ("PUT", "/projects/{project_gid}"): ("projects", "typeahead"),
+    ("DELETE", "/projects/{project_gid}"): ("typeahead",),
+    ("POST", "/projects/{project_gid}/duplicate"): ("projects", "typeahead"),
+    ("POST", "/teams/{team_gid}/projects"): ("projects", "typeahead"),
+    ("POST", "/workspaces/{workspace_gid}/projects"): ("projects", "typeahead"),
+    ("POST", "/projects/{project_gid}/addCustomFieldSetting"): (),
+    ("POST", "/projects/{project_gid}/removeCustomFieldSetting"): (),
+    ("POST", "/projects/{project_gid}/addMembers"): ("projects", "memberships", "project_memberships"),
+    ("POST", "/projects/{project_gid}/removeMembers"): ("projects", "memberships", "project_memberships"),
+    ("POST", "/projects/{project_gid}/addFollowers"): ("project_memberships",),
+    ("POST", "/projects/{project_gid}/removeFollowers"): ("project_memberships",),
+    ("POST", "/projects/{project_gid}/saveAsTemplate"): ("project_templates",),
+    ("PUT", "/project_briefs/{project_brief_gid}"): (),
+    ("DELETE", "/project_briefs/{project_brief_gid}"): (),
+    ("POST", "/projects/{project_gid}/project_briefs"): (),
+    ("DELETE", "/project_statuses/{project_status_gid}"): ("status_updates",),
+    ("POST", "/projects/{project_gid}/project_statuses"): ("status_updates",),
+    ("DELETE", "/project_templates/{project_template_gid}"): (),
+    ("POST", "/project_templates/{project_template_gid}/instantiateProject"): ("projects", "typeahead"),
+    ("POST", "/rule_triggers/{rule_trigger_gid}/run"): ("tasks", "subtasks", "stories", "task_counts"),
+    ("PUT", "/sections/{section_gid}"): (),
+    ("DELETE", "/sections/{section_gid}"): ("tasks",),
+    ("POST", "/projects/{project_gid}/sections"): (),
+    ("POST", "/sections/{section_gid}/addTask"): (),
+    ("POST", "/projects/{project_gid}/sections/insert"): (),
+    ("POST", "/status_updates"): ("status_updates", "project_statuses"),
+    ("DELETE", "/status_updates/{status_update_gid}"): ("project_statuses",),
+    ("PUT", "/stories/{story_gid}"): (),
+    ("DELETE", "/stories/{story_gid}"): (),
+    ("POST", "/tasks/{task_gid}/stories"): (),
+    ("POST", "/tags"): ("tags", "typeahead"),
+    ("PUT", "/tags/{tag_gid}"): ("typeahead",),
+    ("DELETE", "/tags/{tag_gid}"): ("typeahead",),
+    ("POST", "/workspaces/{workspace_gid}/tags"): ("tags", "typeahead"),
+    # Task listings are mostly filtered views (assignee, completion, search), and
+    # an edited task can start matching a view that did not include it before.
+    ("POST", "/tasks"): ("tasks", "task_counts", "typeahead"),
+    ("PUT", "/tasks/{task_gid}"): ("tasks", "task_counts", "typeahead"),
+    ("DELETE", "/tasks/{task_gid}"): ("task_counts", "typeahead"),
+    ("POST", "/tasks/{task_gid}/duplicate"): ("tasks", "task_counts", "typeahead"),
+    ("POST", "/tasks/{task_gid}/subtasks"): ("task_counts",),
+    ("POST", "/tasks/{task_gid}/setParent"): ("subtasks",),
+    ("POST", "/tasks/{task_gid}/addDependencies"): (),
+    ("POST", "/tasks/{task_gid}/removeDependencies"): (),
+    ("POST", "/tasks/{task_gid}/addDependents"): (),
+    ("POST", "/tasks/{task_gid}/removeDependents"): (),
+    ("POST", "/tasks/{task_gid}/addProject"): ("task_counts",),
+    ("POST", "/tasks/{task_gid}/removeProject"): ("task_counts",),
+    ("POST", "/tasks/{task_gid}/addTag"): (),
+    ("POST", "/tasks/{task_gid}/removeTag"): (),
+    ("POST", "/tasks/{task_gid}/addFollowers"): (),
+    ("POST", "/tasks/{task_gid}/removeFollowers"): (),
+    ("DELETE", "/task_templates/{task_template_gid}"): (),
+    ("POST", "/task_templates/{task_template_gid}/instantiateTask"): ("tasks", "task_counts", "typeahead"),
+    ("POST", "/teams"): ("teams",),
+    ("PUT", "/teams/{team_gid}"): (),
+    ("POST", "/teams/{team_gid}/addUser"): ("teams", "users", "team_memberships"),
+    ("POST", "/teams/{team_gid}/removeUser"): ("teams", "users", "team_memberships"),
+    ("POST", "/tasks/{task_gid}/time_tracking_entries"): (),
+    ("PUT", "/time_tracking_entries/{time_tracking_entry_gid}"): (),
+    ("DELETE", "/time_tracking_entries/{time_tracking_entry_gid}"): (),
+    ("POST", "/webhooks"): ("webhooks",),
+    ("PUT", "/webhooks/{webhook_gid}"): (),
+    ("DELETE", "/webhooks/{webhook_gid}"): (),
+    ("PUT", "/workspaces/{workspace_gid}"): (),
+    ("POST", "/workspaces/{workspace_gid}/addUser"): ("users", "workspace_memberships", "typeahead"),
+    ("POST", "/workspaces/{workspace_gid}/removeUser"): ("users", "workspace_memberships", "typeahead"),
+}
+
+_MUTATION_PATTERNS = [
+    (verb, re.compile("^" + re.sub(r"\\{\w+\\}", "[^/]+", re.escape(template)) + "$"), kinds)
+    for (verb, template), kinds in MUTATION_EFFECTS.items()
+]
+
+
+def resource_kind(url: str) -> str:
+    """
+    Names the kind of resource a URL returns: its last path segment that is not an id.
+
+    `/tasks/123`, `/projects/123/tasks` and `/workspaces/123/tasks/search` are all
+    `tasks`; `/users/me` is `users`.
+    """
+    for segment in reversed(httpx.URL(url).path.split("/")):
+        if segment and not segment.isdigit() and segment not in _ID_SEGMENTS:
+            return segment
+    return ""
+
+
+def cache_key(url: str, params: dict[str, Any] | None) -> tuple:
+    """
+    Builds the cache key of a GET from its URL and normalized query parameters.
+
+    Parameter order does not matter, `opt_pretty` is ignored, and `opt_fields` is
+    compared as a set of field names.
+    """
+    normalized = []
+    for name, value in (params or {}).items():
+        if name in _IGNORED_PARAMS or value is None:
+            continue
+        if name == "opt_fields":
+            value = ",".join(sorted({field.strip() for field in str(value).split(",") if field.strip()}))
+        normalized.append((name, str(value)))
+    return (str(httpx.URL(url).copy_with(query=None)), tuple(sorted(normalized)))
+
+
+def mutation_effects(verb: str, relative_path: str) -> tuple[str, ...] | None:
+    """
+    Looks up the listing kinds a mutation touches in `MUTATION_EFFECTS`.
+
+    Args:
+        verb: HTTP method of the mutation.
+        relative_path: Request path relative to the API base URL, such as `/tasks/123/addTag`.
+
+    Returns:
+        tuple[str, ...] | None: The kinds, or None for an undeclared mutation.
+    """
+    verb = verb.upper()
+    for pattern_verb, pattern, kinds in _MUTATION_PATTERNS:
+        if pattern_verb == verb and pattern.match(relative_path):
+            return kinds
+    return None
+
+
+def referenced_gids(value: Any) -> set[str]:
+    """Collects every all-digit string in a request or response body, at any depth."""
+    found = set()
+    stack = [value]
+    while stack:
+        value = stack.pop()
+        if isinstance(value, dict):
+            stack.extend(value.values())
+        elif isinstance(value, list):
+            stack.extend(value)
+        elif isinstance(value, str) and value.isdigit():
+            found.add(value)
+    return found
+
+
+@dataclass
+class CacheEntry:
+    content: bytes
+    expires_at: float
+    gids: frozenset[str] = field(default_factory=frozenset)
+    listing: str | None = None
+
+
+class PersistentStore:
+    """
+    SQLite file holding cached responses of slow-changing kinds across restarts.
+
+    Rows carry a wall-clock expiry taken from the per-kind freshness window and
+    the gids they are about, so writes invalidate them just like in-memory
+    entries. The file caches whatever the credentials that filled it could
+    see, and must not be shared between users.
+    """
+
+    def __init__(self, path: str, ttls: dict[str, float] | None = None) -> None:
+        """
+        Args:
+            path: The SQLite database file, created if missing.
+            ttls: Per-kind freshness windows in seconds, merged over
+                `PERSISTENT_TTLS`. 0 keeps a kind off disk.
+        """
+        self.path = path
+        self.ttls = {**PERSISTENT_TTLS, **(ttls or {})}
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(path, check_same_thread=False)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.executescript(
+            """
+            CREATE TABLE IF NOT EXISTS entries (
+                key TEXT PRIMARY KEY, listing TEXT, content BLOB NOT NULL, expires_at REAL NOT NULL
+            );
+            CREATE TABLE IF NOT EXISTS entry_gids (gid TEXT NOT NULL, key TEXT NOT NULL);
+            CREATE INDEX IF NOT EXISTS entry_gids_by_gid ON entry_gids (gid);
+            CREATE INDEX IF NOT EXISTS entry_gids_by_key ON entry_gids (key);
+            CREATE INDEX IF NOT EXISTS entries_by_listing ON entries (listing);
+            """
+        )
+        self.purge_expired()
+
+    def ttl_for(self, url: str) -> float:
+        return self.ttls.get(resource_kind(url), 0)
+
+    def get(self, key: tuple) -> tuple[bytes, float] | None:
+        """Returns the content and wall-clock expiry stored under `key`, or None."""
+        with self._lock:
+            row = self._db.execute(
+                "SELECT content, expires_at FROM entries WHERE key = ?", (_serialize_key(key),)
+            ).fetchone()
+        if row is None or row[1] <= time.time():
+            return None
+        return bytes(row[0]), row[1]
+
+    def put(self, key: tuple, entry: CacheEntry) -> None:
+        """Stores an entry under `key` with the freshness window of its kind."""
+        ttl = self.ttl_for(key[0])
+        if ttl <= 0:
+            return
+        serialized = _serialize_key(key)
+        with self._lock, self._db:
+            self._db.execute("DELETE FROM entry_gids WHERE key = ?", (serialized,))
+            self._db.execute(
+                "INSERT OR REPLACE INTO entries (key, listing, content, expires_at) VALUES (?, ?, ?, ?)",
+                (serialized, entry.listing, entry.content, time.time() + ttl),
+            )
+            self._db.executemany(
+                "INSERT INTO entry_gids (gid, key) VALUES (?, ?)", [(gid, serialized) for gid in entry.gids]
+            )
+
+    def remove(self, gids: Iterable[str] = (), kinds: Iterable[str] = ()) -> int:
+        """
+        Deletes the rows about any of `gids` and the listings of any of `kinds`.
+
+        Returns:
+            int: The number of rows deleted.
+        """
+        gids, kinds = list(gids), list(kinds)
+        with self._lock, self._db:
+            keys = set()
+            for gid in gids:
+                keys.update(key for (key,) in self._db.execute("SELECT key FROM entry_gids WHERE gid = ?", (gid,)))
+            for kind in kinds:
+                keys.update(key for (key,) in self._db.execute("SELECT key FROM entries WHERE listing = ?", (kind,)))
+            self._delete(keys)
+        return len(keys)
+
+    def purge_expired(self) -> None:
+        with self._lock, self._db:
+            expired = [key for (key,) in self._db.execute("SELECT key FROM entries WHERE expires_at <= ?", (time.time(),))]
+            self._delete(expired)
+
+    def clear(self) -> None:
+        with self._lock, self._db:
+            self._db.execute("DELETE FROM entries")
+            self._db.execute("DELETE FROM entry_gids")
+
+    def count(self) -> int:
+        with self._lock:
+            return self._db.execute("SELECT COUNT(*) FROM entries").fetchone()[0]
+
+    def close(self) -> None:
+        with self._lock:
+            self._db.close()
+
+    def _delete(self, keys: Iterable[str]) -> None:
+        rows = [(key,) for key in keys]
+        self._db.executemany("DELETE FROM entries WHERE key = ?", rows)
+        self._db.executemany("DELETE FROM entry_gids WHERE key = ?", rows)
+
+
+class ResponseCache:
+    """
+    In-process TTL and LRU cache of successful GET responses.
+
+    Entries expire after the TTL of the kind of resource they hold, and the
+    least recently used entries are evicted once the cached response bodies
+    exceed `max_bytes`. Hit, miss and eviction counters are kept for `stats`.
+
+    Every entry is indexed by the gids it is about: those in its URL and query,
+    and those of the records it returns. `invalidate` evicts by gid and
+    `invalidate_kinds` evicts whole kinds of listings, which is how writes keep
+    the cache coherent (see `apply_mutation`). Each invalidation bumps
+    `generation`; a response fetched across one is not stored, since it may
+    predate the write.
+
+    With a `PersistentStore`, responses of the kinds it keeps are also written
+    to disk, and a memory miss falls back to it before going to the network.
+    """
+
+    def __init__(
+        self,
+        ttls: dict[str, float] | None = None,
+        default_ttl: float = DEFAULT_TTL,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+        persistent: PersistentStore | None = None,
+    ) -> None:
+        """
+        Args:
+            ttls: Per-kind TTLs in seconds, merged over `DEFAULT_TTLS`. 0 disables
+                caching for a kind.
+            default_ttl: TTL for kinds not listed in the TTL table.
+            max_bytes: Upper bound on the total size of cached response bodies.
+            persistent: Optional disk tier for slow-changing kinds.
+        """
+        self.ttls = {**DEFAULT_TTLS, **(ttls or {})}
+        self.default_ttl = default_ttl
+        self.max_bytes = max_bytes
+        self.persistent = persistent
+        self._entries: OrderedDict[tuple, CacheEntry] = OrderedDict()
+        self._lock = threading.Lock()
+        self._size = 0
+        self._by_gid: dict[str, set[tuple]] = {}
+        self._by_listing: dict[str, set[tuple]] = {}
+        self._by_base: dict[tuple, dict[tuple, frozenset[str]]] = {}
+        self.generation = 0
+        self.hits = 0
+        self.misses = 0
+        self.disk_hits = 0
+        self.projected_hits = 0
+        self.evictions = 0
+        self.invalidations = 0
+
+    def ttl_for(self, url: str) -> float:
+        return self.ttls.get(resource_kind(url), self.default_ttl)
+
+    def get(self, url: str, params: dict[str, Any] | None = None) -> httpx.Response | None:
+        """
+        Returns a cached response for a GET, or None on a miss.
+
+        Args:
+            url: Absolute request URL.
+            params: Query parameters of the request.
+
+        Returns:
+            httpx.Response | None: A fresh response object rebuilt from the cached body.
+        """
+        content = self._lookup(cache_key(url, params))
+        if content is None:
+            return None
+        return httpx.Response(
+            200,
+            content=content,
+            headers={"content-type": "application/json"},
+            request=httpx.Request("GET", url, params=params),
+        )
+
+    def get_json(self, url: str, params: dict[str, Any] | None = None) -> Any | None:
+        """Returns the parsed body cached for a GET, or None on a miss."""
+        content = self._lookup(cache_key(url, params))
+        return None if content is None else json.loads(content)
+
+    def put(
+        self,
+        url: str,
+        params: dict[str, Any] | None,
+        response: httpx.Response,
+        generation: int | None = None,
+    ) -> None:
+        """
+        Caches a GET response if it succeeded and its kind of resource is cacheable.
+
+        Args:
+            url: Absolute request URL.
+            params: Query parameters of the request.
+            response: The response received for it.
+            generation: `generation` as read before the request was sent. The
+                response is dropped if anything was invalidated since.
+        """
+        if response.status_code == 200:
+            self._store(url, params, response.content, generation)
+
+    def put_json(self, url: str, params: dict[str, Any] | None, payload: Any, generation: int | None = None) -> None:
+        """Caches `payload` as the body of a successful GET of `url`."""
+        self._store(url, params, json.dumps(payload, separators=(",", ":")).encode(), generation)
+
+    def invalidate(self, gids: Iterable[str]) -> int:
+        """
+        Evicts every entry about any of `gids`.
+
+        Args:
+            gids: Resource gids that changed.
+
+        Returns:
+            int: The number of entries evicted.
+        """
+        with self._lock:
+            keys = set()
+            gids = {str(gid) for gid in gids}
+            for gid in gids:
+                keys |= self._by_gid.get(gid, set())
+            evicted = self._invalidate(keys)
+            if self.persistent is not None and gids:
+                self.persistent.remove(gids=gids)
+            return evicted
+
+    def invalidate_kinds(self, kinds: Iterable[str]) -> int:
+        """
+        Evicts every cached listing of the given kinds, such as `tasks` or `tags`.
+
+        Single-resource entries like `/tasks/123` are kept.
+
+        Returns:
+            int: The number of entries evicted.
+        """
+        with self._lock:
+            keys = set()
+            kinds = set(kinds)
+            for kind in kinds:
+                keys |= self._by_listing.get(kind, set())
+            evicted = self._invalidate(keys)
+            if self.persistent is not None and kinds:
+                self.persistent.remove(kinds=kinds)
+            return evicted
+
+    def invalidate_subtree(self, gid: str) -> int:
+        """
+        Evicts every entry that mentions `gid` anywhere, including as a nested reference.
+
+        This scans every cached body, and is meant for when changes to a resource
+        and everything under it may have been missed.
+
+        Returns:
+            int: The number of entries evicted.
+        """
+        gid = str(gid)
+        needle = f'"{gid}"'.encode()
+        with self._lock:
+            keys = set(self._by_gid.get(gid, set()))
+            keys.update(key for key, entry in self._entries.items() if needle in entry.content)
+            evicted = self._invalidate(keys)
+            if self.persistent is not None:
+                self.persistent.remove(gids=[gid])
+            return evicted
+
+    def subjects(self, collections: Iterable[str]) -> list[str]:
+        """
+        Lists the gids cached entries are about, most recently used first.
+
+        An entry is about `/{collection}/{gid}` when its path starts there, as
+        `/projects/1` and `/projects/1/tasks` do, or when it filters on it, as
+        `/tasks?project=1` does.
+
+        Args:
+            collections: Plural resource types such as `projects` or `tasks`.
+
+        Returns:
+            list[str]: The gids, without duplicates.
+        """
+        collections = set(collections)
+        params = {collection[:-1] for collection in collections}
+        found: dict[str, None] = {}
+        with self._lock:
+            keys = list(reversed(self._entries))
+        for url, query in keys:
+            segments = [segment for segment in httpx.URL(url).path.split("/") if segment]
+            for collection, gid in zip(segments, segments[1:]):
+                if collection in collections and gid.isdigit():
+                    found.setdefault(gid)
+                    break
+            for name, value in query:
+                if name in params and value.isdigit():
+                    found.setdefault(value)
+        return list(found)
+
+    def extend(self, gid: str, ttl: float) -> None:
+        """Keeps the entries about `gid` fresh for at least `ttl` more seconds."""
+        expires_at = time.monotonic() + ttl
+        gid = str(gid)
+        with self._lock:
+            for key in self._by_gid.get(gid, ()):
+                if gid in _subject_gids(key):
+                    entry = self._entries[key]
+                    entry.expires_at = max(entry.expires_at, expires_at)
+
+    def apply_mutation(
+        self,
+        verb: str,
+        relative_path: str,
+        url: str,
+        params: dict[str, Any] | None = None,
+        body: Any = None,
+        payload: Any = None,
+    ) -> int:
+        """
+        Brings the cache in line with a successful write.
+
+        Entries about any gid in the write's path, request body or response are
+        evicted, along with the listings `MUTATION_EFFECTS` declares for it. An
+        undeclared write clears the whole cache. A PUT that returns the updated
+        record also stores it as the cached GET of that record, so reading it
+        back right away is a hit that reflects the write.
+
+        Args:
+            verb: HTTP method of the write.
+            relative_path: Request path relative to the API base URL.
+            url: Absolute request URL.
+            params: Query parameters of the write.
+            body: The JSON request body.
+            payload: The parsed JSON response.
+
+        Returns:
+            int: The number of entries evicted.
+        """
+        kinds = mutation_effects(verb, relative_path)
+        if kinds is None:
+            logger.debug(f"No cache effects declared for {verb} {relative_path}; clearing the response cache")
+            with self._lock:
+                if self.persistent is not None:
+                    self.persistent.clear()
+                return self._invalidate(set(self._entries))
+        gids = {segment for segment in relative_path.split("/") if segment.isdigit()}
+        gids |= referenced_gids(body) | _record_gids(payload)
+        evicted = self.invalidate(gids) + self.invalidate_kinds(kinds)
+        record = payload.get("data") if isinstance(payload, dict) else None
+        if verb.upper() == "PUT" and isinstance(record, dict) and record.get("gid") in gids:
+            self.put_json(url, params, {"data": record})
+        return evicted
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._by_gid.clear()
+            self._by_listing.clear()
+            self._by_base.clear()
+            self._size = 0
+            if self.persistent is not None:
+                self.persistent.clear()
+
+    def stats(self) -> dict[str, Any]:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "entries": len(self._entries),
+                "bytes": self._size,
+                "max_bytes": self.max_bytes,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_ratio": self.hits / lookups if lookups else 0.0,
+                "disk_hits": self.disk_hits,
+                "projected_hits": self.projected_hits,
+                "disk_entries": self.persistent.count() if self.persistent is not None else 0,
+                "evictions": self.evictions,
+                "invalidations": self.invalidations,
+            }
+
+    def _lookup(self, key: tuple) -> bytes | None:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry.expires_at <= time.monotonic():
+                self._remove(key)
+                entry = None
+            if entry is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return entry.content
+            content = self._project(key)
+            if content is not None:
+                self.hits += 1
+                self.projected_hits += 1
+                return content
+            generation = self.generation
+        stored = self._load(key)
+        with self._lock:
+            if stored is None or generation != self.generation:
+                self.misses += 1
+                return None
+            content, expires_at = stored
+            # Promote the disk entry, keeping whichever tier expires first.
+            ttl = min(self.ttl_for(key[0]), expires_at - time.time())
+            self._insert(key, self._entry(key, content, ttl))
+            self.hits += 1
+            self.disk_hits += 1
+            return content
+
+    def _load(self, key: tuple) -> tuple[bytes, float] | None:
+        if self.persistent is None or self.persistent.ttl_for(key[0]) <= 0:
+            return None
+        return self.persistent.get(key)
+
+    def _store(self, url: str, params: dict[str, Any] | None, content: bytes, generation: int | None = None) -> None:
+        ttl = self.ttl_for(url)
+        if ttl <= 0 or len(content) > self.max_bytes:
+            return
+        key = cache_key(url, params)
+        try:
+            entry = self._entry(key, content, ttl)
+        except ValueError:
+            return
+        with self._lock:
+            if generation is not None and generation != self.generation:
+                return
+            self._insert(key, entry)
+            if self.persistent is not None:
+                self.persistent.put(key, entry)
+
+    def _entry(self, key: tuple, content: bytes, ttl: float) -> CacheEntry:
+        segments = [segment for segment in httpx.URL(key[0]).path.split("/") if segment]
+        gids = _subject_gids(key) | _record_gids(json.loads(content))
+        listing = None
+        if segments and not segments[-1].isdigit() and segments[-1] != "me":
+            listing = resource_kind(key[0])
+        return CacheEntry(content, time.monotonic() + ttl, frozenset(gids), listing)
+
+    def _project(self, key: tuple) -> bytes | None:
+        # Answers a GET from a fresh entry for the same request that asked for a
+        # superset of its opt_fields, keeping only the requested fields.
+        base, fields = _split_fields(key)
+        if fields is None:
+            return None
+        now = time.monotonic()
+        for other, other_fields in self._by_base.get(base, {}).items():
+            entry = self._entries[other]
+            if other_fields is not None and fields <= other_fields and entry.expires_at > now:
+                self._entries.move_to_end(other)
+                payload = json.loads(entry.content)
+                payload["data"] = project_fields(payload.get("data"), fields, other_fields)
+                return json.dumps(payload, separators=(",", ":")).encode()
+        return None
+
+    def _insert(self, key: tuple, entry: CacheEntry) -> None:
+        base, fields = _split_fields(key)
+        if fields is not None:
+            # Entries asking for a subset of these fields are now answered by
+            # projecting this one, and would only go stale alongside it.
+            for other, other_fields in list(self._by_base.get(base, {}).items()):
+                if other != key and other_fields is not None and other_fields < fields:
+                    self._remove(other)
+        if key in self._entries:
+            self._remove(key)
+        self._entries[key] = entry
+        self._by_base.setdefault(base, {})[key] = fields
+        self._size += len(entry.content)
+        for gid in entry.gids:
+            self._by_gid.setdefault(gid, set()).add(key)
+        if entry.listing:
+            self._by_listing.setdefault(entry.listing, set()).add(key)
+        while self._size > self.max_bytes:
+            self._remove(next(iter(self._entries)))
+            self.evictions += 1
+
+    def _invalidate(self, keys: set[tuple]) -> int:
+        self.generation += 1
+        for key in keys:
+            self._remove(key)
+        self.invalidations += len(keys)
+        return len(keys)
+
+    def _remove(self, key: tuple) -> None:
+        entry = self._entries.pop(key)
+        self._size -= len(entry.content)
+        for gid in entry.gids:
+            keys = self._by_gid.get(gid)
+            keys.discard(key)
+            if not keys:
+                del self._by_gid[gid]
+        if entry.listing:
+            keys = self._by_listing[entry.listing]
+            keys.discard(key)
+            if not keys:
+                del self._by_listing[entry.listing]
+        base, _ = _split_fields(key)
+        siblings = self._by_base[base]
+        del siblings[key]
+        if not siblings:
+            del self._by_base[base]
+
+
+def project_fields(value: Any, fields: frozenset[str], available: frozenset[str]) -> Any:
+    """
+    Cuts a response fetched with `available` opt_fields down to what `fields` would return.
+
+    Properties that `available` asked for but `fields` did not are dropped, at
+    any depth; everything else, such as `gid` and `resource_type`, is kept.
+
+    Args:
+        value: The `data` of the richer response: a record, a list of records or a scalar.
+        fields: The opt_fields of the request being answered, a subset of `available`.
+        available: The opt_fields the response was fetched with.
+
+    Returns:
+        Any: The projected data.
+    """
+    if isinstance(value, list):
+        return [project_fields(item, fields, available) for item in value]
+    if not isinstance(value, dict):
+        return value
+    wanted, asked = _field_tree(fields), _field_tree(available)
+    projected = {}
+    for name, item in value.items():
+        if name not in asked:
+            projected[name] = item
+        elif name in wanted:
+            projected[name] = project_fields(item, wanted[name], asked[name]) if asked[name] else item
+    return projected
+
+
+def _field_tree(fields: frozenset[str]) -> dict[str, frozenset[str]]:
+    # {"assignee", "assignee.name", "due_on"} -> {"assignee": {"name"}, "due_on": {}}
+    tree: dict[str, set[str]] = {}
+    for field_path in fields:
+        head, _, rest = field_path.partition(".")
+        tree.setdefault(head, set())
+        if rest:
+            tree[head].add(rest)
+    return {head: frozenset(rest) for head, rest in tree.items()}
+
+
+def _split_fields(key: tuple) -> tuple[tuple, frozenset[str] | None]:
+    # Separates a cache key into the request without opt_fields and the field set.
+    params = tuple(param for param in key[1] if param[0] != "opt_fields")
+    fields = next((value for name, value in key[1] if name == "opt_fields"), None)
+    return (key[0], params), None if fields is None else frozenset(fields.split(","))
+
+
+def _subject_gids(key: tuple) -> set[str]:
+    # The gids an entry is about: those in its path and query parameters.
+    gids = {segment for segment in httpx.URL(key[0]).path.split("/") if segment.isdigit()}
+    for _, value in key[1]:
+        gids.update(part for part in value.split(",") if part.isdigit())
+    return gids
+
+
+def _serialize_key(key: tuple) -> str:
+    return json.dumps([key[0], [list(param) for param in key[1]]], separators=(",", ":"))
+
+
+def _record_gids(payload: Any) -> set[str]:
+    # The gids of the records a response is made of: `data` itself for a single
+    # resource, or every element of `data` for a listing. Gids nested deeper,
+    # such as a task's assignee or workspace, are references rather than content.
+    data = payload.get("data") if isinstance(payload, dict) else None
+    records = data if isinstance(data, list) else [data]
+    return {str(record["gid"]) for record in records if isinstance(record, dict) and record.get("gid")}
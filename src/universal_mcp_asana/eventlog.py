@@ -0,0 +1,316 @@
+import json
+import mmap
+import os
+import struct
+import threading
+import zlib
+from array import array
+from collections.abc import Iterable
+from typing import Any
+
+from loguru import logger
+
+# Every record is framed as its payload length and CRC-32, then the payload.
+_HEADER = struct.Struct(">II")
+_SUFFIX = ".log"
+_OFFSETS_FILE = "offsets.json"
+
+
+class _Segment:
+    """One segment file: records from `base` on, with the byte position of each."""
+
+    def __init__(self, base: int, path: str) -> None:
+        self.base = base
+        self.path = path
+        self.positions = array("Q")
+        self.size = 0
+        self._map: mmap.mmap | None = None
+        self._lock = threading.Lock()
+
+    @property
+    def end(self) -> int:
+        return self.base + len(self.positions)
+
+    def scan(self) -> None:
+        # Indexes every intact record and cuts off a torn or corrupt tail, which
+        # is what a crash in the middle of an append leaves behind.
+        with open(self.path, "r+b") as handle:
+            data = handle.read()
+            position = 0
+            while position + _HEADER.size <= len(data):
+                length, checksum = _HEADER.unpack_from(data, position)
+                payload = data[position + _HEADER.size : position + _HEADER.size + length]
+                if len(payload) < length or zlib.crc32(payload) != checksum:
+                    break
+                self.positions.append(position)
+                position += _HEADER.size + length
+            if position < len(data):
+                logger.warning(f"Truncating {len(data) - position} bytes of torn records from {self.path}")
+                handle.truncate(position)
+        self.size = position
+
+    def read(self, index: int, size: int) -> bytes:
+        with self._lock:
+            # Maps the file again only once it has grown past the current mapping.
+            if self._map is None or len(self._map) < size:
+                if self._map is not None:
+                    self._map.close()
+                with open(self.path, "rb") as handle:
+                    self._map = mmap.mmap(handle.fileno(), size, access=mmap.ACCESS_READ)
+            position = self.positions[index]
+            length, _ = _HEADER.unpack_from(self._map, position)
+            start = position + _HEADER.size
+            return self._map[start : start + length]
+
+    def close(self) -> None:
+        with self._lock:
+            if self._map is not None:
+                self._map.close()
+                self._map = None
+
+
+class EventLog:
+    """
+    Append-only log of JSON records split into segment files, with named consumer offsets.
+
+    Every record gets the next offset. Appends go straight to the active
+    segment with one unbuffered write per batch, so readers see them at once,
+    and the segment is fsynced every `fsync_interval` seconds, or on `sync`, so
+    a crash of the machine loses at most that much. A crash of the process
+    loses nothing that was appended; a torn final record is cut off on reopen.
+    Once the active segment reaches `segment_bytes` a new one is started.
+
+    Reads go through memory maps of the segment files. Each consumer keeps its
+    own committed offset, stored in `offsets.json`, and resumes there, so
+    delivery is at-least-once. Segments every known consumer has committed past
+    are deleted when a new segment is started.
+    """
+
+    def __init__(self, directory: str, segment_bytes: int = 64 * 1024 * 1024, fsync_interval: float = 1.0) -> None:
+        """
+        Args:
+            directory: Directory holding the segment files and consumer offsets; created if missing.
+            segment_bytes: Size at which a new segment is started.
+            fsync_interval: Seconds between fsyncs of the active segment; 0 fsyncs every append.
+        """
+        self.directory = directory
+        self.segment_bytes = segment_bytes
+        self.fsync_interval = fsync_interval
+        os.makedirs(directory, exist_ok=True)
+        self._lock = threading.Lock()
+        self._appended = threading.Condition(self._lock)
+        self._segments: list[_Segment] = []
+        self._offsets = self._load_offsets()
+        self._dirty = False
+        self._closed = False
+        for name in sorted(name for name in os.listdir(directory) if name.endswith(_SUFFIX)):
+            segment = _Segment(int(name[: -len(_SUFFIX)]), os.path.join(directory, name))
+            segment.scan()
+            self._segments.append(segment)
+        if not self._segments:
+            self._segments.append(self._create_segment(0))
+        self._file = open(self._segments[-1].path, "ab", buffering=0)
+        self._stop = threading.Event()
+        self._flusher = None
+        if fsync_interval > 0:
+            self._flusher = threading.Thread(target=self._flush_periodically, name="asana-event-log", daemon=True)
+            self._flusher.start()
+
+    @property
+    def start_offset(self) -> int:
+        with self._lock:
+            return self._segments[0].base
+
+    @property
+    def end_offset(self) -> int:
+        """The offset the next record will get."""
+        with self._lock:
+            return self._segments[-1].end
+
+    def append(self, records: Iterable[Any]) -> int:
+        """
+        Appends records in one write.
+
+        Args:
+            records: JSON-serialisable records.
+
+        Returns:
+            int: The offset after the last record appended.
+        """
+        frames = []
+        for record in records:
+            payload = json.dumps(record, separators=(",", ":")).encode()
+            frames.append(_HEADER.pack(len(payload), zlib.crc32(payload)) + payload)
+        if not frames:
+            return self.end_offset
+        with self._appended:
+            if self._closed:
+                raise ValueError("EventLog is closed")
+            segment = self._segments[-1]
+            if segment.size and segment.size + sum(map(len, frames)) > self.segment_bytes:
+                segment = self._roll()
+            self._file.write(b"".join(frames))
+            for frame in frames:
+                segment.positions.append(segment.size)
+                segment.size += len(frame)
+            if self.fsync_interval > 0:
+                self._dirty = True
+            else:
+                os.fsync(self._file.fileno())
+            self._appended.notify_all()
+            return segment.end
+
+    def read(self, offset: int, max_records: int = 100) -> list[tuple[int, Any]]:
+        """
+        Reads records from `offset` on.
+
+        Args:
+            offset: The first offset to read. Offsets before `start_offset` were deleted and are skipped.
+            max_records: Most records returned.
+
+        Returns:
+            list[tuple[int, Any]]: `(offset, record)` pairs, empty at the end of the log.
+        """
+        records = []
+        while True:
+            with self._lock:
+                segments = [(segment, segment.end, segment.size) for segment in self._segments]
+            offset = max(offset, segments[0][0].base)
+            try:
+                for segment, end, size in segments:
+                    while offset < end and len(records) < max_records:
+                        records.append((offset, json.loads(segment.read(offset - segment.base, size))))
+                        offset += 1
+                return records
+            except FileNotFoundError:
+                # A segment was deleted after the list was taken, which only
+                # happens once every consumer is past it; go on from what is left.
+                continue
+
+    def wait(self, offset: int, timeout: float | None = None) -> bool:
+        """Blocks until a record exists at `offset`; returns False on timeout or once the log is closed."""
+        with self._appended:
+            return self._appended.wait_for(lambda: self._closed or self._segments[-1].end > offset, timeout) and not self._closed
+
+    def committed(self, consumer: str) -> int:
+        with self._lock:
+            return self._offsets.get(consumer, self._segments[0].base)
+
+    def commit(self, consumer: str, offset: int) -> None:
+        """Records that `consumer` has processed everything before `offset`."""
+        with self._lock:
+            self._offsets[consumer] = offset
+            temporary = os.path.join(self.directory, f"{_OFFSETS_FILE}.tmp")
+            with open(temporary, "w", encoding="utf-8") as handle:
+                json.dump(self._offsets, handle)
+                handle.flush()
+                os.fsync(handle.fileno())
+            os.replace(temporary, os.path.join(self.directory, _OFFSETS_FILE))
+
+    def subscribe(self, consumer: str) -> "LogSubscriber":
+        """Returns a subscriber reading from `consumer`'s committed offset."""
+        return LogSubscriber(self, consumer)
+
+    def sync(self) -> None:
+        with self._lock:
+            if self._dirty and not self._closed:
+                os.fsync(self._file.fileno())
+                self._dirty = False
+
+    def stats(self) -> dict[str, Any]:
+        with self._lock:
+            return {
+                "start_offset": self._segments[0].base,
+                "end_offset": self._segments[-1].end,
+                "segments": len(self._segments),
+                "bytes": sum(segment.size for segment in self._segments),
+                "consumers": dict(self._offsets),
+            }
+
+    def close(self) -> None:
+        self._stop.set()
+        if self._flusher is not None:
+            self._flusher.join()
+        self.sync()
+        with self._appended:
+            self._closed = True
+            self._file.close()
+            for segment in self._segments:
+                segment.close()
+            self._appended.notify_all()
+
+    def _load_offsets(self) -> dict[str, int]:
+        try:
+            with open(os.path.join(self.directory, _OFFSETS_FILE), encoding="utf-8") as handle:
+                return json.load(handle)
+        except FileNotFoundError:
+            return {}
+
+    def _create_segment(self, base: int) -> _Segment:
+        path = os.path.join(self.directory, f"{base:020d}{_SUFFIX}")
+        open(path, "ab").close()
+        # The new file's directory entry must be durable before records are.
+        descriptor = os.open(self.directory, os.O_RDONLY)
+        try:
+            os.fsync(descriptor)
+        finally:
+            os.close(descriptor)
+        return _Segment(base, path)
+
+    def _roll(self) -> _Segment:
+        os.fsync(self._file.fileno())
+        self._file.close()
+        self._dirty = False
+        segment = self._create_segment(self._segments[-1].end)
+        self._segments.append(segment)
+        self._file = open(segment.path, "ab", buffering=0)
+        if self._offsets:
+            consumed = min(self._offsets.values())
+            while len(self._segments) > 1 and self._segments[1].base <= consumed:
+                expired = self._segments.pop(0)
+                expired.close()
+                os.remove(expired.path)
+                logger.debug(f"Deleted consumed event log segment {expired.path}")
+        return segment
+
+    def _flush_periodically(self) -> None:
+        while not self._stop.wait(self.fsync_interval):
+            try:
+                self.sync()
+            except OSError as exc:
+                logger.warning(f"Could not fsync the event log: {exc}")
+
+
+class LogSubscriber:
+    """
+    One consumer's cursor over an `EventLog`.
+
+    `poll` returns the records after the current position and moves past
+    them; `commit` makes that position durable. A subscriber restarted before
+    committing reads the same records again.
+    """
+
+    def __init__(self, log: EventLog, consumer: str) -> None:
+        self.log = log
+        self.consumer = consumer
+        self.position = log.committed(consumer)
+
+    def poll(self, max_records: int = 100, timeout: float | None = 0) -> list[tuple[int, Any]]:
+        """
+        Reads the next records, waiting up to `timeout` seconds for any to arrive.
+
+        Returns:
+            list[tuple[int, Any]]: `(offset, record)` pairs, empty if none arrived in time.
+        """
+        if timeout != 0 and not self.log.wait(self.position, timeout):
+            return []
+        records = self.log.read(self.position, max_records)
+        if records:
+            self.position = records[-1][0] + 1
+        return records
+
+    def commit(self) -> None:
+        self.log.commit(self.consumer, self.position)
+
+    def seek(self, offset: int) -> None:
+        self.position = offset
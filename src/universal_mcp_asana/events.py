@@ -0,0 +1,632 @@
+import heapq
+import itertools
+import threading
+import time
+from collections.abc import Callable
+from typing import Any
+
+import httpx
+from loguru import logger
+
+from universal_mcp_asana.batch import HYDRATABLE_RESOURCES
+from universal_mcp_asana.cache import ResponseCache
+
+# Resources whose events cover what is cached about them: a project's events
+# report changes to its tasks, sections and memberships, and a task's events
+# report changes to its stories, subtasks and attachments.
+WATCHED_COLLECTIONS = ("projects", "tasks")
+
+
+class CacheCoherence:
+    """
+    Keeps cached project and task responses coherent by following `/events`.
+
+    Every poll subscribes to the projects and tasks that cached entries are
+    about, fetches the events on each of them since its last sync token, and
+    evicts the entries about every resource and parent an event names. A 412
+    means the sync token expired and changes may have been missed, so the whole
+    subtree of that resource is dropped and the fresh token is kept.
+
+    Between polls, entries about a resource whose events came back clean have
+    their expiry pushed out to `ttl`, so hot objects outlive their kind's TTL
+    for as long as the events confirm them.
+
+    A newly watched resource starts without a token, and its entries may
+    predate the first one. They are dropped once the token is acquired, so
+    every entry that survives was fetched after its resource was watched.
+
+    A poll sends at most `max_requests` requests, spent on the resources polled
+    least recently, so the request rate stays at `max_requests / interval` however
+    many resources are watched, and all of them are reached in turn.
+    """
+
+    def __init__(
+        self,
+        app: Any,
+        cache: ResponseCache,
+        interval: float = 5.0,
+        ttl: float = 3600,
+        max_resources: int = 200,
+        max_requests: int = 10,
+    ) -> None:
+        """
+        Args:
+            app: The `AsanaApp` used to call `get_events_on_aresource`.
+            cache: The response cache kept coherent.
+            interval: Seconds between polls when running in the background.
+            ttl: Seconds the entries of a confirmed resource are kept fresh.
+            max_resources: Cap on the resources watched at once.
+            max_requests: Cap on the `/events` requests sent per poll.
+        """
+        self.app = app
+        self.cache = cache
+        self.interval = interval
+        self.ttl = ttl
+        self.max_resources = max_resources
+        self.max_requests = max_requests
+        self.tokens: dict[str, str] = {}
+        self._polled_at: dict[str, float] = {}
+        self._budget = 0
+        self.expired = 0
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    def poll(self) -> int:
+        """
+        Runs one round: refreshes the watch list and reads the events of every resource.
+
+        Returns:
+            int: The number of cache entries evicted.
+        """
+        watched = self.cache.subjects(WATCHED_COLLECTIONS)[: self.max_resources]
+        for gid in set(self.tokens) - set(watched):
+            del self.tokens[gid]
+        for gid in set(self._polled_at) - set(watched):
+            del self._polled_at[gid]
+        evicted = 0
+        self._budget = self.max_requests
+        for gid in sorted(watched, key=lambda gid: self._polled_at.get(gid, 0.0)):
+            if self._budget <= 0:
+                break
+            self._polled_at[gid] = time.monotonic()
+            try:
+                evicted += self._sync(gid)
+            except httpx.HTTPError as exc:
+                logger.warning(f"Could not read events on {gid}: {exc}")
+        return evicted
+
+    def start(self) -> None:
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="asana-cache-coherence", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def stats(self) -> dict[str, Any]:
+        return {"watched": len(self.tokens), "expired_tokens": self.expired}
+
+    def _run(self) -> None:
+        while not self._stop.is_set():
+            started = time.monotonic()
+            self.poll()
+            self._stop.wait(max(0.0, self.interval - (time.monotonic() - started)))
+
+    def _sync(self, gid: str) -> int:
+        evicted = 0
+        while True:
+            token = self.tokens.get(gid)
+            self._budget -= 1
+            try:
+                page = self.app.get_events_on_aresource(resource=gid, sync=token)
+            except httpx.HTTPStatusError as exc:
+                if exc.response.status_code == 404:
+                    self.tokens.pop(gid, None)
+                    return evicted + self.cache.invalidate_subtree(gid)
+                if exc.response.status_code != 412:
+                    raise
+                # No token yet, or it expired: whatever is cached may have
+                # missed changes, so it goes, and the fresh token starts over.
+                if token is not None:
+                    self.expired += 1
+                    logger.debug(f"Sync token for {gid} expired; dropping its subtree")
+                self.tokens[gid] = exc.response.json().get("sync")
+                return evicted + self.cache.invalidate_subtree(gid)
+            self.tokens[gid] = page.get("sync") or token
+            changed = set()
+            for event in page.get("data") or []:
+                for reference in (event.get("resource"), event.get("parent")):
+                    if isinstance(reference, dict) and reference.get("gid"):
+                        changed.add(str(reference["gid"]))
+            if changed:
+                evicted += self.cache.invalidate(changed)
+            if not page.get("has_more"):
+                break
+            if self._budget <= 0:
+                # The token is kept, so the next poll carries on from here;
+                # the entries are not confirmed until it does.
+                return evicted
+        self.cache.extend(gid, self.ttl)
+        return evicted
+
+
+EventHandler = Callable[[str, list[dict[str, Any]]], None]
+
+
+class _Watch:
+    __slots__ = ("gid", "handler", "on_reset", "token", "interval", "rate", "due", "polled_at", "events", "polls", "entry")
+
+    def __init__(self, gid: str, handler: EventHandler, on_reset: Callable[[str], None] | None, interval: float) -> None:
+        self.gid = gid
+        self.handler = handler
+        self.on_reset = on_reset
+        self.token: str | None = None
+        self.interval = interval
+        self.rate = 0.0
+        self.due = 0.0
+        self.polled_at: float | None = None
+        self.events = 0
+        self.polls = 0
+        self.entry: list | None = None
+
+
+class EventPoller:
+    """
+    Follows `/events` on many resources from one thread under a global request budget.
+
+    Every watched resource keeps its own sync token and a smoothed estimate of
+    its event rate. After each poll the resource is rescheduled so that a poll
+    is expected to find about `target_events` events: busy resources come back
+    after `min_interval`, while idle ones back off, at most doubling their
+    interval per poll, up to `max_interval`. When the intervals asked for add up
+    to more than `budget` requests per second, they are all stretched by the
+    same factor, so every resource keeps its share of the budget.
+
+    Due resources are polled earliest-due first, and consecutive requests,
+    including further pages, are spaced `1 / budget` seconds apart, so the load
+    stays even rather than bursting when many resources fall due together. A 429
+    pauses every poll for its `Retry-After`.
+
+    Events are handed to the resource's handler a page at a time, and the sync
+    token only advances once the handler returns, so a failing handler sees the
+    page again. A 412 on a resource that had a token means changes were missed:
+    the fresh token is kept and `on_reset` is called so the consumer can
+    resynchronise. A 404 means the resource is gone and it is no longer watched.
+    """
+
+    def __init__(
+        self,
+        app: Any,
+        budget: float = 2.0,
+        min_interval: float = 2.0,
+        max_interval: float = 300.0,
+        target_events: float = 1.0,
+        smoothing: float = 0.3,
+    ) -> None:
+        """
+        Args:
+            app: The `AsanaApp` used to call `get_events_on_aresource`.
+            budget: Requests per second shared by every watched resource.
+            min_interval: Shortest time in seconds between two polls of one resource.
+            max_interval: Longest time in seconds between two polls of one resource.
+            target_events: Events a poll is scheduled to find on average.
+            smoothing: Weight of the latest poll in the event rate estimate, between 0 and 1.
+        """
+        self.app = app
+        self.spacing = 1.0 / budget
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self.target_events = target_events
+        self.smoothing = smoothing
+        self.expired = 0
+        self.gone = 0
+        self.throttled = 0
+        self._watches: dict[str, _Watch] = {}
+        self._queue: list[list] = []
+        self._sequence = itertools.count()
+        self._next_slot = 0.0
+        self._demand = 0.0
+        self._lock = threading.Lock()
+        self._wake = threading.Condition(self._lock)
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    def watch(self, gid: str, handler: EventHandler, on_reset: Callable[[str], None] | None = None) -> None:
+        """
+        Starts following the events on a resource, or replaces its callbacks.
+
+        The first poll only acquires a sync token; events are delivered from then on.
+
+        Args:
+            gid: The project, task or other resource to follow.
+            handler: Called with the gid and each non-empty page of events.
+            on_reset: Called with the gid when its sync token expired and events were missed.
+        """
+        gid = str(gid)
+        with self._wake:
+            current = self._watches.get(gid)
+            if current is not None:
+                current.handler, current.on_reset = handler, on_reset
+                return
+            watch = self._watches[gid] = _Watch(gid, handler, on_reset, self.min_interval)
+            self._demand += 1.0 / watch.interval
+            self._schedule(watch, time.monotonic())
+            self._wake.notify()
+
+    def unwatch(self, gid: str) -> None:
+        with self._wake:
+            self._forget(str(gid))
+
+    def next_poll_at(self) -> float | None:
+        """Returns the `time.monotonic()` time of the next poll, or None if nothing is watched."""
+        with self._lock:
+            self._drop_cancelled()
+            if not self._queue:
+                return None
+            return max(self._queue[0][0], self._next_slot)
+
+    def poll_next(self) -> str | None:
+        """
+        Polls the most overdue resource if it is due and the budget allows a request now.
+
+        Returns:
+            str | None: The gid polled, or None if nothing was ready.
+        """
+        now = time.monotonic()
+        with self._lock:
+            self._drop_cancelled()
+            if not self._queue or self._queue[0][0] > now or self._next_slot > now:
+                return None
+            watch = self._watches[heapq.heappop(self._queue)[2]]
+            watch.entry = None
+        self._poll(watch)
+        return watch.gid
+
+    def start(self) -> None:
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="asana-event-poller", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+        with self._wake:
+            self._wake.notify()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def stats(self) -> dict[str, Any]:
+        with self._lock:
+            watches = list(self._watches.values())
+            load = self._demand * self.spacing
+        busiest = sorted((watch for watch in watches if watch.rate > 0), key=lambda watch: watch.rate, reverse=True)[:5]
+        return {
+            "watched": len(watches),
+            "polls": sum(watch.polls for watch in watches),
+            "events": sum(watch.events for watch in watches),
+            "expired_tokens": self.expired,
+            "gone": self.gone,
+            "throttled": self.throttled,
+            "budget_load": round(load, 3),
+            "busiest": [{"gid": watch.gid, "events_per_minute": round(watch.rate * 60, 2), "interval": round(watch.interval, 1)} for watch in busiest],
+        }
+
+    def _run(self) -> None:
+        while not self._stop.is_set():
+            try:
+                if self.poll_next() is not None:
+                    continue
+            except Exception as exc:
+                logger.warning(f"Event poller round failed: {exc}")
+            ready_at = self.next_poll_at()
+            with self._wake:
+                if not self._stop.is_set():
+                    self._wake.wait(None if ready_at is None else max(0.0, ready_at - time.monotonic()))
+
+    def _poll(self, watch: _Watch) -> None:
+        found = 0
+        interval = None
+        try:
+            while True:
+                self._spend(1)
+                page = self.app.get_events_on_aresource(resource=watch.gid, sync=watch.token)
+                events = page.get("data") or []
+                if events:
+                    watch.handler(watch.gid, events)
+                    found += len(events)
+                watch.token = page.get("sync") or watch.token
+                if not page.get("has_more"):
+                    break
+        except httpx.HTTPStatusError as exc:
+            status_code = exc.response.status_code
+            if status_code == 404:
+                logger.info(f"Resource {watch.gid} is gone; no longer polling its events")
+                self.gone += 1
+                with self._wake:
+                    self._forget(watch.gid)
+                return
+            if status_code == 412:
+                had_token = watch.token is not None
+                watch.token = exc.response.json().get("sync")
+                if had_token:
+                    self.expired += 1
+                    logger.debug(f"Sync token for {watch.gid} expired; resetting its consumer")
+                    if watch.on_reset is not None:
+                        watch.on_reset(watch.gid)
+                interval = self.min_interval
+            elif status_code == 429:
+                self.throttled += 1
+                self._pause(exc.response)
+                interval = watch.interval
+            else:
+                logger.warning(f"Could not read events on {watch.gid}: {exc}")
+                interval = min(self.max_interval, watch.interval * 2)
+        except httpx.HTTPError as exc:
+            logger.warning(f"Could not read events on {watch.gid}: {exc}")
+            interval = min(self.max_interval, watch.interval * 2)
+        except Exception as exc:
+            # The handler failed: the token did not advance, so the page is
+            # delivered again on the next poll.
+            logger.warning(f"Event handler for {watch.gid} failed: {exc}")
+            interval = self.min_interval
+        now = time.monotonic()
+        with self._wake:
+            if self._watches.get(watch.gid) is not watch:
+                return
+            watch.polls += 1
+            watch.events += found
+            if interval is None:
+                interval = self._adapt(watch, found, now)
+            self._demand += 1.0 / interval - 1.0 / watch.interval
+            watch.interval = interval
+            watch.polled_at = now
+            self._schedule(watch, now)
+            self._wake.notify()
+
+    def _adapt(self, watch: _Watch, found: int, now: float) -> float:
+        if watch.polled_at is not None and now > watch.polled_at:
+            observed = found / (now - watch.polled_at)
+            watch.rate = self.smoothing * observed + (1 - self.smoothing) * watch.rate
+        wanted = self.target_events / watch.rate if watch.rate > 0 else self.max_interval
+        # Idle resources back off gradually, so a lull does not push a busy
+        # resource straight to the longest interval.
+        return max(self.min_interval, min(wanted, watch.interval * 2, self.max_interval))
+
+    def _schedule(self, watch: _Watch, now: float) -> None:
+        if watch.entry is not None:
+            watch.entry[2] = None
+        stretch = max(1.0, self._demand * self.spacing)
+        watch.due = now + watch.interval * stretch if watch.polled_at is not None else now
+        watch.entry = [watch.due, next(self._sequence), watch.gid]
+        heapq.heappush(self._queue, watch.entry)
+
+    def _forget(self, gid: str) -> None:
+        watch = self._watches.pop(gid, None)
+        if watch is None:
+            return
+        self._demand -= 1.0 / watch.interval
+        if watch.entry is not None:
+            watch.entry[2] = None
+
+    def _drop_cancelled(self) -> None:
+        while self._queue and self._queue[0][2] is None:
+            heapq.heappop(self._queue)
+
+    def _spend(self, requests: int) -> None:
+        # Reserves the next request slots, waiting if they are still ahead.
+        with self._lock:
+            now = time.monotonic()
+            start = max(self._next_slot, now)
+            self._next_slot = start + requests * self.spacing
+        if start > now:
+            self._stop.wait(start - now)
+
+    def _pause(self, response: httpx.Response) -> None:
+        try:
+            delay = float(response.headers.get("retry-after", 0))
+        except ValueError:
+            delay = 0.0
+        with self._lock:
+            self._next_slot = max(self._next_slot, time.monotonic() + max(delay, self.spacing))
+
+
+class EventCoalescer:
+    """
+    Collapses bursts of events and refetches each changed resource once per window.
+
+    `add` has the signature of an `EventPoller` handler. The first event to
+    arrive opens a window of `window` seconds; events arriving within it are
+    merged per (resource gid, action), accumulating the names of the changed
+    fields, the parents and watched resources they came through, and their
+    count and time span. When the window closes, every resource that was not
+    deleted is refetched once through `hydrate`, grouped by resource type so
+    the refetches go out as `/batch` requests, and the merged changes are handed
+    to the consumer in one call.
+
+    A window also closes early once `max_pending` distinct changes are waiting.
+    If the refetch or the consumer raises, the window's changes are merged back
+    into the next one and delivered again, so nothing is lost to a transient
+    failure.
+    """
+
+    def __init__(
+        self,
+        app: Any,
+        consumer: Callable[[list[dict[str, Any]]], None],
+        window: float = 2.0,
+        opt_fields: dict[str, str] | None = None,
+        max_pending: int = 1000,
+        max_concurrency: int = 4,
+    ) -> None:
+        """
+        Args:
+            app: The `AsanaApp` used to call `hydrate`.
+            consumer: Called with the merged changes of each window.
+            window: Seconds to hold the first event of a window for others to join.
+            opt_fields: Fields to refetch per resource type, e.g. `{"task": "name,completed"}`.
+            max_pending: Distinct (resource, action) changes that close a window early.
+            max_concurrency: Number of `/batch` requests in flight while refetching.
+        """
+        self.app = app
+        self.consumer = consumer
+        self.window = window
+        self.opt_fields = opt_fields or {}
+        self.max_pending = max_pending
+        self.max_concurrency = max_concurrency
+        self.received = 0
+        self.delivered = 0
+        self.refetched = 0
+        self._lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+        self._pending: dict[tuple[str, str], dict[str, Any]] = {}
+        self._generation = 0
+        self._armed = False
+
+    def add(self, watched_gid: str, events: list[dict[str, Any]]) -> None:
+        """
+        Merges events into the open window.
+
+        Args:
+            watched_gid: The resource whose events these are.
+            events: Events as returned by `get_events_on_aresource`.
+        """
+        changes = [_change_of(event, str(watched_gid)) for event in events if (event.get("resource") or {}).get("gid")]
+        with self._lock:
+            self.received += len(changes)
+        self.add_changes(changes)
+
+    def flush(self) -> list[dict[str, Any]]:
+        """
+        Closes the open window now: refetches its resources and hands its changes to the consumer.
+
+        Returns:
+            list[dict[str, Any]]: The changes delivered, each with its `resource`,
+            `action`, `fields`, `parents`, `watched`, `events`, `first_at`,
+            `last_at` and refetched `record`.
+        """
+        with self._flush_lock:
+            with self._lock:
+                changes = list(self._pending.values())
+                self._pending = {}
+                self._generation += 1
+                self._armed = False
+            if not changes:
+                return []
+            try:
+                records = self._refetch(changes)
+                delivered = [
+                    {
+                        **change,
+                        "fields": sorted(change["fields"]),
+                        "parents": sorted(change["parents"]),
+                        "watched": sorted(change["watched"]),
+                        "record": records.get(change["resource"]["gid"]),
+                    }
+                    for change in changes
+                ]
+                self.consumer(delivered)
+            except Exception as exc:
+                logger.warning(f"Delivering {len(changes)} coalesced changes failed; retrying them with the next window: {exc}")
+                with self._lock:
+                    for change in changes:
+                        self._merge(change)
+                    self._arm()
+                return []
+            self.delivered += len(delivered)
+            return delivered
+
+    def add_changes(self, changes: list[dict[str, Any]]) -> None:
+        """Merges already coalesced changes into the open window, e.g. those read back from elsewhere."""
+        with self._lock:
+            for change in changes:
+                self._merge(change)
+            full = len(self._pending) >= self.max_pending
+            if not full:
+                self._arm()
+        if full:
+            self.flush()
+
+    def stats(self) -> dict[str, Any]:
+        with self._lock:
+            pending = len(self._pending)
+        return {"received": self.received, "pending": pending, "delivered": self.delivered, "refetched": self.refetched}
+
+    def _merge(self, change: dict[str, Any]) -> None:
+        key = (change["resource"]["gid"], change["action"])
+        current = self._pending.get(key)
+        if current is None:
+            self._pending[key] = {
+                **change,
+                "fields": set(change["fields"]),
+                "parents": set(change["parents"]),
+                "watched": set(change["watched"]),
+            }
+            return
+        current["fields"].update(change["fields"])
+        current["parents"].update(change["parents"])
+        current["watched"].update(change["watched"])
+        current["events"] += change["events"]
+        if change["first_at"] and (not current["first_at"] or change["first_at"] < current["first_at"]):
+            current["first_at"] = change["first_at"]
+        if change["last_at"] and (not current["last_at"] or change["last_at"] > current["last_at"]):
+            current["last_at"] = change["last_at"]
+
+    def _arm(self) -> None:
+        if self._pending and not self._armed:
+            self._armed = True
+            timer = threading.Timer(self.window, self._flush_due, args=(self._generation,))
+            timer.daemon = True
+            timer.start()
+
+    def _flush_due(self, generation: int) -> None:
+        with self._lock:
+            # The window may already have been flushed, and a new one opened,
+            # since this timer was armed.
+            if generation != self._generation:
+                return
+        try:
+            self.flush()
+        except Exception as exc:
+            logger.warning(f"Could not flush coalesced events: {exc}")
+
+    def _refetch(self, changes: list[dict[str, Any]]) -> dict[str, dict[str, Any]]:
+        deleted = {change["resource"]["gid"] for change in changes if change["action"] == "deleted"}
+        wanted: dict[str, dict[str, None]] = {}
+        for change in changes:
+            resource = change["resource"]
+            if resource["gid"] not in deleted and resource.get("resource_type") in HYDRATABLE_RESOURCES:
+                wanted.setdefault(resource["resource_type"], {})[resource["gid"]] = None
+        if getattr(self.app, "cache", None) is not None:
+            self.app.cache.invalidate([gid for gids in wanted.values() for gid in gids])
+        records = {}
+        for resource_type, gids in wanted.items():
+            gids = list(gids)
+            result = self.app.hydrate(gids, resource_type, opt_fields=self.opt_fields.get(resource_type), max_concurrency=self.max_concurrency)
+            for gid, record in zip(gids, result["data"], strict=True):
+                if record is not None:
+                    records[gid] = record
+            self.refetched += len(gids)
+        return records
+
+
+def _change_of(event: dict[str, Any], watched_gid: str) -> dict[str, Any]:
+    resource = event["resource"]
+    parent = event.get("parent") or {}
+    field = (event.get("change") or {}).get("field")
+    return {
+        "resource": {"gid": str(resource["gid"]), "resource_type": resource.get("resource_type")},
+        "action": event.get("action") or "changed",
+        "fields": {field} if field else set(),
+        "parents": {str(parent["gid"])} if parent.get("gid") else set(),
+        "watched": {watched_gid},
+        "events": 1,
+        "first_at": event.get("created_at"),
+        "last_at": event.get("created_at"),
+    }
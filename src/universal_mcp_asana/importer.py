@@ -0,0 +1,279 @@
+import csv
+import json
+import os
+from collections.abc import Iterator
+from typing import IO, Any
+
+from loguru import logger
+
+from universal_mcp_asana.batch import execute_batched
+
+# CSV columns holding comma-separated lists rather than scalar values.
+LIST_COLUMNS = {"dependencies", "projects", "tags", "followers"}
+
+
+class TaskImporter:
+    """
+    Creates a tree of tasks, subtasks and dependencies read from an NDJSON or CSV file.
+
+    Every record carries a local `id`, an optional `parent` and optional
+    `dependencies`, which may name other local ids or existing Asana gids; all
+    other fields are sent as task data. Records are grouped into levels so that a
+    task is only created once its parent and dependencies have gids, and each
+    level is created through the Batch API concurrently.
+
+    The local-id-to-gid mapping is appended to a journal file the moment each
+    task is created, and the journal is replayed on start, so rerunning an
+    import after a partial failure only creates what is still missing.
+    """
+
+    def __init__(
+        self,
+        app: Any,
+        state_path: str,
+        workspace: str | None = None,
+        project: str | None = None,
+        max_concurrency: int = 4,
+    ) -> None:
+        """
+        Args:
+            app: The `AsanaApp` used to send the `/batch` requests.
+            state_path: NDJSON journal of created tasks and dependencies.
+            workspace: Workspace for top-level records that name no workspace or projects.
+            project: Project added to top-level records that name no projects.
+            max_concurrency: Number of `/batch` requests in flight at once.
+        """
+        self.app = app
+        self.state_path = state_path
+        self.workspace = workspace
+        self.project = project
+        self.max_concurrency = max_concurrency
+        self.gids: dict[str, str] = {}
+        self.linked: set[str] = set()
+        self._local_ids = set()
+        self._load_state()
+
+    def _load_state(self) -> None:
+        try:
+            with open(self.state_path, encoding="utf-8") as journal:
+                for line in journal:
+                    if not line.strip():
+                        continue
+                    entry = json.loads(line)
+                    if "gid" in entry:
+                        self.gids[entry["id"]] = entry["gid"]
+                    if entry.get("dependencies"):
+                        self.linked.add(entry["id"])
+        except FileNotFoundError:
+            return
+        logger.debug(f"Resuming import with {len(self.gids)} tasks already created")
+
+    def import_file(self, path: str, file_format: str | None = None) -> dict[str, Any]:
+        """
+        Imports every record of `path`.
+
+        Args:
+            path: The NDJSON or CSV file to read.
+            file_format: `ndjson` or `csv`; inferred from the extension when omitted.
+
+        Returns:
+            dict[str, Any]: Counts of created and already existing tasks, the records
+            that failed, and the records skipped because a prerequisite failed.
+
+        Raises:
+            ValueError: If ids are duplicated or the records form a cycle.
+        """
+        file_format = file_format or ("csv" if path.lower().endswith(".csv") else "ndjson")
+        with open(path, encoding="utf-8", newline="") as source:
+            records = read_records(source, file_format)
+            tasks = {}
+            for record in records:
+                local_id = str(record.pop("id"))
+                if local_id in tasks:
+                    raise ValueError(f"Duplicate task id {local_id!r}")
+                tasks[local_id] = record
+        return self.run(tasks)
+
+    def run(self, tasks: dict[str, dict[str, Any]]) -> dict[str, Any]:
+        """
+        Imports records already keyed by local id.
+
+        Args:
+            tasks: Task data keyed by local id, with optional `parent` and `dependencies`.
+
+        Returns:
+            dict[str, Any]: The import report, as for `import_file`.
+        """
+        self._local_ids = tasks.keys()
+        report = {"created": 0, "existing": 0, "failed": [], "blocked": []}
+        with open(self.state_path, "a", encoding="utf-8") as journal:
+            for level in dependency_levels(tasks):
+                ready = []
+                for local_id in level:
+                    if local_id in self.gids:
+                        report["existing"] += 1
+                    elif all(self._gid_of(ref) for ref in _prerequisites(tasks[local_id])):
+                        ready.append(local_id)
+                    else:
+                        report["blocked"].append(local_id)
+                self._create(tasks, ready, journal, report)
+                self._link(tasks, level, journal, report)
+                os.fsync(journal.fileno())
+        return report
+
+    def _gid_of(self, ref: str) -> str | None:
+        # References to records of this import resolve through the journal;
+        # anything else is taken to be the gid of an existing task.
+        return self.gids.get(ref) if ref in self._local_ids else ref
+
+    def _create(self, tasks: dict, ready: list[str], journal: IO[str], report: dict) -> None:
+        def actions() -> Iterator[tuple[str, dict[str, Any]]]:
+            for local_id in ready:
+                record = tasks[local_id]
+                data = {k: v for k, v in record.items() if k not in ("parent", "dependencies")}
+                if record.get("parent"):
+                    yield local_id, {
+                        "relative_path": f"/tasks/{self._gid_of(record['parent'])}/subtasks",
+                        "method": "post",
+                        "data": data,
+                    }
+                    continue
+                if self.project and not data.get("projects"):
+                    data["projects"] = [self.project]
+                if self.workspace and not data.get("projects") and not data.get("workspace"):
+                    data["workspace"] = self.workspace
+                yield local_id, {"relative_path": "/tasks", "method": "post", "data": data}
+
+        # Only rate-limited creates are resent: after a server or transport
+        # error the task may exist already, and resending would duplicate it.
+        # Those are reported instead, and the rerun picks them up.
+        results = execute_batched(self.app, actions(), max_concurrency=self.max_concurrency, retry_statuses={429})
+        for local_id, result in results:
+            gid = _ok(result) and ((result.get("body") or {}).get("data") or {}).get("gid")
+            if not gid:
+                report["failed"].append({"id": local_id, "stage": "create", **_failure(result)})
+                continue
+            self.gids[local_id] = gid
+            _journal(journal, {"id": local_id, "gid": gid})
+            report["created"] += 1
+
+    def _link(self, tasks: dict, level: list[str], journal: IO[str], report: dict) -> None:
+        def actions() -> Iterator[tuple[str, dict[str, Any]]]:
+            for local_id in level:
+                dependencies = tasks[local_id].get("dependencies")
+                if dependencies and local_id in self.gids and local_id not in self.linked:
+                    yield local_id, {
+                        "relative_path": f"/tasks/{self.gids[local_id]}/addDependencies",
+                        "method": "post",
+                        "data": {"dependencies": [self._gid_of(ref) for ref in dependencies]},
+                    }
+
+        for local_id, result in execute_batched(self.app, actions(), max_concurrency=self.max_concurrency):
+            if not _ok(result):
+                report["failed"].append({"id": local_id, "stage": "dependencies", **_failure(result)})
+                continue
+            self.linked.add(local_id)
+            _journal(journal, {"id": local_id, "dependencies": True})
+
+
+def read_records(source: IO[str], file_format: str) -> Iterator[dict[str, Any]]:
+    """
+    Streams task records from an NDJSON or CSV file.
+
+    CSV cells are kept as strings, except that empty cells are dropped and the
+    columns in `LIST_COLUMNS` are split on commas.
+
+    Args:
+        source: The open file.
+        file_format: `ndjson` or `csv`.
+
+    Returns:
+        Iterator[dict[str, Any]]: One record per task.
+    """
+    if file_format == "csv":
+        for row in csv.DictReader(source):
+            record = {}
+            for column, value in row.items():
+                if value is None or not value.strip():
+                    continue
+                value = value.strip()
+                record[column] = [part.strip() for part in value.split(",") if part.strip()] if column in LIST_COLUMNS else value
+            yield record
+    elif file_format == "ndjson":
+        for line in source:
+            if line.strip():
+                yield json.loads(line)
+    else:
+        raise ValueError(f"Unsupported import format {file_format!r}")
+
+
+def dependency_levels(tasks: dict[str, dict[str, Any]]) -> list[list[str]]:
+    """
+    Groups local ids so that every task comes after its parent and dependencies.
+
+    References that are not local ids are treated as existing Asana gids and
+    impose no ordering.
+
+    Args:
+        tasks: Task records keyed by local id.
+
+    Returns:
+        list[list[str]]: The levels, each creatable once all earlier ones exist.
+
+    Raises:
+        ValueError: If the parent and dependency references form a cycle.
+    """
+    for record in tasks.values():
+        _normalize(record)
+    waiting_on = {}
+    dependents: dict[str, list[str]] = {}
+    for local_id, record in tasks.items():
+        prerequisites = {ref for ref in _prerequisites(record) if ref in tasks}
+        waiting_on[local_id] = len(prerequisites)
+        for ref in prerequisites:
+            dependents.setdefault(ref, []).append(local_id)
+    level = [local_id for local_id, count in waiting_on.items() if count == 0]
+    levels = []
+    while level:
+        levels.append(level)
+        following = []
+        for local_id in level:
+            for dependent in dependents.get(local_id, ()):
+                waiting_on[dependent] -= 1
+                if waiting_on[dependent] == 0:
+                    following.append(dependent)
+        level = following
+    cyclic = [local_id for local_id, count in waiting_on.items() if count > 0]
+    if cyclic:
+        raise ValueError(f"Tasks form a parent/dependency cycle: {', '.join(sorted(cyclic))}")
+    return levels
+
+
+def _normalize(record: dict[str, Any]) -> None:
+    dependencies = record.get("dependencies") or []
+    if isinstance(dependencies, str):
+        dependencies = dependencies.split(",")
+    record["dependencies"] = [str(ref).strip() for ref in dependencies if str(ref).strip()]
+    if record.get("parent") is not None:
+        record["parent"] = str(record["parent"])
+
+
+def _prerequisites(record: dict[str, Any]) -> list[str]:
+    parent = record.get("parent")
+    return [parent, *record["dependencies"]] if parent else record["dependencies"]
+
+
+def _ok(result: dict[str, Any]) -> bool:
+    status_code = result.get("status_code")
+    return status_code is not None and 200 <= status_code < 300
+
+
+def _failure(result: dict[str, Any]) -> dict[str, Any]:
+    return {"status_code": result.get("status_code"), "errors": (result.get("body") or {}).get("errors")}
+
+
+def _journal(journal: IO[str], entry: dict[str, Any]) -> None:
+    # Flushing hands the entry to the OS, which is enough to survive the process
+    # dying; the journal is fsynced once per level.
+    journal.write(json.dumps(entry) + "\n")
+    journal.flush()
@@ -0,0 +1,583 @@
+import json
+import sqlite3
+import threading
+from collections.abc import Iterable
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+from typing import Any
+
+import httpx
+from loguru import logger
+
+from universal_mcp_asana.utils import format_timestamp, parse_timestamp
+
+TASK_FIELDS = ",".join(
+    [
+        "name",
+        "resource_subtype",
+        "completed",
+        "completed_at",
+        "assignee",
+        "assignee.name",
+        "assignee.email",
+        "due_on",
+        "due_at",
+        "start_on",
+        "created_at",
+        "modified_at",
+        "notes",
+        "parent",
+        "parent.name",
+        "permalink_url",
+        "num_subtasks",
+        "memberships.project",
+        "memberships.project.name",
+        "memberships.section",
+        "memberships.section.name",
+        "tags",
+        "tags.name",
+        "custom_fields.name",
+        "custom_fields.resource_subtype",
+        "custom_fields.display_value",
+        "custom_fields.number_value",
+        "custom_fields.text_value",
+        "custom_fields.enum_value.name",
+        "custom_fields.multi_enum_values.name",
+        "custom_fields.date_value",
+        "custom_fields.people_value.name",
+    ]
+)
+STORY_FIELDS = "created_at,created_by,created_by.name,resource_subtype,text,target"
+SECTION_FIELDS = "name,project"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS projects (
+    gid TEXT PRIMARY KEY, name TEXT, sync_token TEXT, loaded_at TEXT, synced_at TEXT,
+    last_event_at TEXT, events_applied INTEGER NOT NULL DEFAULT 0
+);
+CREATE TABLE IF NOT EXISTS sections (
+    gid TEXT PRIMARY KEY, project_gid TEXT NOT NULL, name TEXT, position INTEGER
+);
+CREATE TABLE IF NOT EXISTS tasks (
+    gid TEXT PRIMARY KEY, name TEXT, completed INTEGER, assignee_gid TEXT, assignee_name TEXT,
+    due_on TEXT, modified_at TEXT, parent_gid TEXT, notes TEXT, record TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS memberships (
+    task_gid TEXT NOT NULL, project_gid TEXT NOT NULL, section_gid TEXT,
+    PRIMARY KEY (task_gid, project_gid)
+);
+CREATE TABLE IF NOT EXISTS custom_field_values (
+    task_gid TEXT NOT NULL, field_gid TEXT NOT NULL, name TEXT, display_value TEXT, number_value REAL,
+    PRIMARY KEY (task_gid, field_gid)
+);
+CREATE TABLE IF NOT EXISTS stories (
+    gid TEXT PRIMARY KEY, task_gid TEXT NOT NULL, created_at TEXT, record TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS memberships_by_project ON memberships (project_gid, section_gid);
+CREATE INDEX IF NOT EXISTS tasks_by_parent ON tasks (parent_gid);
+CREATE INDEX IF NOT EXISTS tasks_by_assignee ON tasks (assignee_gid);
+CREATE INDEX IF NOT EXISTS custom_field_values_by_field ON custom_field_values (field_gid, display_value);
+CREATE INDEX IF NOT EXISTS stories_by_task ON stories (task_gid, created_at);
+"""
+
+
+class ProjectMirror:
+    """
+    Local SQLite copy of whole projects, kept current from their `/events` streams.
+
+    `load` takes a sync token for the project and then copies its sections,
+    tasks, subtasks (at any depth), their custom field values and, optionally,
+    their stories. `sync` reads the events since the stored token and applies
+    them: deleted resources are removed, and added or changed tasks, sections
+    and stories are refetched through the Batch API and upserted. The token is
+    only advanced once a page of events has been applied, so a failure replays
+    it. An expired token (412) reloads the project from scratch. Loads and
+    syncs of one project never overlap, whichever thread starts them; a
+    project that fails to sync is reported and the others are still synced.
+
+    Every answer carries the project's freshness: when it was loaded, when its
+    events were last read, and how many seconds ago that was.
+    """
+
+    def __init__(self, app: Any, path: str, include_stories: bool = True, max_concurrency: int = 4) -> None:
+        """
+        Args:
+            app: The `AsanaApp` used to read projects and events.
+            path: The SQLite database file, created if missing.
+            include_stories: Copy every task's stories on load.
+            max_concurrency: Requests in flight at once while loading.
+        """
+        self.app = app
+        self.path = path
+        self.include_stories = include_stories
+        self.max_concurrency = max_concurrency
+        self._lock = threading.RLock()
+        self._project_locks: dict[str, threading.RLock] = {}
+        self._db = sqlite3.connect(path, check_same_thread=False)
+        self._db.row_factory = sqlite3.Row
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.executescript(_SCHEMA)
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    def load(self, project_gid: str) -> dict[str, Any]:
+        """
+        Copies a project into the mirror, replacing whatever it held for it.
+
+        Args:
+            project_gid: The project to mirror.
+
+        Returns:
+            dict[str, Any]: Counts of what was copied, and the project's freshness.
+        """
+        project_gid = str(project_gid)
+        with self._project_lock(project_gid):
+            return self._load(project_gid)
+
+    def sync(self, project_gids: Iterable[str] | None = None) -> dict[str, Any]:
+        """
+        Applies the events of mirrored projects since their last sync.
+
+        Args:
+            project_gids: The projects to sync; all mirrored projects when omitted.
+
+        Returns:
+            dict[str, Any]: The number of events applied per project, projects
+            reloaded because their token expired, the error of each project that
+            could not be synced, and the freshness of each.
+        """
+        project_gids = [str(gid) for gid in project_gids] if project_gids else self.projects()
+        applied, reloaded, errors = {}, [], {}
+        for project_gid in project_gids:
+            try:
+                with self._project_lock(project_gid):
+                    try:
+                        applied[project_gid] = self._sync(project_gid)
+                    except httpx.HTTPStatusError as exc:
+                        if exc.response.status_code != 412:
+                            raise
+                        logger.debug(f"Sync token of mirrored project {project_gid} expired; reloading it")
+                        self._load(project_gid)
+                        reloaded.append(project_gid)
+            except (httpx.HTTPError, ValueError) as exc:
+                # What was applied before the failure stays; the rest is
+                # replayed from the stored token on the next sync.
+                logger.warning(f"Could not sync mirrored project {project_gid}: {exc}")
+                errors[project_gid] = f"{type(exc).__name__}: {exc}"
+        return {"applied": applied, "reloaded": reloaded, "errors": errors, "freshness": self.freshness(project_gids)}
+
+    def remove(self, project_gid: str) -> None:
+        """Drops a project and everything only it held from the mirror."""
+        with self._lock, self._db:
+            self._db.execute("DELETE FROM projects WHERE gid = ?", (str(project_gid),))
+            self._db.execute("DELETE FROM sections WHERE project_gid = ?", (str(project_gid),))
+            self._db.execute("DELETE FROM memberships WHERE project_gid = ?", (str(project_gid),))
+            self._prune()
+
+    def projects(self) -> list[str]:
+        with self._lock:
+            return [row["gid"] for row in self._db.execute("SELECT gid FROM projects ORDER BY gid")]
+
+    def freshness(self, project_gids: Iterable[str] | None = None) -> dict[str, dict[str, Any]]:
+        """
+        Reports how current each mirrored project is.
+
+        Returns:
+            dict[str, dict[str, Any]]: Per project gid, its `name`, `loaded_at`,
+            `synced_at`, `age_seconds` since `synced_at`, the time of the last event
+            applied and the number of events applied since loading. Projects that
+            are not mirrored map to `{"mirrored": False}`.
+        """
+        with self._lock:
+            rows = {row["gid"]: row for row in self._db.execute("SELECT * FROM projects")}
+        now = datetime.now(timezone.utc)
+        report = {}
+        for gid in project_gids if project_gids is not None else rows:
+            row = rows.get(str(gid))
+            if row is None:
+                report[str(gid)] = {"mirrored": False}
+                continue
+            report[str(gid)] = {
+                "mirrored": True,
+                "name": row["name"],
+                "loaded_at": row["loaded_at"],
+                "synced_at": row["synced_at"],
+                "age_seconds": round((now - parse_timestamp(row["synced_at"])).total_seconds(), 3),
+                "last_event_at": row["last_event_at"],
+                "events_applied": row["events_applied"],
+            }
+        return report
+
+    def query_tasks(
+        self,
+        project_gid: str,
+        section: str | None = None,
+        assignee: str | None = None,
+        completed: bool | None = None,
+        due_before: str | None = None,
+        due_after: str | None = None,
+        text: str | None = None,
+        custom_field: str | None = None,
+        custom_field_value: str | None = None,
+        include_subtasks: bool = False,
+        limit: int = 100,
+        offset: int = 0,
+    ) -> list[dict[str, Any]]:
+        """
+        Selects mirrored tasks of a project. See `AsanaApp.query_mirrored_tasks`.
+
+        Returns:
+            list[dict[str, Any]]: The stored task records, in section and creation order.
+        """
+        clauses, params = [], []
+        if section is not None:
+            clauses.append("(m.section_gid = ? OR m.section_gid IN (SELECT gid FROM sections WHERE project_gid = ? AND name = ? COLLATE NOCASE))")
+            params += [section, project_gid, section]
+        if assignee is not None:
+            clauses.append("(t.assignee_gid = ? OR t.assignee_name = ? COLLATE NOCASE OR json_extract(t.record, '$.assignee.email') = ? COLLATE NOCASE)")
+            params += [assignee, assignee, assignee]
+        if completed is not None:
+            clauses.append("t.completed = ?")
+            params.append(int(bool(completed)))
+        if due_before is not None:
+            clauses.append("t.due_on < ?")
+            params.append(due_before)
+        if due_after is not None:
+            clauses.append("t.due_on > ?")
+            params.append(due_after)
+        if text is not None:
+            clauses.append("(t.name LIKE ? OR t.notes LIKE ?)")
+            params += [f"%{text}%", f"%{text}%"]
+        if custom_field is not None:
+            clause = "EXISTS (SELECT 1 FROM custom_field_values c WHERE c.task_gid = t.gid AND (c.field_gid = ? OR c.name = ? COLLATE NOCASE)"
+            params += [custom_field, custom_field]
+            if custom_field_value is not None:
+                clause += " AND c.display_value = ? COLLATE NOCASE"
+                params.append(custom_field_value)
+            clauses.append(clause + ")")
+        where = "".join(f" AND {clause}" for clause in clauses)
+        # Subtasks have no membership of their own; they sort under their
+        # top-level ancestor's section.
+        scope = (
+            """
+            WITH RECURSIVE scoped(gid, section_gid) AS (
+                SELECT task_gid, section_gid FROM memberships WHERE project_gid = ?
+                UNION SELECT tasks.gid, scoped.section_gid FROM tasks JOIN scoped ON tasks.parent_gid = scoped.gid
+            )
+            """
+            if include_subtasks
+            else "WITH scoped(gid, section_gid) AS (SELECT task_gid, section_gid FROM memberships WHERE project_gid = ?)"
+        )
+        sql = (
+            f"{scope} SELECT t.record FROM scoped m JOIN tasks t ON t.gid = m.gid "
+            f"LEFT JOIN sections s ON s.gid = m.section_gid WHERE 1 = 1{where} "
+            "ORDER BY s.position, json_extract(t.record, '$.created_at'), t.gid LIMIT ? OFFSET ?"
+        )
+        with self._lock:
+            rows = self._db.execute(sql, [str(project_gid), *params, limit, offset]).fetchall()
+        return [json.loads(row["record"]) for row in rows]
+
+    def get_task(self, task_gid: str, include_stories: bool = True) -> dict[str, Any] | None:
+        """
+        Reads one mirrored task with its subtasks and, optionally, its stories.
+
+        Returns:
+            dict[str, Any] | None: The task record with `subtasks` and `stories`
+            lists added, or None if the task is not mirrored.
+        """
+        with self._lock:
+            row = self._db.execute("SELECT record FROM tasks WHERE gid = ?", (str(task_gid),)).fetchone()
+            if row is None:
+                return None
+            task = json.loads(row["record"])
+            task["subtasks"] = [
+                {"gid": sub["gid"], "name": sub["name"], "completed": bool(sub["completed"])}
+                for sub in self._db.execute("SELECT gid, name, completed FROM tasks WHERE parent_gid = ? ORDER BY gid", (str(task_gid),))
+            ]
+            if include_stories:
+                task["stories"] = [
+                    json.loads(story["record"])
+                    for story in self._db.execute("SELECT record FROM stories WHERE task_gid = ? ORDER BY created_at, gid", (str(task_gid),))
+                ]
+        return task
+
+    def projects_of(self, task_gid: str) -> list[str]:
+        """Lists the mirrored projects a task belongs to, through its own memberships or its ancestors'."""
+        with self._lock:
+            rows = self._db.execute(
+                """
+                WITH RECURSIVE ancestors(gid) AS (
+                    SELECT ? UNION SELECT tasks.parent_gid FROM tasks JOIN ancestors ON tasks.gid = ancestors.gid
+                    WHERE tasks.parent_gid IS NOT NULL
+                )
+                SELECT DISTINCT project_gid FROM memberships
+                WHERE task_gid IN (SELECT gid FROM ancestors) AND project_gid IN (SELECT gid FROM projects)
+                """,
+                (str(task_gid),),
+            ).fetchall()
+        return [row["project_gid"] for row in rows]
+
+    def start(self, interval: float) -> None:
+        """Syncs every mirrored project every `interval` seconds on a background thread."""
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._stop.clear()
+
+        def run() -> None:
+            while not self._stop.wait(interval):
+                try:
+                    self.sync()
+                except Exception as exc:
+                    logger.warning(f"Project mirror sync failed: {exc}")
+
+        self._thread = threading.Thread(target=run, name="asana-mirror-sync", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def close(self) -> None:
+        self.stop()
+        with self._lock:
+            self._db.close()
+
+    def _project_lock(self, project_gid: str) -> threading.RLock:
+        with self._lock:
+            return self._project_locks.setdefault(project_gid, threading.RLock())
+
+    def _fresh_token(self, project_gid: str) -> str | None:
+        try:
+            return self.app.get_events_on_aresource(resource=project_gid).get("sync")
+        except httpx.HTTPStatusError as exc:
+            if exc.response.status_code != 412:
+                raise
+            return exc.response.json().get("sync")
+
+    def _subtasks(self, task_gid: str) -> list[dict[str, Any]]:
+        return list(self.app.iter_subtasks_from_atask(task_gid, opt_fields=TASK_FIELDS))
+
+    def _stories(self, task_gid: str) -> list[dict[str, Any]]:
+        return [
+            {**story, "target": story.get("target") or {"gid": task_gid}}
+            for story in self.app.iter_stories_from_atask(task_gid, opt_fields=STORY_FIELDS)
+        ]
+
+    def _load(self, project_gid: str) -> dict[str, Any]:
+        # The token is taken first so that changes made while loading are
+        # replayed by the next sync rather than lost.
+        token = self._fresh_token(project_gid)
+        project = self.app.get_aproject(project_gid, opt_fields="name").get("data") or {}
+        sections = list(self.app.iter_sections_in_aproject(project_gid, opt_fields=SECTION_FIELDS))
+        tasks = list(self.app.iter_tasks_from_aproject(project_gid, opt_fields=TASK_FIELDS))
+        with ThreadPoolExecutor(max_workers=self.max_concurrency, thread_name_prefix="asana-mirror") as pool:
+            parents = [task for task in tasks if task.get("num_subtasks")]
+            while parents:
+                level = [
+                    subtask
+                    for subtasks in pool.map(self._subtasks, [parent["gid"] for parent in parents])
+                    for subtask in subtasks
+                ]
+                tasks.extend(level)
+                parents = [task for task in level if task.get("num_subtasks")]
+            stories = []
+            if self.include_stories:
+                stories = [story for page in pool.map(self._stories, [task["gid"] for task in tasks]) for story in page]
+        now = _now()
+        with self._lock, self._db:
+            self._db.execute(
+                "INSERT OR REPLACE INTO projects (gid, name, sync_token, loaded_at, synced_at, events_applied) "
+                "VALUES (?, ?, ?, ?, ?, 0)",
+                (project_gid, project.get("name"), token, now, now),
+            )
+            self._db.execute("DELETE FROM memberships WHERE project_gid = ?", (project_gid,))
+            self._db.execute("DELETE FROM sections WHERE project_gid = ?", (project_gid,))
+            for position, section in enumerate(sections):
+                self._db.execute(
+                    "INSERT OR REPLACE INTO sections (gid, project_gid, name, position) VALUES (?, ?, ?, ?)",
+                    (section["gid"], project_gid, section.get("name"), position),
+                )
+            for task in tasks:
+                self._upsert_task(task)
+            for story in stories:
+                self._upsert_story(story)
+            self._prune()
+        logger.debug(f"Mirrored project {project_gid}: {len(tasks)} tasks, {len(sections)} sections, {len(stories)} stories")
+        return {
+            "tasks": len(tasks),
+            "sections": len(sections),
+            "stories": len(stories),
+            "freshness": self.freshness([project_gid])[project_gid],
+        }
+
+    def _sync(self, project_gid: str) -> int:
+        with self._lock:
+            row = self._db.execute("SELECT sync_token FROM projects WHERE gid = ?", (project_gid,)).fetchone()
+        if row is None:
+            raise ValueError(f"Project {project_gid} is not mirrored")
+        token = row["sync_token"]
+        applied = 0
+        while True:
+            page = self.app.get_events_on_aresource(resource=project_gid, sync=token)
+            events = page.get("data") or []
+            changes = self._fetch_changes(project_gid, events)
+            token = page.get("sync") or token
+            last_event_at = max((event["created_at"] for event in events if event.get("created_at")), default=None)
+            with self._lock, self._db:
+                if changes is None:
+                    self._db.execute("DELETE FROM projects WHERE gid = ?", (project_gid,))
+                    self._db.execute("DELETE FROM sections WHERE project_gid = ?", (project_gid,))
+                    self._db.execute("DELETE FROM memberships WHERE project_gid = ?", (project_gid,))
+                    self._prune()
+                    return applied + len(events)
+                self._apply(project_gid, changes)
+                self._db.execute(
+                    "UPDATE projects SET sync_token = ?, synced_at = ?, events_applied = events_applied + ?, "
+                    "last_event_at = COALESCE(?, last_event_at) WHERE gid = ?",
+                    (token, _now(), len(events), last_event_at, project_gid),
+                )
+            applied += len(events)
+            if not page.get("has_more"):
+                return applied
+
+    def _fetch_changes(self, project_gid: str, events: list[dict[str, Any]]) -> dict[str, Any] | None:
+        # The last action per resource decides: a deleted resource is removed,
+        # anything else is refetched, which also settles add/remove sequences.
+        latest: dict[tuple[str, str], dict[str, Any]] = {}
+        for event in events:
+            resource = event.get("resource") or {}
+            if resource.get("gid") and resource.get("resource_type"):
+                latest[(resource["resource_type"], str(resource["gid"]))] = event
+        changes = {"tasks": {}, "stories": {}, "sections": {}, "deleted": [], "added_tasks": set(), "project": None}
+        wanted = {"task": [], "story": [], "section": []}
+        for (resource_type, gid), event in latest.items():
+            if resource_type == "project" and gid == project_gid:
+                if event.get("action") == "deleted":
+                    return None
+                changes["project"] = self.app.get_aproject(project_gid, opt_fields="name").get("data")
+            elif resource_type in wanted:
+                if event.get("action") == "deleted":
+                    changes["deleted"].append((resource_type, gid))
+                else:
+                    wanted[resource_type].append(gid)
+                    if resource_type == "task" and event.get("action") == "added":
+                        changes["added_tasks"].add(gid)
+        if self.app.cache is not None:
+            self.app.cache.invalidate([gid for gids in wanted.values() for gid in gids])
+        fields = {"task": TASK_FIELDS, "story": STORY_FIELDS, "section": SECTION_FIELDS}
+        for resource_type, gids in wanted.items():
+            if not gids:
+                continue
+            result = self.app.hydrate(gids, resource_type, opt_fields=fields[resource_type], max_concurrency=self.max_concurrency)
+            failures = {error["gid"]: error for error in result["errors"]}
+            for gid, record in zip(gids, result["data"], strict=True):
+                if record is not None:
+                    changes[{"task": "tasks", "story": "stories", "section": "sections"}[resource_type]][gid] = record
+                elif failures.get(gid, {}).get("status_code") in (403, 404):
+                    changes["deleted"].append((resource_type, gid))
+                else:
+                    raise httpx.HTTPError(f"Could not fetch {resource_type} {gid}: {failures.get(gid)}")
+        # Tasks that just arrived bring their subtrees and stories with them.
+        with ThreadPoolExecutor(max_workers=self.max_concurrency, thread_name_prefix="asana-mirror") as pool:
+            parents = [task for gid, task in changes["tasks"].items() if gid in changes["added_tasks"] and task.get("num_subtasks")]
+            while parents:
+                level = [subtask for subtasks in pool.map(self._subtasks, [p["gid"] for p in parents]) for subtask in subtasks]
+                changes["tasks"].update((subtask["gid"], subtask) for subtask in level)
+                changes["added_tasks"].update(subtask["gid"] for subtask in level)
+                parents = [task for task in level if task.get("num_subtasks")]
+            if self.include_stories and changes["added_tasks"]:
+                for page in pool.map(self._stories, sorted(changes["added_tasks"])):
+                    changes["stories"].update((story["gid"], story) for story in page)
+        return changes
+
+    def _apply(self, project_gid: str, changes: dict[str, Any]) -> None:
+        if changes["project"]:
+            self._db.execute("UPDATE projects SET name = ? WHERE gid = ?", (changes["project"].get("name"), project_gid))
+        for resource_type, gid in changes["deleted"]:
+            if resource_type == "task":
+                self._db.execute("DELETE FROM tasks WHERE gid = ?", (gid,))
+            elif resource_type == "story":
+                self._db.execute("DELETE FROM stories WHERE gid = ?", (gid,))
+            else:
+                self._db.execute("DELETE FROM sections WHERE gid = ?", (gid,))
+        for gid, section in changes["sections"].items():
+            owner = str(((section.get("project") or {}).get("gid")) or project_gid)
+            position = self._db.execute(
+                "SELECT COALESCE((SELECT position FROM sections WHERE gid = ?), (SELECT COUNT(*) FROM sections WHERE project_gid = ?))",
+                (gid, owner),
+            ).fetchone()[0]
+            self._db.execute(
+                "INSERT OR REPLACE INTO sections (gid, project_gid, name, position) VALUES (?, ?, ?, ?)",
+                (gid, owner, section.get("name"), position),
+            )
+        for task in changes["tasks"].values():
+            self._upsert_task(task)
+        for story in changes["stories"].values():
+            self._upsert_story(story)
+        self._prune()
+
+    def _upsert_task(self, task: dict[str, Any]) -> None:
+        gid = str(task["gid"])
+        assignee = task.get("assignee") or {}
+        self._db.execute(
+            "INSERT OR REPLACE INTO tasks (gid, name, completed, assignee_gid, assignee_name, due_on, modified_at, parent_gid, notes, record) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+            (
+                gid,
+                task.get("name"),
+                int(bool(task.get("completed"))),
+                assignee.get("gid"),
+                assignee.get("name"),
+                task.get("due_on"),
+                task.get("modified_at"),
+                (task.get("parent") or {}).get("gid"),
+                task.get("notes"),
+                json.dumps(task, separators=(",", ":")),
+            ),
+        )
+        self._db.execute("DELETE FROM memberships WHERE task_gid = ?", (gid,))
+        for membership in task.get("memberships") or []:
+            project = (membership.get("project") or {}).get("gid")
+            if project:
+                self._db.execute(
+                    "INSERT OR REPLACE INTO memberships (task_gid, project_gid, section_gid) VALUES (?, ?, ?)",
+                    (gid, project, (membership.get("section") or {}).get("gid")),
+                )
+        self._db.execute("DELETE FROM custom_field_values WHERE task_gid = ?", (gid,))
+        for field in task.get("custom_fields") or []:
+            self._db.execute(
+                "INSERT OR REPLACE INTO custom_field_values (task_gid, field_gid, name, display_value, number_value) VALUES (?, ?, ?, ?, ?)",
+                (gid, field["gid"], field.get("name"), field.get("display_value"), field.get("number_value")),
+            )
+
+    def _upsert_story(self, story: dict[str, Any]) -> None:
+        task_gid = (story.get("target") or {}).get("gid")
+        if task_gid:
+            self._db.execute(
+                "INSERT OR REPLACE INTO stories (gid, task_gid, created_at, record) VALUES (?, ?, ?, ?)",
+                (story["gid"], task_gid, story.get("created_at"), json.dumps(story, separators=(",", ":"))),
+            )
+
+    def _prune(self) -> None:
+        # Keeps the tasks of mirrored projects and their subtrees, and whatever
+        # hangs off them; a task moved out of every mirrored project goes.
+        self._db.execute(
+            """
+            WITH RECURSIVE kept(gid) AS (
+                SELECT memberships.task_gid FROM memberships JOIN tasks ON tasks.gid = memberships.task_gid
+                WHERE memberships.project_gid IN (SELECT gid FROM projects)
+                UNION SELECT tasks.gid FROM tasks JOIN kept ON tasks.parent_gid = kept.gid
+            )
+            DELETE FROM tasks WHERE gid NOT IN (SELECT gid FROM kept)
+            """
+        )
+        self._db.execute("DELETE FROM memberships WHERE task_gid NOT IN (SELECT gid FROM tasks)")
+        self._db.execute("DELETE FROM custom_field_values WHERE task_gid NOT IN (SELECT gid FROM tasks)")
+        self._db.execute("DELETE FROM stories WHERE task_gid NOT IN (SELECT gid FROM tasks)")
+        self._db.execute("DELETE FROM sections WHERE project_gid NOT IN (SELECT gid FROM projects)")
+
+
+def _now() -> str:
+    return format_timestamp(datetime.now(timezone.utc))
@@ -0,0 +1,492 @@
+import bisect
+import threading
+import time
+from typing import Any
+
+from loguru import logger
+
+from universal_mcp_asana.batch import SingleFlight
+
+# How each kind of name is listed: the collection it lives in, the container
+# it is listed under, the `iter_*` method that lists it, and the fields kept.
+RESOLVABLE = {
+    "user": ("users", "workspace", "iter_users_in_aworkspace_or_organization", "name,email"),
+    "project": ("projects", "workspace", "iter_all_projects_in_aworkspace", "name,archived,workspace"),
+    "tag": ("tags", "workspace", "iter_tags_in_aworkspace", "name,workspace"),
+    "team": ("teams", "workspace", "iter_teams_in_aworkspace", "name,organization"),
+    "section": ("sections", "project", "iter_sections_in_aproject", "name,project"),
+}
+_COLLECTIONS = {collection: resource_type for resource_type, (collection, *_) in RESOLVABLE.items()}
+
+
+def fold(name: str) -> str:
+    """Normalizes a name for case-insensitive matching: case-folded, whitespace collapsed."""
+    return " ".join(name.split()).casefold()
+
+
+class _Scope:
+    """The names of one resource type within one workspace or project, keyed for O(1) lookups."""
+
+    def __init__(self, resource_type: str, container: str) -> None:
+        self.resource_type = resource_type
+        self.container = container
+        self.records: dict[str, dict[str, Any]] = {}
+        self.loaded_at: float | None = None
+        # Each key maps to the gids carrying it, in insertion order.
+        self.by_name: dict[str, dict[str, None]] = {}
+        self.by_fold: dict[str, dict[str, None]] = {}
+        self.by_email: dict[str, dict[str, None]] = {}
+        self._sorted: list[tuple[str, str]] | None = None
+
+    def upsert(self, record: dict[str, Any]) -> None:
+        entry = {"gid": str(record["gid"]), "name": record.get("name") or ""}
+        if record.get("email"):
+            entry["email"] = record["email"]
+        if "archived" in record:
+            entry["archived"] = record["archived"]
+        gid = entry["gid"]
+        current = self.records.get(gid)
+        if current is not None:
+            self._unindex(current)
+        merged = self.records[gid] = {**(current or {}), **entry}
+        self.by_name.setdefault(merged["name"], {})[gid] = None
+        self.by_fold.setdefault(fold(merged["name"]), {})[gid] = None
+        if merged.get("email"):
+            self.by_email.setdefault(fold(merged["email"]), {})[gid] = None
+        self._sorted = None
+
+    def remove(self, gid: str) -> None:
+        record = self.records.pop(gid, None)
+        if record is not None:
+            self._unindex(record)
+            self._sorted = None
+
+    def lookup(self, query: str, limit: int) -> list[dict[str, Any]]:
+        folded = fold(query)
+        if query.isdigit() and query in self.records:
+            return [{**self.records[query], "match": "gid"}]
+        tiers = [("exact", self.by_name.get(query)), ("casefold", self.by_fold.get(folded))]
+        if "@" in query:
+            tiers.insert(0, ("email", self.by_email.get(folded)))
+        for match, gids in tiers:
+            if gids:
+                return [{**self.records[gid], "match": match} for gid in list(gids)[:limit]]
+        if self._sorted is None:
+            self._sorted = sorted((name, gid) for name, gids in self.by_fold.items() for gid in gids)
+        found = []
+        for name, gid in self._sorted[bisect.bisect_left(self._sorted, (folded, "")) :]:
+            if not name.startswith(folded) or len(found) >= limit:
+                break
+            found.append({**self.records[gid], "match": "prefix"})
+        return found
+
+    def _unindex(self, record: dict[str, Any]) -> None:
+        keys = [(self.by_name, record["name"]), (self.by_fold, fold(record["name"]))]
+        if record.get("email"):
+            keys.append((self.by_email, fold(record["email"])))
+        for index, key in keys:
+            gids = index.get(key)
+            if gids is not None:
+                gids.pop(record["gid"], None)
+                if not gids:
+                    del index[key]
+
+
+class NameIndex:
+    """
+    In-memory index from the names of users, projects, tags, teams and sections to their gids.
+
+    Each workspace (or, for sections, project) is listed once on first use and
+    then kept current incrementally: records returned by writes made through
+    the app are folded in as they happen, deletes drop their gid, and a scope is
+    relisted only when a lookup in it misses and it was last listed more than
+    `miss_refresh` seconds ago, or when it is older than `max_age`.
+
+    Lookups try, in order, a gid, an email address (users only), the exact
+    name, the case-folded name and finally a case-folded prefix, and return the
+    matches of the first of these that finds any.
+    """
+
+    def __init__(self, app: Any, max_age: float = 3600, miss_refresh: float = 60) -> None:
+        """
+        Args:
+            app: The `AsanaApp` whose `iter_*` methods list the names.
+            max_age: Seconds after which a scope is relisted before a lookup.
+            miss_refresh: Minimum seconds between relistings triggered by misses.
+        """
+        self.app = app
+        self.max_age = max_age
+        self.miss_refresh = miss_refresh
+        self._scopes: dict[tuple[str, str], _Scope] = {}
+        self._lock = threading.Lock()
+        self._loads = SingleFlight()
+
+    def resolve(self, query: str, resource_type: str, container: str, limit: int = 5) -> list[dict[str, Any]]:
+        """
+        Resolves one name to the records that match it best.
+
+        Args:
+            query: A name, name prefix, email address or gid.
+            resource_type: `user`, `project`, `tag`, `team` or `section`.
+            container: The workspace gid, or the project gid for sections.
+            limit: Maximum number of matches returned.
+
+        Returns:
+            list[dict[str, Any]]: The matching records with their `gid`, `name`,
+            `email` or `archived` where known, and the kind of `match`.
+        """
+        if resource_type not in RESOLVABLE:
+            raise ValueError(f"Unsupported resource_type {resource_type!r}; expected one of {', '.join(RESOLVABLE)}")
+        query = query.strip()
+        key = (resource_type, str(container))
+        with self._lock:
+            scope = self._scopes.get(key)
+            fresh = scope is not None and time.monotonic() - scope.loaded_at <= self.max_age
+            matches = scope.lookup(query, limit) if fresh else []
+        if not fresh or (not matches and time.monotonic() - scope.loaded_at > self.miss_refresh):
+            # Listing happens outside the lock, so lookups in other scopes,
+            # and in this one meanwhile, are not held up by the network.
+            self._loads.do(key, lambda: self._load(*key))
+            with self._lock:
+                matches = self._scopes[key].lookup(query, limit)
+        return [{**match, "resource_type": resource_type} for match in matches]
+
+    def observe(self, verb: str, relative_path: str, payload: Any) -> None:
+        """
+        Folds the result of a successful write into every loaded scope it affects.
+
+        Args:
+            verb: HTTP method of the write.
+            relative_path: Request path relative to the API base URL.
+            payload: The parsed JSON response.
+        """
+        segments = [segment for segment in relative_path.split("/") if segment]
+        with self._lock:
+            if verb.upper() == "DELETE" and len(segments) == 2 and segments[0] in _COLLECTIONS:
+                for (resource_type, _), scope in self._scopes.items():
+                    if resource_type == _COLLECTIONS[segments[0]]:
+                        scope.remove(segments[1])
+                return
+            record = payload.get("data") if isinstance(payload, dict) else None
+            if not isinstance(record, dict) or record.get("resource_type") not in RESOLVABLE or not record.get("gid"):
+                return
+            resource_type = record["resource_type"]
+            container = _container_of(record, segments)
+            for (scope_type, scope_container), scope in self._scopes.items():
+                if scope_type == resource_type and (str(record["gid"]) in scope.records or scope_container == container):
+                    scope.upsert(record)
+
+    def invalidate(self, resource_type: str | None = None, container: str | None = None) -> None:
+        """Forgets loaded scopes, all of them or those matching the arguments, so they are relisted on next use."""
+        with self._lock:
+            for key in list(self._scopes):
+                if resource_type in (None, key[0]) and container in (None, key[1]):
+                    del self._scopes[key]
+
+    def _load(self, resource_type: str, container: str) -> None:
+        _, _, list_method, fields = RESOLVABLE[resource_type]
+        scope = _Scope(resource_type, container)
+        for record in getattr(self.app, list_method)(container, opt_fields=fields):
+            scope.upsert(record)
+        scope.loaded_at = time.monotonic()
+        with self._lock:
+            self._scopes[(resource_type, container)] = scope
+        logger.debug(f"Indexed {len(scope.records)} {resource_type} names in {container}")
+
+
+def _container_of(record: dict[str, Any], segments: list[str]) -> str | None:
+    # The workspace or project a written record belongs to, from the record
+    # itself or failing that from the path it was created under.
+    container_type = RESOLVABLE[record["resource_type"]][1]
+    for field in (container_type, "organization"):
+        reference = record.get(field)
+        if isinstance(reference, dict) and reference.get("gid"):
+            return str(reference["gid"])
+    if len(segments) >= 2 and segments[0] == f"{container_type}s":
+        return segments[1]
+    return None
+
+
+# The custom field properties a catalog needs to translate names and labels.
+CUSTOM_FIELD_OPT_FIELDS = "name,resource_subtype,type,enum_options,enum_options.name,enum_options.enabled"
+
+
+class _FieldTable:
+    """The custom fields available in one workspace or project, keyed for O(1) lookups."""
+
+    def __init__(self, fields: list[dict[str, Any]]) -> None:
+        self.loaded_at = time.monotonic()
+        self.by_gid: dict[str, dict[str, Any]] = {}
+        self.by_name: dict[str, list[dict[str, Any]]] = {}
+        self.options: dict[str, dict[str, str]] = {}
+        for field in fields:
+            gid = str(field["gid"])
+            self.by_gid[gid] = field
+            self.by_name.setdefault(fold(field.get("name") or ""), []).append(field)
+            self.options[gid] = {
+                fold(option.get("name") or ""): str(option["gid"])
+                for option in field.get("enum_options") or []
+                if option.get("enabled", True)
+            }
+
+
+class CustomFieldCatalog:
+    """
+    Cached custom field definitions per workspace and per project, for translating task writes.
+
+    Each table maps field gids and case-folded field names to definitions, and
+    each enum field's case-folded option labels to option gids, so translating
+    a write costs dictionary lookups once the tables are loaded. Tables are
+    loaded on first use and reloaded when a name or label is not found and
+    they are older than `miss_refresh` seconds, or after `max_age`. Writes to
+    custom fields or project field settings made through the app drop them.
+    """
+
+    def __init__(self, app: Any, max_age: float = 3600, miss_refresh: float = 60) -> None:
+        """
+        Args:
+            app: The `AsanaApp` used to list the custom fields.
+            max_age: Seconds after which a table is reloaded before use.
+            miss_refresh: Minimum seconds between reloads triggered by unknown names.
+        """
+        self.app = app
+        self.max_age = max_age
+        self.miss_refresh = miss_refresh
+        self._tables: dict[tuple[str, str], _FieldTable] = {}
+        self._lock = threading.RLock()
+
+    def translate(
+        self,
+        custom_fields: dict[str, Any],
+        workspace: str | None = None,
+        projects: list[str] = (),
+    ) -> dict[str, Any]:
+        """
+        Rewrites a task's `custom_fields` from names and labels to gids.
+
+        Keys may be field gids or names. Enum values may be option gids or
+        labels, multi-enum values lists (or comma-separated strings) of either.
+        Other values are passed through. Names are looked up in the projects'
+        fields first, then the workspace's.
+
+        Args:
+            custom_fields: The `custom_fields` of a task create or update.
+            workspace: The task's workspace gid.
+            projects: The gids of the task's projects.
+
+        Returns:
+            dict[str, Any]: The same values keyed by field gid, with option gids for enum values.
+
+        Raises:
+            ValueError: If a field name or option label is unknown or ambiguous.
+        """
+        scopes = [("project", str(project)) for project in projects or ()]
+        if workspace:
+            scopes.append(("workspace", str(workspace)))
+        translated = {}
+        with self._lock:
+            for key, value in custom_fields.items():
+                field = self._field(str(key), scopes)
+                if field is None:
+                    if not str(key).isdigit():
+                        raise ValueError(f"Unknown custom field {key!r}")
+                    translated[str(key)] = value
+                    continue
+                translated[str(field["gid"])] = self._value(field, value, scopes)
+        return translated
+
+    def observe(self, verb: str, relative_path: str) -> None:
+        """Drops the tables a successful write to custom fields or field settings may have changed."""
+        if "custom_field" in relative_path.lower() or relative_path.startswith("/enum_options"):
+            with self._lock:
+                self._tables.clear()
+
+    def _table(self, scope: tuple[str, str], reload: bool = False) -> _FieldTable:
+        table = self._tables.get(scope)
+        if table is not None and not reload and time.monotonic() - table.loaded_at <= self.max_age:
+            return table
+        kind, gid = scope
+        if kind == "project":
+            settings = self.app.iter_aproject_scustom_fields(
+                gid, opt_fields=",".join(f"custom_field.{field}" for field in CUSTOM_FIELD_OPT_FIELDS.split(","))
+            )
+            fields = [setting["custom_field"] for setting in settings if setting.get("custom_field")]
+        else:
+            fields = list(self.app.iter_aworkspace_scustom_fields(gid, opt_fields=CUSTOM_FIELD_OPT_FIELDS))
+        table = self._tables[scope] = _FieldTable(fields)
+        logger.debug(f"Loaded {len(fields)} custom fields of {kind} {gid}")
+        return table
+
+    def _field(self, key: str, scopes: list[tuple[str, str]]) -> dict[str, Any] | None:
+        for reload in (False, True):
+            for scope in scopes:
+                table = self._table(scope)
+                if reload:
+                    if time.monotonic() - table.loaded_at <= self.miss_refresh:
+                        continue
+                    table = self._table(scope, reload=True)
+                if key in table.by_gid:
+                    return table.by_gid[key]
+                matches = table.by_name.get(fold(key))
+                if matches and len(matches) > 1:
+                    raise ValueError(f"Custom field name {key!r} is ambiguous: {', '.join(m['gid'] for m in matches)}")
+                if matches:
+                    return matches[0]
+        return None
+
+    def _value(self, field: dict[str, Any], value: Any, scopes: list[tuple[str, str]]) -> Any:
+        subtype = field.get("resource_subtype") or field.get("type")
+        if subtype == "enum":
+            return None if value is None else self._option(field, value, scopes)
+        if subtype == "multi_enum":
+            labels = [part.strip() for part in value.split(",") if part.strip()] if isinstance(value, str) else value or []
+            return [self._option(field, label, scopes) for label in labels]
+        return value
+
+    def _option(self, field: dict[str, Any], label: Any, scopes: list[tuple[str, str]]) -> str:
+        gid = str(field["gid"])
+        label = str(label)
+        for scope in scopes:
+            options = self._table(scope).options.get(gid)
+            if options is None:
+                continue
+            if label in options.values():
+                return label
+            if fold(label) in options:
+                return options[fold(label)]
+            if time.monotonic() - self._table(scope).loaded_at > self.miss_refresh:
+                options = self._table(scope, reload=True).options.get(gid) or {}
+                if fold(label) in options:
+                    return options[fold(label)]
+        if label.isdigit():
+            return label
+        raise ValueError(f"Unknown option {label!r} for custom field {field.get('name')!r}")
+
+
+# Asana's default number of typeahead results.
+TYPEAHEAD_DEFAULT_COUNT = 20
+
+
+class _TrieNode:
+    __slots__ = ("children", "results", "count", "expires_at")
+
+    def __init__(self) -> None:
+        self.children: dict[str, _TrieNode] = {}
+        self.results: list[dict[str, Any]] | None = None
+        self.count = 0
+        self.expires_at = 0.0
+
+
+class TypeaheadCache:
+    """
+    Prefix trie of typeahead results per workspace, resource type and opt_fields.
+
+    Every query's results are stored at the node of its case-folded text for
+    `ttl` seconds. A stored result set smaller than the `count` it was asked
+    with holds everything matching its query, and Asana matches typeahead
+    queries against word prefixes, so a longer query can be answered from it
+    by keeping the records with a word (or, for users, an email address) that
+    starts with the longer text. Lookups use the deepest such node on the
+    query's path, or the query's own node when it was asked with at least as
+    large a `count`. Filtered answers keep Asana's order.
+    """
+
+    def __init__(self, ttl: float = 10.0, max_nodes: int = 50000) -> None:
+        """
+        Args:
+            ttl: Seconds a result set is used for.
+            max_nodes: Trie nodes kept before everything is dropped.
+        """
+        self.ttl = ttl
+        self.max_nodes = max_nodes
+        self._roots: dict[tuple, _TrieNode] = {}
+        self._nodes = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, workspace: str, resource_type: str, query: str, count: Any = None, opt_fields: str | None = None) -> list[dict[str, Any]] | None:
+        """
+        Answers a typeahead query from the trie, or returns None on a miss.
+
+        Args:
+            workspace: Workspace gid.
+            resource_type: The `resource_type` of the query.
+            query: The query text.
+            count: The number of results asked for.
+            opt_fields: The opt_fields of the query.
+
+        Returns:
+            list[dict[str, Any]] | None: The results, at most `count` of them.
+        """
+        count = int(count or TYPEAHEAD_DEFAULT_COUNT)
+        folded = fold(query)
+        now = time.monotonic()
+        with self._lock:
+            node = self._roots.get(_trie_key(workspace, resource_type, opt_fields))
+            best = None
+            depth = 0
+            while node is not None:
+                fresh = node.results is not None and node.expires_at > now
+                if fresh and (len(node.results) < node.count or (depth == len(folded) and node.count >= count)):
+                    best = (node, depth)
+                if depth == len(folded):
+                    break
+                node = node.children.get(folded[depth])
+                depth += 1
+            if best is None:
+                self.misses += 1
+                return None
+            node, depth = best
+            if depth == len(folded):
+                results = node.results
+            elif all("name" in record for record in node.results):
+                results = [record for record in node.results if _matches(record, folded)]
+            else:
+                self.misses += 1
+                return None
+            self.hits += 1
+            return results[:count]
+
+    def put(self, workspace: str, resource_type: str, query: str, count: Any, opt_fields: str | None, results: list[dict[str, Any]]) -> None:
+        """Stores the results Asana returned for a query."""
+        folded = fold(query)
+        with self._lock:
+            if self._nodes + len(folded) > self.max_nodes:
+                self._roots.clear()
+                self._nodes = 0
+            key = _trie_key(workspace, resource_type, opt_fields)
+            node = self._roots.get(key)
+            if node is None:
+                node = self._roots[key] = _TrieNode()
+                self._nodes += 1
+            for char in folded:
+                child = node.children.get(char)
+                if child is None:
+                    child = node.children[char] = _TrieNode()
+                    self._nodes += 1
+                node = child
+            node.results = list(results)
+            node.count = int(count or TYPEAHEAD_DEFAULT_COUNT)
+            node.expires_at = time.monotonic() + self.ttl
+
+    def clear(self) -> None:
+        with self._lock:
+            self._roots.clear()
+            self._nodes = 0
+
+    def stats(self) -> dict[str, Any]:
+        with self._lock:
+            return {"nodes": self._nodes, "hits": self.hits, "misses": self.misses}
+
+
+def _trie_key(workspace: str, resource_type: str, opt_fields: str | None) -> tuple:
+    fields = frozenset(field.strip() for field in (opt_fields or "").split(",") if field.strip())
+    return str(workspace), resource_type, fields
+
+
+def _matches(record: dict[str, Any], folded_query: str) -> bool:
+    name = fold(record.get("name") or "")
+    if f" {name}".find(f" {folded_query}") >= 0:
+        return True
+    return fold(record.get("email") or "").startswith(folded_query)
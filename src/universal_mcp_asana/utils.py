@@ -0,0 +1,67 @@
+import queue
+import threading
+from collections.abc import Iterator
+from datetime import datetime, timezone
+from typing import Any
+
+
+def parse_timestamp(value: str) -> datetime:
+    """Parses an ISO 8601 date or datetime as an aware UTC datetime truncated to milliseconds."""
+    parsed = datetime.fromisoformat(value)
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=timezone.utc)
+    return parsed.astimezone(timezone.utc).replace(microsecond=parsed.microsecond // 1000 * 1000)
+
+
+def format_timestamp(value: datetime) -> str:
+    """Formats a datetime the way the Asana API writes them, e.g. 2019-04-15T01:01:46.055Z."""
+    return value.astimezone(timezone.utc).strftime("%Y-%m-%dT%H:%M:%S.") + f"{value.microsecond // 1000:03d}Z"
+
+
+class Handoff:
+    """
+    Bounded queue feeding items from worker threads to one consuming generator.
+
+    Producers block while the queue is full but give up as soon as the consumer
+    closes it, so abandoning a generator early never leaves a worker stuck on a
+    full queue. Exceptions handed over with `fail` are re-raised in the consumer,
+    and `finish` ends the stream.
+    """
+
+    _DONE = object()
+
+    def __init__(self, maxsize: int) -> None:
+        self._queue = queue.Queue(maxsize=max(1, maxsize))
+        self._closed = threading.Event()
+
+    @property
+    def closed(self) -> bool:
+        return self._closed.is_set()
+
+    def put(self, item: Any) -> bool:
+        """Blocks until `item` is queued; returns False if the consumer went away first."""
+        while not self._closed.is_set():
+            try:
+                self._queue.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def fail(self, exc: BaseException) -> bool:
+        return self.put(exc)
+
+    def finish(self) -> bool:
+        return self.put(self._DONE)
+
+    def close(self) -> None:
+        self._closed.set()
+
+    def __iter__(self) -> Iterator[Any]:
+        while True:
+            item = self._queue.get()
+            if item is self._DONE:
+                return
+            if isinstance(item, BaseException):
+                raise item
+            yield item
@@ -0,0 +1,638 @@
+import asyncio
+import hashlib
+import hmac
+import json
+import os
+import re
+import threading
+import time
+from collections.abc import Iterable
+from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from datetime import datetime, timezone
+from typing import Any
+
+import httpx
+from loguru import logger
+
+from universal_mcp_asana.batch import execute_batched
+from universal_mcp_asana.eventlog import EventLog
+from universal_mcp_asana.utils import format_timestamp, parse_timestamp
+
+# Keys name a webhook's target path, so they stay URL-safe.
+WEBHOOK_KEY = re.compile(r"^[A-Za-z0-9_.-]{1,128}$")
+
+# What the reconciler needs to know about every live webhook.
+WEBHOOK_FIELDS = (
+    "active,created_at,resource,resource.name,target,filters,filters.action,filters.fields,"
+    "filters.resource_subtype,filters.resource_type,last_failure_at,last_failure_content,last_success_at"
+)
+
+_REASONS = {
+    200: "OK",
+    400: "Bad Request",
+    401: "Unauthorized",
+    403: "Forbidden",
+    404: "Not Found",
+    405: "Method Not Allowed",
+    411: "Length Required",
+    413: "Payload Too Large",
+    431: "Request Header Fields Too Large",
+    503: "Service Unavailable",
+}
+
+
+class SecretStore:
+    """
+    Webhook secrets keyed by target key, optionally persisted to a JSON file.
+
+    The file is rewritten atomically and readable by its owner only, so
+    secrets survive restarts without ever being left half written.
+    """
+
+    def __init__(self, path: str | None = None) -> None:
+        """
+        Args:
+            path: JSON file holding the secrets; kept in memory only when omitted.
+        """
+        self.path = path
+        self._lock = threading.Lock()
+        self._secrets: dict[str, str] = {}
+        if path is not None:
+            try:
+                with open(path, encoding="utf-8") as handle:
+                    self._secrets = json.load(handle)
+            except FileNotFoundError:
+                pass
+
+    def get(self, key: str) -> str | None:
+        with self._lock:
+            return self._secrets.get(key)
+
+    def set(self, key: str, secret: str) -> None:
+        with self._lock:
+            self._secrets[key] = secret
+            self._save()
+
+    def remove(self, key: str) -> None:
+        with self._lock:
+            if self._secrets.pop(key, None) is not None:
+                self._save()
+
+    def keys(self) -> list[str]:
+        with self._lock:
+            return sorted(self._secrets)
+
+    def _save(self) -> None:
+        if self.path is None:
+            return
+        temporary = f"{self.path}.tmp"
+        descriptor = os.open(temporary, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        with os.fdopen(descriptor, "w", encoding="utf-8") as handle:
+            json.dump(self._secrets, handle)
+            handle.flush()
+            os.fsync(handle.fileno())
+        os.replace(temporary, self.path)
+
+
+class WebhookReceiver:
+    """
+    Embedded asyncio HTTP server that receives Asana webhook deliveries.
+
+    Every webhook targets `{public_url}{path_prefix}/{key}`, where the key
+    identifies the subscription on this side; `target_for` builds that URL for
+    `establish_awebhook`. The receiver:
+
+    - completes the `X-Hook-Secret` handshake by echoing the secret and keeps
+      it for the key. Every handshake must be announced with `expect` first,
+      as `WebhookReconciler` does before creating a webhook, so nobody can
+      claim a key or take over an established webhook. With `open_handshakes`
+      on, a key's first handshake is accepted unannounced.
+    - verifies the `X-Hook-Signature` of every delivery, an HMAC-SHA256 of the
+      raw body keyed with the secret, comparing in constant time.
+    - puts each delivery that carries events on a bounded queue. When the queue
+      stays full for `enqueue_timeout` seconds the delivery is refused with a
+      503, so Asana retries it later instead of the receiver buffering without
+      bound. Heartbeats, deliveries without events, are only acknowledged.
+    - with an `EventLog`, appends every event of a delivery to the log instead
+      and acknowledges it right away. Consumers then read the log through
+      their own subscribers at their own pace, and a slow or restarting
+      consumer never delays the acknowledgement Asana waits for.
+
+    The server runs on an event loop of its own: `start` and `stop` from
+    asyncio code, or `start_in_thread` and `stop_in_thread` from threaded code,
+    which consumes deliveries with `get_blocking`.
+    """
+
+    def __init__(
+        self,
+        host: str = "127.0.0.1",
+        port: int = 8080,
+        public_url: str | None = None,
+        path_prefix: str = "/webhooks",
+        secrets_path: str | None = None,
+        max_queue: int = 1000,
+        enqueue_timeout: float = 5.0,
+        max_body: int = 4 * 1024 * 1024,
+        open_handshakes: bool = False,
+        handshake_ttl: float = 300.0,
+        idle_timeout: float = 30.0,
+        log: EventLog | None = None,
+    ) -> None:
+        """
+        Args:
+            host: Interface to listen on.
+            port: Port to listen on; 0 picks a free one, readable from `port` once started.
+            public_url: Externally reachable origin of the receiver, e.g. `https://hooks.example.com`.
+            path_prefix: Path under which every webhook target lives.
+            secrets_path: JSON file persisting the handshake secrets; in memory only when omitted.
+            max_queue: Deliveries held for consumers before new ones wait.
+            enqueue_timeout: Seconds a delivery waits for queue space before it is refused.
+            max_body: Largest request body accepted, in bytes.
+            open_handshakes: Accept the first handshake of a key without an `expect`.
+            handshake_ttl: Seconds an `expect` stays valid.
+            idle_timeout: Seconds an idle connection is kept open.
+            log: Durable log receiving every event in place of the queue.
+        """
+        self.host = host
+        self.port = port
+        self.public_url = public_url
+        self.path_prefix = "/" + path_prefix.strip("/")
+        self.secrets = SecretStore(secrets_path)
+        self.max_queue = max_queue
+        self.enqueue_timeout = enqueue_timeout
+        self.max_body = max_body
+        self.open_handshakes = open_handshakes
+        self.handshake_ttl = handshake_ttl
+        self.idle_timeout = idle_timeout
+        self.log = log
+        self.counters = {"handshakes": 0, "deliveries": 0, "events": 0, "heartbeats": 0, "rejected": 0, "refused": 0}
+        self._expected: dict[str, float] = {}
+        self._queue: asyncio.Queue | None = None
+        self._server: asyncio.AbstractServer | None = None
+        self._connections: set[asyncio.Task] = set()
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._thread: threading.Thread | None = None
+
+    def target_for(self, key: str) -> str:
+        """
+        Builds the target URL of the webhook identified by `key`.
+
+        Raises:
+            ValueError: If the key is not URL-safe or no `public_url` was given.
+        """
+        if not WEBHOOK_KEY.match(key):
+            raise ValueError(f"Invalid webhook key {key!r}")
+        return f"{self.target_prefix}{key}"
+
+    @property
+    def target_prefix(self) -> str:
+        """The part of every target URL that precedes the key."""
+        if not self.public_url:
+            raise ValueError("WebhookReceiver needs a public_url to build webhook targets")
+        return f"{self.public_url.rstrip('/')}{self.path_prefix}/"
+
+    def expect(self, key: str) -> None:
+        """Allows one handshake for `key` within `handshake_ttl` seconds, replacing any secret it has."""
+        if not WEBHOOK_KEY.match(key):
+            raise ValueError(f"Invalid webhook key {key!r}")
+        self._expected[key] = time.monotonic() + self.handshake_ttl
+
+    def forget(self, key: str) -> None:
+        """Drops the secret of `key`, so its deliveries are rejected from now on."""
+        self._expected.pop(key, None)
+        self.secrets.remove(key)
+
+    async def start(self) -> None:
+        """Binds the server and starts accepting connections on the running loop."""
+        self._loop = asyncio.get_running_loop()
+        self._queue = asyncio.Queue(maxsize=max(1, self.max_queue))
+        self._server = await asyncio.start_server(self._serve, self.host, self.port)
+        self.port = self._server.sockets[0].getsockname()[1]
+        logger.info(f"Webhook receiver listening on {self.host}:{self.port}{self.path_prefix}/")
+
+    async def stop(self) -> None:
+        if self._server is not None:
+            self._server.close()
+            # Idle keep-alive connections would otherwise hold the server open;
+            # a delivery cut short is never acknowledged, so Asana resends it.
+            for connection in list(self._connections):
+                connection.cancel()
+            await asyncio.gather(*self._connections, return_exceptions=True)
+            await self._server.wait_closed()
+            self._server = None
+
+    async def get(self) -> dict[str, Any]:
+        """
+        Waits for the next delivery.
+
+        Returns:
+            dict[str, Any]: The `key` it was addressed to, its `events` and when it was `received_at`.
+        """
+        return await self._queue.get()
+
+    def start_in_thread(self) -> None:
+        """Runs the server on an event loop in a background thread and returns once it is listening."""
+        if self._thread is not None and self._thread.is_alive():
+            return
+        started = threading.Event()
+        failure: list[BaseException] = []
+
+        def run() -> None:
+            loop = asyncio.new_event_loop()
+            asyncio.set_event_loop(loop)
+            try:
+                loop.run_until_complete(self.start())
+            except BaseException as exc:
+                failure.append(exc)
+                started.set()
+                loop.close()
+                return
+            started.set()
+            try:
+                loop.run_forever()
+            finally:
+                loop.run_until_complete(self.stop())
+                loop.close()
+
+        self._thread = threading.Thread(target=run, name="asana-webhook-receiver", daemon=True)
+        self._thread.start()
+        started.wait()
+        if failure:
+            self._thread = None
+            raise failure[0]
+
+    def stop_in_thread(self) -> None:
+        if self._thread is None:
+            return
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join()
+        self._thread = None
+
+    def get_blocking(self, timeout: float | None = None) -> dict[str, Any] | None:
+        """
+        Waits for the next delivery from a thread other than the receiver's.
+
+        Args:
+            timeout: Seconds to wait; forever when omitted.
+
+        Returns:
+            dict[str, Any] | None: The delivery, or None if none arrived in time.
+        """
+        future = asyncio.run_coroutine_threadsafe(self._queue.get(), self._loop)
+        try:
+            return future.result(timeout)
+        except FutureTimeoutError:
+            future.cancel()
+            return None
+
+    def stats(self) -> dict[str, Any]:
+        stats = {
+            **self.counters,
+            "queued": self._queue.qsize() if self._queue is not None else 0,
+            "webhooks": len(self.secrets.keys()),
+        }
+        if self.log is not None:
+            stats["log"] = self.log.stats()
+        return stats
+
+    async def _serve(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        connection = asyncio.current_task()
+        self._connections.add(connection)
+        try:
+            while True:
+                request = await self._read_request(reader)
+                if request is None:
+                    break
+                if isinstance(request, int):
+                    await self._respond(writer, request, close=True)
+                    break
+                method, path, headers, body = request
+                status, extra = await self._dispatch(method, path, headers, body)
+                close = headers.get("connection", "").lower() == "close"
+                await self._respond(writer, status, extra, close=close)
+                if close:
+                    break
+        except (asyncio.TimeoutError, asyncio.IncompleteReadError, ConnectionError):
+            pass
+        finally:
+            self._connections.discard(connection)
+            writer.close()
+
+    async def _read_request(self, reader: asyncio.StreamReader) -> tuple | int | None:
+        line = await asyncio.wait_for(reader.readline(), self.idle_timeout)
+        if not line:
+            return None
+        parts = line.decode("latin-1").split()
+        if len(parts) != 3:
+            return 400
+        method, target, _ = parts
+        headers = {}
+        while True:
+            line = await asyncio.wait_for(reader.readline(), self.idle_timeout)
+            if line in (b"\r\n", b"\n", b""):
+                break
+            if len(headers) >= 100:
+                return 431
+            name, _, value = line.decode("latin-1").partition(":")
+            headers[name.strip().lower()] = value.strip()
+        body = b""
+        if "transfer-encoding" in headers:
+            return 411
+        if headers.get("content-length"):
+            try:
+                length = int(headers["content-length"])
+            except ValueError:
+                return 400
+            if length > self.max_body:
+                return 413
+            body = await asyncio.wait_for(reader.readexactly(length), self.idle_timeout)
+        return method.upper(), target.split("?", 1)[0], headers, body
+
+    async def _dispatch(self, method: str, path: str, headers: dict[str, str], body: bytes) -> tuple[int, dict[str, str]]:
+        prefix, _, key = path.rpartition("/")
+        if prefix != self.path_prefix or not WEBHOOK_KEY.match(key):
+            return 404, {}
+        if method != "POST":
+            return 405, {"Allow": "POST"}
+        if "x-hook-secret" in headers:
+            return self._handshake(key, headers["x-hook-secret"])
+        secret = self.secrets.get(key)
+        signature = headers.get("x-hook-signature", "")
+        expected = hmac.new(secret.encode(), body, hashlib.sha256).hexdigest() if secret else ""
+        if not secret or not hmac.compare_digest(expected, signature):
+            self.counters["rejected"] += 1
+            logger.warning(f"Rejected webhook delivery to {key}: {'bad signature' if secret else 'no handshake'}")
+            return 401, {}
+        try:
+            events = json.loads(body or b"{}").get("events") or []
+        except (ValueError, AttributeError):
+            return 400, {}
+        if not events:
+            self.counters["heartbeats"] += 1
+            return 200, {}
+        received_at = format_timestamp(datetime.now(timezone.utc))
+        if self.log is not None:
+            records = [{"key": key, "received_at": received_at, "event": event} for event in events]
+            try:
+                # Appends write and may fsync, which must not stall the event loop.
+                await asyncio.get_running_loop().run_in_executor(None, self.log.append, records)
+            except (OSError, ValueError) as exc:
+                self.counters["refused"] += 1
+                logger.error(f"Could not log {len(events)} events for {key}: {exc}")
+                return 503, {}
+            self.counters["deliveries"] += 1
+            self.counters["events"] += len(events)
+            return 200, {}
+        delivery = {"key": key, "events": events, "received_at": received_at}
+        try:
+            await asyncio.wait_for(self._queue.put(delivery), self.enqueue_timeout)
+        except asyncio.TimeoutError:
+            self.counters["refused"] += 1
+            logger.warning(f"Webhook queue full; refusing {len(events)} events for {key}")
+            return 503, {"Retry-After": str(max(1, round(self.enqueue_timeout)))}
+        self.counters["deliveries"] += 1
+        self.counters["events"] += len(events)
+        return 200, {}
+
+    def _handshake(self, key: str, secret: str) -> tuple[int, dict[str, str]]:
+        expected = self._expected.pop(key, 0) > time.monotonic()
+        if not expected and (not self.open_handshakes or self.secrets.get(key) is not None):
+            self.counters["rejected"] += 1
+            logger.warning(f"Rejected unannounced webhook handshake for {key}")
+            return 403, {}
+        if not secret:
+            return 400, {}
+        self.secrets.set(key, secret)
+        self.counters["handshakes"] += 1
+        logger.info(f"Completed webhook handshake for {key}")
+        return 200, {"X-Hook-Secret": secret}
+
+    async def _respond(self, writer: asyncio.StreamWriter, status: int, headers: dict[str, str] | None = None, close: bool = False) -> None:
+        lines = [f"HTTP/1.1 {status} {_REASONS.get(status, 'Error')}", "Content-Length: 0"]
+        lines += [f"{name}: {value}" for name, value in (headers or {}).items()]
+        if close:
+            lines.append("Connection: close")
+        writer.write(("\r\n".join(lines) + "\r\n\r\n").encode("latin-1"))
+        await writer.drain()
+
+
+class WebhookReconciler:
+    """
+    Converges a workspace's webhooks on a declared set of subscriptions.
+
+    A subscription is a resource gid and its filters. Every subscription's
+    target is derived from its resource, through a `target` template holding
+    `{resource}` or through a `WebhookReceiver`, and only live webhooks whose
+    target starts the same way are managed, so other integrations' webhooks in
+    the workspace are left alone.
+
+    The plan compares the declared subscriptions with the live list:
+
+    - a subscription with no webhook is created;
+    - a webhook whose filters differ is updated in place;
+    - a webhook nobody declares any more, or that duplicates another one for
+      the same resource and target, is deleted;
+    - a webhook is unhealthy when it is inactive or its `last_failure_at` is
+      later than its `last_success_at`. Unhealthy webhooks are always
+      reported and, with `recreate_unhealthy`, deleted and created again.
+
+    Deletes and updates are sent through the Batch API, with rate-limited
+    actions retried. Creates are sent directly from a thread pool instead,
+    because Asana holds each `establish_awebhook` call open until the target
+    has answered the handshake. Deletes run first, so a recreated webhook never
+    collides with the one it replaces.
+    """
+
+    def __init__(
+        self,
+        app: Any,
+        workspace: str,
+        target: str | None = None,
+        receiver: WebhookReceiver | None = None,
+        recreate_unhealthy: bool = True,
+        max_concurrency: int = 8,
+    ) -> None:
+        """
+        Args:
+            app: The `AsanaApp` used to list, create, update and delete webhooks.
+            workspace: The workspace whose webhooks are reconciled.
+            target: Target URL template containing `{resource}`, e.g. `https://hooks.example.com/asana/{resource}`.
+            receiver: A `WebhookReceiver` whose targets to use instead of a template; it is told to expect every handshake.
+            recreate_unhealthy: Delete and recreate unhealthy webhooks rather than only reporting them.
+            max_concurrency: Requests in flight at once.
+
+        Raises:
+            ValueError: If neither or both of `target` and `receiver` are given, or the template lacks `{resource}`.
+        """
+        if (target is None) == (receiver is None):
+            raise ValueError("WebhookReconciler needs exactly one of target or receiver")
+        if target is not None and "{resource}" not in target:
+            raise ValueError("The target template must contain {resource}")
+        self.app = app
+        self.workspace = workspace
+        self.receiver = receiver
+        self.template = target
+        self.recreate_unhealthy = recreate_unhealthy
+        self.max_concurrency = max_concurrency
+
+    def target_for(self, resource: str) -> str:
+        if self.receiver is not None:
+            return self.receiver.target_for(resource)
+        return self.template.replace("{resource}", resource)
+
+    @property
+    def target_prefix(self) -> str:
+        if self.receiver is not None:
+            return self.receiver.target_prefix
+        return self.template.split("{resource}", 1)[0]
+
+    def plan(self, subscriptions: Iterable[dict[str, Any]]) -> dict[str, Any]:
+        """
+        Works out the minimal set of changes without applying any.
+
+        Args:
+            subscriptions: Dicts with a `resource` gid and optional `filters`.
+
+        Returns:
+            dict[str, Any]: The webhooks to `create`, `update` and `delete`, the
+            `unhealthy` ones, and the number left `unchanged`.
+        """
+        desired = {}
+        for subscription in subscriptions:
+            resource = str(subscription["resource"])
+            desired[(resource, self.target_for(resource))] = _normalize_filters(subscription.get("filters"))
+        live: dict[tuple[str, str], list[dict[str, Any]]] = {}
+        prefix = self.target_prefix
+        for webhook in self.app.iter_multiple_webhooks(workspace=self.workspace, opt_fields=WEBHOOK_FIELDS):
+            if (webhook.get("target") or "").startswith(prefix):
+                resource = str((webhook.get("resource") or {}).get("gid"))
+                live.setdefault((resource, webhook["target"]), []).append(webhook)
+
+        plan = {"create": [], "update": [], "delete": [], "unhealthy": [], "unchanged": 0}
+        for (resource, target), webhooks in live.items():
+            # The healthiest, then newest, of duplicate webhooks is the one kept.
+            webhooks.sort(key=lambda webhook: (not _unhealthy(webhook), webhook.get("created_at") or ""), reverse=True)
+            for webhook in webhooks:
+                if _unhealthy(webhook):
+                    plan["unhealthy"].append(_summary(webhook, resource, target))
+            if (resource, target) not in desired:
+                plan["delete"] += [{**_summary(webhook, resource, target), "reason": "undeclared"} for webhook in webhooks]
+                continue
+            kept, duplicates = webhooks[0], webhooks[1:]
+            plan["delete"] += [{**_summary(webhook, resource, target), "reason": "duplicate"} for webhook in duplicates]
+            filters = desired.pop((resource, target))
+            if _unhealthy(kept) and self.recreate_unhealthy:
+                plan["delete"].append({**_summary(kept, resource, target), "reason": "unhealthy"})
+                plan["create"].append({"resource": resource, "target": target, "filters": filters, "replaces": kept["gid"]})
+            elif _normalize_filters(kept.get("filters")) != filters:
+                plan["update"].append({"gid": kept["gid"], "resource": resource, "target": target, "filters": filters})
+            else:
+                plan["unchanged"] += 1
+        plan["create"] += [{"resource": resource, "target": target, "filters": filters} for (resource, target), filters in desired.items()]
+        return plan
+
+    def apply(self, plan: dict[str, Any]) -> dict[str, Any]:
+        """
+        Carries out a plan made by `plan`.
+
+        Returns:
+            dict[str, Any]: The gids `created`, `updated` and `deleted`, the
+            `unhealthy` webhooks, the `unchanged` count, and every change that
+            `failed` with its status code and errors.
+        """
+        report = {"created": [], "updated": [], "deleted": [], "unhealthy": plan["unhealthy"], "unchanged": plan["unchanged"], "failed": []}
+        deletes = ((item["gid"], {"relative_path": f"/webhooks/{item['gid']}", "method": "delete"}) for item in plan["delete"])
+        for gid, result in execute_batched(self.app, deletes, max_concurrency=self.max_concurrency):
+            # A webhook that is already gone needs no deleting.
+            if _ok(result) or result.get("status_code") == 404:
+                report["deleted"].append(gid)
+            else:
+                report["failed"].append({"op": "delete", "gid": gid, **_failure(result)})
+        updates = (
+            (item["gid"], {"relative_path": f"/webhooks/{item['gid']}", "method": "put", "data": {"filters": item["filters"]}})
+            for item in plan["update"]
+        )
+        for gid, result in execute_batched(self.app, updates, max_concurrency=self.max_concurrency):
+            if _ok(result):
+                report["updated"].append(gid)
+            else:
+                report["failed"].append({"op": "update", "gid": gid, **_failure(result)})
+        deleted = set(report["deleted"])
+        creates = []
+        for item in plan["create"]:
+            if item.get("replaces") and item["replaces"] not in deleted:
+                report["failed"].append({"op": "create", "resource": item["resource"], "status_code": None, "errors": [{"message": f"Webhook {item['replaces']} it replaces was not deleted"}]})
+            else:
+                creates.append(item)
+        with ThreadPoolExecutor(max_workers=max(1, self.max_concurrency), thread_name_prefix="asana-webhooks") as pool:
+            for item, outcome in zip(creates, pool.map(self._create, creates), strict=True):
+                if isinstance(outcome, dict):
+                    report["failed"].append({"op": "create", "resource": item["resource"], **outcome})
+                else:
+                    report["created"].append({"resource": item["resource"], "gid": outcome})
+        return report
+
+    def reconcile(self, subscriptions: Iterable[dict[str, Any]], dry_run: bool = False) -> dict[str, Any]:
+        """Plans and, unless `dry_run`, applies the changes for `subscriptions`."""
+        plan = self.plan(subscriptions)
+        logger.info(
+            f"Webhook plan for workspace {self.workspace}: {len(plan['create'])} to create, {len(plan['update'])} to update, "
+            f"{len(plan['delete'])} to delete, {len(plan['unhealthy'])} unhealthy"
+        )
+        return plan if dry_run else self.apply(plan)
+
+    def _create(self, item: dict[str, Any]) -> str | dict[str, Any]:
+        if self.receiver is not None:
+            self.receiver.expect(item["resource"])
+        data = {"resource": item["resource"], "target": item["target"]}
+        if item["filters"]:
+            data["filters"] = item["filters"]
+        try:
+            return self.app.establish_awebhook(data=data)["data"]["gid"]
+        except httpx.HTTPStatusError as exc:
+            try:
+                errors = exc.response.json().get("errors")
+            except ValueError:
+                errors = [{"message": str(exc)}]
+            return {"status_code": exc.response.status_code, "errors": errors}
+        except httpx.HTTPError as exc:
+            return {"status_code": None, "errors": [{"message": str(exc)}]}
+
+
+def _normalize_filters(filters: list[dict[str, Any]] | None) -> list[dict[str, Any]]:
+    # Filters compare as sets, ignoring key order, unset keys and field order.
+    normalized = []
+    for entry in filters or []:
+        entry = {key: value for key, value in entry.items() if value is not None}
+        if "fields" in entry:
+            entry["fields"] = sorted(entry["fields"])
+        normalized.append(entry)
+    return sorted(normalized, key=lambda entry: json.dumps(entry, sort_keys=True))
+
+
+def _unhealthy(webhook: dict[str, Any]) -> bool:
+    if webhook.get("active") is False:
+        return True
+    failed_at = webhook.get("last_failure_at")
+    if not failed_at:
+        return False
+    succeeded_at = webhook.get("last_success_at")
+    return not succeeded_at or parse_timestamp(failed_at) > parse_timestamp(succeeded_at)
+
+
+def _summary(webhook: dict[str, Any], resource: str, target: str) -> dict[str, Any]:
+    summary = {"gid": webhook["gid"], "resource": resource, "target": target}
+    for key in ("active", "last_failure_at", "last_failure_content", "last_success_at"):
+        if webhook.get(key) is not None:
+            summary[key] = webhook[key]
+    return summary
+
+
+def _ok(result: dict[str, Any]) -> bool:
+    status_code = result.get("status_code")
+    return status_code is not None and 200 <= status_code < 300
+
+
+def _failure(result: dict[str, Any]) -> dict[str, Any]:
+    return {"status_code": result.get("status_code"), "errors": (result.get("body") or {}).get("errors")}
@@ -1,3 +1,4 @@
+from datetime import UTC, datetime, timedelta
 from unittest.mock import MagicMock
 
 import pytest
@@ -15,3 +16,63 @@ def app_instance():
 
 def test_application(app_instance):
     check_application_instance(app_instance, app_name="asana")
+
+def _page(data, offset=None):
+    response = MagicMock()
+    response.json.return_value = {
+        "data": data,
+        "next_page": {"offset": offset} if offset else None,
+    }
+    return response
+
+def test_iter_follows_offsets(app_instance):
+    app_instance._get = MagicMock(side_effect=[
+        _page([{"gid": "1"}, {"gid": "2"}], offset="abc"),
+        _page([{"gid": "3"}]),
+    ])
+    gids = [task["gid"] for task in app_instance.iter_tasks_from_aproject("42")]
+    assert gids == ["1", "2", "3"]
+    first, second = app_instance._get.call_args_list
+    assert first.kwargs["params"] == {"limit": 100}
+    assert second.kwargs["params"] == {"limit": 100, "offset": "abc"}
+
+def test_iter_prefetch_matches_sequential_order(app_instance):
+    app_instance._get = MagicMock(side_effect=[
+        _page([{"gid": str(i)} for i in range(start, start + 2)], offset=f"o{start}" if start < 4 else None)
+        for start in (0, 2, 4)
+    ])
+    gids = [task["gid"] for task in app_instance.iter_multiple_tasks(project="42", prefetch=2)]
+    assert gids == ["0", "1", "2", "3", "4", "5"]
+
+def test_iter_prefetch_reraises_worker_errors(app_instance):
+    app_instance._get = MagicMock(side_effect=[_page([{"gid": "1"}], offset="x"), RuntimeError("boom")])
+    tasks = app_instance.iter_tasks_from_aproject("42", prefetch=1)
+    assert next(tasks)["gid"] == "1"
+    with pytest.raises(RuntimeError, match="boom"):
+        next(tasks)
+
+def test_search_all_tasks_bisects_full_windows(app_instance):
+    start = datetime(2024, 1, 1, tzinfo=UTC)
+    created = {str(i): start + timedelta(seconds=i * 7) for i in range(250)}
+
+    def fake_search(workspace_gid, created_at_after=None, created_at_before=None, **kwargs):
+        after = datetime.fromisoformat(created_at_after)
+        before = datetime.fromisoformat(created_at_before)
+        hits = [{"gid": gid} for gid, at in created.items() if after < at < before]
+        return {"data": hits[:100]}
+
+    app_instance.search_tasks_in_aworkspace = MagicMock(side_effect=fake_search)
+    result = app_instance.search_all_tasks_in_aworkspace(
+        "1", created_at_after="2023-12-31T00:00:00Z", created_at_before="2024-01-02T00:00:00Z"
+    )
+    gids = [task["gid"] for task in result["data"]]
+    assert sorted(gids, key=int) == list(created)
+
+def test_iter_workspace_tasks_dedups_multi_homed_tasks(app_instance):
+    projects = {"p1": ["1", "2"], "p2": ["2", "3"], "p3": ["3", "4", "1"]}
+    app_instance.iter_all_projects_in_aworkspace = MagicMock(return_value=iter([{"gid": gid} for gid in projects]))
+    app_instance.iter_tasks_from_aproject = MagicMock(
+        side_effect=lambda project_gid, **kwargs: iter([{"gid": gid} for gid in projects[project_gid]])
+    )
+    gids = [task["gid"] for task in app_instance.iter_workspace_tasks("w", max_workers=2)]
+    assert sorted(gids) == ["1", "2", "3", "4"]
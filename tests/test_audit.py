@@ -0,0 +1,88 @@
+import io
+import json
+import time
+from datetime import UTC, datetime, timedelta
+from unittest.mock import MagicMock
+
+from universal_mcp_asana.audit import AuditLogTailer, backfill_audit_log_events
+from universal_mcp_asana.utils import format_timestamp
+
+
+def _events(*gids):
+    return [{"gid": gid, "created_at": f"2024-01-01T00:00:0{gid}.000Z"} for gid in gids]
+
+
+def test_tailer_resumes_from_checkpoint(tmp_path):
+    checkpoint = tmp_path / "audit.json"
+    app = MagicMock()
+    app.get_audit_log_events.side_effect = [
+        {"data": _events("1", "2"), "next_page": {"offset": "o1"}},
+        {"data": _events("3"), "next_page": {"offset": "o2"}},
+    ]
+    output = io.StringIO()
+    assert AuditLogTailer(app, "w", str(checkpoint), start_at="2024-01-01", page_size=2).run(output) == 3
+    assert [json.loads(line)["gid"] for line in output.getvalue().splitlines()] == ["1", "2", "3"]
+    assert json.loads(checkpoint.read_text()) == {"start_at": "2024-01-01", "offset": "o2"}
+
+    app.get_audit_log_events.side_effect = [{"data": [], "next_page": {"offset": "o2"}}]
+    resumed = AuditLogTailer(app, "w", str(checkpoint), start_at="2030-01-01", page_size=2)
+    assert resumed.run(io.StringIO()) == 0
+    assert app.get_audit_log_events.call_args.kwargs["offset"] == "o2"
+    assert app.get_audit_log_events.call_args.kwargs["start_at"] == "2024-01-01"
+
+
+def test_tailer_skips_events_already_written_when_a_page_has_no_offset(tmp_path):
+    app = MagicMock()
+    app.get_audit_log_events.side_effect = lambda workspace, start_at, **kwargs: {
+        "data": _events("2", "3") if start_at == "2024-01-01" else _events("3"),
+        "next_page": None,
+    }
+    tailer = AuditLogTailer(app, "w", str(tmp_path / "audit.json"), start_at="2024-01-01", page_size=2)
+    output = io.StringIO()
+    stop = MagicMock()
+    stop.is_set.side_effect = [False] * 4 + [True]
+
+    assert tailer.follow(output, min_interval=1, max_interval=8, stop=stop) == 2
+    assert [json.loads(line)["gid"] for line in output.getvalue().splitlines()] == ["2", "3"]
+    assert [call.args[0] for call in stop.wait.call_args_list] == [2, 4, 8]
+    assert tailer.cursor == {"start_at": "2024-01-01T00:00:03.000Z", "offset": None, "seen": ["3"]}
+    assert AuditLogTailer(app, "w", str(tmp_path / "audit.json"), page_size=1).run(output) == 0
+
+
+def test_backfill_merges_shards_in_timestamp_order():
+    start = datetime(2024, 1, 1, tzinfo=UTC)
+    log = [{"gid": str(i), "created_at": format_timestamp(start + timedelta(minutes=13 * i))} for i in range(40)]
+
+    def fake_events(workspace_gid, start_at, end_at, limit, offset, **filters):
+        hits = [event for event in log if start_at <= event["created_at"] < end_at]
+        begin = int(offset or 0)
+        return {"data": hits[begin : begin + limit], "next_page": {"offset": str(begin + limit)}}
+
+    app = MagicMock()
+    app.get_audit_log_events.side_effect = fake_events
+    events = list(
+        backfill_audit_log_events(
+            app, "w", "2024-01-01T00:00:00Z", "2024-01-02T00:00:00Z", shards=8, max_concurrency=3, page_size=2
+        )
+    )
+    assert [event["gid"] for event in events] == [event["gid"] for event in log]
+
+
+def test_backfill_pages_every_shard_concurrently():
+    def slow_events(workspace_gid, start_at, end_at, limit, offset, **filters):
+        time.sleep(0.02)
+        page = int(offset or 0)
+        events = [{"gid": f"{start_at}-{page}-{i}", "created_at": start_at} for i in range(limit)]
+        return {"data": events, "next_page": {"offset": str(page + 1)} if page < 9 else None}
+
+    app = MagicMock()
+    app.get_audit_log_events.side_effect = slow_events
+    started = time.monotonic()
+    events = list(
+        backfill_audit_log_events(
+            app, "w", "2024-01-01T00:00:00Z", "2024-01-01T04:00:00Z", shards=4, max_concurrency=4, page_size=2
+        )
+    )
+    assert len(events) == 80
+    # 40 pages of 20ms take 0.8s one after another, and 0.2s on four workers.
+    assert time.monotonic() - started < 0.6
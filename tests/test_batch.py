@@ -0,0 +1,146 @@
+import json
+import threading
+import time
+from unittest.mock import MagicMock, patch
+
+import httpx
+import pytest
+
+from universal_mcp_asana.app import AsanaApp
+
+
+@pytest.fixture
+def batching_app():
+    integration = MagicMock()
+    integration.get_credentials.return_value = {"access_token": "dummy_access_token"}
+    return AsanaApp(integration=integration, auto_batch=True, batch_window=0.05)
+
+
+def test_concurrent_gets_share_one_batch(batching_app):
+    def fake_batch(data):
+        return {
+            "data": [
+                {"status_code": 200, "body": {"data": {"gid": action["relative_path"].rsplit("/", 1)[1]}}}
+                for action in data["actions"]
+            ]
+        }
+
+    batching_app.submit_parallel_requests = MagicMock(side_effect=fake_batch)
+    results = {}
+
+    def fetch(gid):
+        results[gid] = batching_app.get_atask(gid, opt_fields="name,due_on")["data"]["gid"]
+
+    threads = [threading.Thread(target=fetch, args=(str(gid),)) for gid in range(6)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert results == {str(gid): str(gid) for gid in range(6)}
+    batching_app.submit_parallel_requests.assert_called_once()
+    actions = batching_app.submit_parallel_requests.call_args.kwargs["data"]["actions"]
+    assert actions[0]["options"] == {"fields": ["name", "due_on"]}
+
+
+def test_batched_errors_raise_http_status_error(batching_app):
+    batching_app.submit_parallel_requests = MagicMock(
+        return_value={"data": [{"status_code": 404, "body": {"errors": [{"message": "Not found"}]}}]}
+    )
+    with pytest.raises(httpx.HTTPStatusError):
+        batching_app.get_auser("123")
+
+
+def test_bulk_update_retries_only_failed_items(batching_app):
+    calls = []
+
+    def fake_batch(data):
+        calls.append([action["relative_path"] for action in data["actions"]])
+        results = []
+        for action in data["actions"]:
+            gid = action["relative_path"].rsplit("/", 1)[1]
+            if gid == "3" and len(calls) == 1:
+                results.append({"status_code": 429, "headers": {"Retry-After": "0"}, "body": {}})
+            elif gid == "7":
+                results.append({"status_code": 403, "body": {"errors": [{"message": "Forbidden"}]}})
+            else:
+                results.append({"status_code": 200, "body": {"data": {"gid": gid}}})
+        return {"data": results}
+
+    batching_app.submit_parallel_requests = MagicMock(side_effect=fake_batch)
+    with patch("universal_mcp_asana.batch.time.sleep"):
+        report = batching_app.bulk_update_tasks([(str(gid), {"completed": True}) for gid in range(12)])
+
+    assert report["succeeded"] == 11
+    assert report["failed"] == [{"task_gid": "7", "status_code": 403, "errors": [{"message": "Forbidden"}]}]
+    assert sorted(map(len, calls)) == [1, 2, 10]
+    assert ["/tasks/3"] in calls
+
+
+def test_bulk_update_reports_malformed_batch_responses_per_item(batching_app):
+    def fake_batch(data):
+        first = data["actions"][0]["relative_path"]
+        if first == "/tasks/0":
+            return {"data": []}
+        if first == "/tasks/10":
+            raise json.JSONDecodeError("Expecting value", "<html>", 0)
+        return {"data": [{"status_code": 200, "body": {}} for _ in data["actions"]]}
+
+    batching_app.submit_parallel_requests = MagicMock(side_effect=fake_batch)
+    report = batching_app.bulk_update_tasks([(str(gid), {"completed": True}) for gid in range(25)])
+
+    assert report["succeeded"] == 5
+    assert sorted(int(item["task_gid"]) for item in report["failed"]) == list(range(20))
+    assert {item["status_code"] for item in report["failed"]} == {None}
+    assert batching_app.submit_parallel_requests.call_count == 3
+
+
+def test_hydrate_keeps_input_order_and_fetches_duplicates_once(batching_app):
+    def fake_batch(data):
+        results = []
+        for action in data["actions"]:
+            gid = action["relative_path"].rsplit("/", 1)[1]
+            if gid == "404":
+                results.append({"status_code": 404, "body": {"errors": [{"message": "Not found"}]}})
+            else:
+                results.append({"status_code": 200, "body": {"data": {"gid": gid, "name": f"Task {gid}"}}})
+        return {"data": results}
+
+    batching_app.submit_parallel_requests = MagicMock(side_effect=fake_batch)
+    gids = [str(gid) for gid in range(15, 0, -1)] + ["404", "3"]
+    result = batching_app.hydrate(gids, "task", opt_fields="name")
+
+    assert [record and record["gid"] for record in result["data"]] == gids[:-2] + [None, "3"]
+    assert result["errors"] == [{"gid": "404", "status_code": 404, "errors": [{"message": "Not found"}]}]
+    assert batching_app.submit_parallel_requests.call_count == 2
+    action = batching_app.submit_parallel_requests.call_args_list[0].kwargs["data"]["actions"][0]
+    assert action == {"relative_path": "/tasks/15", "method": "get", "options": {"fields": ["name"]}}
+
+
+def test_identical_concurrent_gets_share_one_request():
+    integration = MagicMock()
+    integration.get_credentials.return_value = {"access_token": "dummy_access_token"}
+    app = AsanaApp(integration=integration, coalesce=True)
+    release = threading.Event()
+
+    def slow_get(url, params=None):
+        release.wait(1)
+        return httpx.Response(200, json={"data": [{"gid": "3"}]}, request=httpx.Request("GET", url))
+
+    results = []
+    with patch("universal_mcp.applications.application.APIApplication._get", side_effect=slow_get) as network_get:
+        threads = [
+            threading.Thread(target=lambda: results.append(app.get_sections_in_aproject("9", limit=10)))
+            for _ in range(8)
+        ]
+        for thread in threads:
+            thread.start()
+        deadline = time.monotonic() + 5
+        while app._flights.coalesced < 7 and time.monotonic() < deadline:
+            time.sleep(0.005)
+        release.set()
+        for thread in threads:
+            thread.join()
+    assert app._flights.coalesced == 7
+    network_get.assert_called_once()
+    assert results == [{"data": [{"gid": "3"}]}] * 8
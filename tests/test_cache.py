@@ -0,0 +1,175 @@
+import inspect
+import re
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import httpx
+import pytest
+
+from universal_mcp_asana.app import AsanaApp
+from universal_mcp_asana.cache import PersistentStore, ResponseCache, cache_key, mutation_effects, resource_kind
+
+BASE = "https://app.asana.com/api/1.0"
+
+
+def _response(payload, url=f"{BASE}/tasks/1"):
+    return httpx.Response(200, json=payload, request=httpx.Request("GET", url))
+
+
+@pytest.fixture
+def cached_app():
+    integration = MagicMock()
+    integration.get_credentials.return_value = {"access_token": "dummy_access_token"}
+    return AsanaApp(integration=integration, cache=True)
+
+
+def test_resource_kind_and_key_normalization():
+    assert resource_kind(f"{BASE}/tasks/123") == "tasks"
+    assert resource_kind(f"{BASE}/workspaces/1/tasks/search") == "tasks"
+    assert resource_kind(f"{BASE}/users/me") == "users"
+    assert cache_key(f"{BASE}/tasks/1", {"opt_fields": "name,due_on", "opt_pretty": "true"}) == cache_key(
+        f"{BASE}/tasks/1", {"opt_fields": "due_on, name"}
+    )
+
+
+def test_entries_expire_and_lru_respects_byte_cap():
+    cache = ResponseCache(ttls={"tasks": 10}, max_bytes=50)
+    with patch("universal_mcp_asana.cache.time.monotonic", return_value=0):
+        cache.put(f"{BASE}/tasks/1", None, _response({"data": {"gid": "1"}}))
+        cache.put(f"{BASE}/tasks/2", None, _response({"data": {"gid": "2"}}))
+        assert cache.get(f"{BASE}/tasks/1").json() == {"data": {"gid": "1"}}
+        cache.put(f"{BASE}/tasks/3", None, _response({"data": {"gid": "3"}}))
+        assert cache.get(f"{BASE}/tasks/2") is None
+    with patch("universal_mcp_asana.cache.time.monotonic", return_value=11):
+        assert cache.get(f"{BASE}/tasks/1") is None
+    assert cache.stats()["evictions"] == 1
+    assert (cache.hits, cache.misses) == (1, 2)
+
+
+def test_events_are_never_cached():
+    cache = ResponseCache()
+    cache.put(f"{BASE}/events", {"resource": "1"}, _response({"data": []}, f"{BASE}/events"))
+    assert cache.stats()["entries"] == 0
+
+
+def test_repeated_gets_are_served_from_cache(cached_app):
+    with patch("universal_mcp.applications.application.APIApplication._get") as network_get:
+        network_get.return_value = _response({"data": {"gid": "7", "name": "Launch"}}, f"{BASE}/projects/7")
+        for _ in range(5):
+            assert cached_app.get_aproject("7", opt_fields="name")["data"]["name"] == "Launch"
+    network_get.assert_called_once()
+    assert cached_app.get_response_cache_stats()["hits"] == 4
+
+
+def test_mutation_effects_cover_every_write_endpoint():
+    source = Path(inspect.getfile(AsanaApp))
+    writes = re.findall(
+        r'url = f"\{self\.base_url\}([^"]*)"\n.*\n\s+response = self\._(post|put|delete)\(', source.read_text()
+    )
+    assert len(writes) > 90
+    for template, verb in writes:
+        if template != "/batch":
+            assert mutation_effects(verb, re.sub(r"\{\w+\}", "123", template)) is not None, (verb, template)
+
+
+def test_update_evicts_listings_and_writes_through(cached_app):
+    task = {"gid": "1", "name": "Old"}
+    with patch("universal_mcp.applications.application.APIApplication._get") as network_get:
+        network_get.side_effect = [
+            _response({"data": task}),
+            _response({"data": [task, {"gid": "2"}]}, f"{BASE}/projects/9/tasks"),
+            _response({"data": {"gid": "9", "name": "Project"}}, f"{BASE}/projects/9"),
+        ]
+        cached_app.get_atask("1")
+        cached_app.get_tasks_from_aproject("9")
+        cached_app.get_aproject("9")
+    with patch("universal_mcp.applications.application.APIApplication._put") as network_put:
+        network_put.return_value = _response({"data": {"gid": "1", "name": "New"}})
+        cached_app.update_atask("1", data={"name": "New"})
+    with patch("universal_mcp.applications.application.APIApplication._get") as network_get:
+        assert cached_app.get_atask("1")["data"]["name"] == "New"
+        assert cached_app.get_aproject("9")["data"]["name"] == "Project"
+        network_get.assert_not_called()
+        network_get.return_value = _response({"data": [{"gid": "1", "name": "New"}]}, f"{BASE}/projects/9/tasks")
+        assert cached_app.get_tasks_from_aproject("9")["data"][0]["name"] == "New"
+
+
+def test_batched_writes_and_declared_kinds_invalidate(cached_app):
+    cache = cached_app.cache
+    cache.put(f"{BASE}/tasks/5/tags", None, _response({"data": []}, f"{BASE}/tasks/5/tags"))
+    cache.put(f"{BASE}/workspaces/3/tags", None, _response({"data": [{"gid": "8"}]}, f"{BASE}/workspaces/3/tags"))
+    cache.put(f"{BASE}/tags/8", None, _response({"data": {"gid": "8"}}, f"{BASE}/tags/8"))
+    actions = [{"relative_path": "/tasks/5/addTag", "method": "post", "data": {"tag": "7"}}]
+    with patch("universal_mcp.applications.application.APIApplication._post") as network_post:
+        network_post.return_value = _response({"data": [{"status_code": 200, "body": {"data": {}}}]}, f"{BASE}/batch")
+        cached_app.submit_parallel_requests(data={"actions": actions})
+    assert cache.get(f"{BASE}/tasks/5/tags") is None
+    assert cache.get(f"{BASE}/workspaces/3/tags") is not None
+    cache.apply_mutation("POST", "/tags", f"{BASE}/tags", payload={"data": {"gid": "10"}})
+    assert cache.get(f"{BASE}/workspaces/3/tags") is None
+    assert cache.get(f"{BASE}/tags/8") is not None
+
+
+def test_response_fetched_across_an_invalidation_is_not_stored():
+    cache = ResponseCache()
+    generation = cache.generation
+    cache.invalidate(["1"])
+    cache.put(f"{BASE}/tasks/1", None, _response({"data": {"gid": "1"}}), generation)
+    assert cache.stats()["entries"] == 0
+
+
+def test_persistent_tier_survives_restart_and_invalidation(tmp_path):
+    path = str(tmp_path / "cache.sqlite")
+    users = f"{BASE}/workspaces/3/users"
+    first = ResponseCache(persistent=PersistentStore(path))
+    first.put(users, None, _response({"data": [{"gid": "4", "name": "Ada"}]}, users))
+    first.put(f"{BASE}/tasks/1", None, _response({"data": {"gid": "1"}}))
+    first.persistent.close()
+
+    restarted = ResponseCache(persistent=PersistentStore(path))
+    assert restarted.get_json(users) == {"data": [{"gid": "4", "name": "Ada"}]}
+    assert restarted.get(f"{BASE}/tasks/1") is None
+    assert restarted.stats()["disk_hits"] == 1
+    restarted.invalidate(["4"])
+    restarted.persistent.close()
+    assert ResponseCache(persistent=PersistentStore(path)).get(users) is None
+
+
+def test_persistent_entries_expire_by_wall_clock(tmp_path):
+    store = PersistentStore(str(tmp_path / "cache.sqlite"), ttls={"workspaces": 100})
+    with patch("universal_mcp_asana.cache.time.time", return_value=1000):
+        ResponseCache(persistent=store).put(f"{BASE}/workspaces", None, _response({"data": []}, f"{BASE}/workspaces"))
+    with patch("universal_mcp_asana.cache.time.time", return_value=1099):
+        assert ResponseCache(persistent=store).get(f"{BASE}/workspaces") is not None
+    with patch("universal_mcp_asana.cache.time.time", return_value=1101):
+        assert ResponseCache(persistent=store).get(f"{BASE}/workspaces") is None
+
+
+def test_subset_of_cached_fields_is_projected_without_a_request(cached_app):
+    task = {
+        "gid": "1",
+        "resource_type": "task",
+        "name": "Ship",
+        "assignee": {"gid": "5", "resource_type": "user", "name": "Ada"},
+        "due_on": "2024-05-01",
+        "notes": "Long notes",
+    }
+    with patch("universal_mcp.applications.application.APIApplication._get") as network_get:
+        network_get.return_value = _response({"data": task})
+        cached_app.get_atask("1", opt_fields="name,assignee,assignee.name,due_on,notes")
+        assert cached_app.get_atask("1", opt_fields="due_on,name") == {
+            "data": {"gid": "1", "resource_type": "task", "name": "Ship", "due_on": "2024-05-01"}
+        }
+        assert cached_app.get_atask("1", opt_fields="assignee")["data"]["assignee"] == {"gid": "5", "resource_type": "user"}
+        network_get.assert_called_once()
+        cached_app.get_atask("1", opt_fields="name,permalink_url")
+        assert network_get.call_count == 2
+    assert cached_app.cache.stats()["projected_hits"] == 2
+
+
+def test_richer_entry_replaces_subset_entries():
+    cache = ResponseCache()
+    cache.put(f"{BASE}/tasks/1", {"opt_fields": "name"}, _response({"data": {"gid": "1", "name": "A"}}))
+    cache.put(f"{BASE}/tasks/1", {"opt_fields": "name,notes"}, _response({"data": {"gid": "1", "name": "B", "notes": ""}}))
+    assert cache.stats()["entries"] == 1
+    assert cache.get_json(f"{BASE}/tasks/1", {"opt_fields": "name"}) == {"data": {"gid": "1", "name": "B"}}
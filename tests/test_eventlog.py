@@ -0,0 +1,86 @@
+import hashlib
+import hmac
+import os
+import threading
+
+import httpx
+
+from universal_mcp_asana.eventlog import EventLog
+from universal_mcp_asana.webhooks import WebhookReceiver
+
+
+def test_log_rolls_segments_and_keeps_consumer_offsets(tmp_path):
+    directory = str(tmp_path / "log")
+    log = EventLog(directory, segment_bytes=120, fsync_interval=0)
+    assert log.append({"n": n, "pad": "x" * 20} for n in range(3)) == 3
+    assert log.append([{"n": 3, "pad": "x" * 20}]) == 4
+    assert log.stats()["segments"] == 2
+    assert [record["n"] for _, record in log.read(1, max_records=2)] == [1, 2]
+
+    fast, slow = log.subscribe("fast"), log.subscribe("slow")
+    assert [offset for offset, _ in fast.poll(max_records=10)] == [0, 1, 2, 3]
+    fast.commit()
+    assert [offset for offset, _ in slow.poll(max_records=1)] == [0]
+    slow.commit()
+    assert fast.poll() == []
+
+    waiter = []
+    thread = threading.Thread(target=lambda: waiter.extend(fast.poll(timeout=5)))
+    thread.start()
+    log.append([{"n": 4}])
+    thread.join()
+    assert [record for _, record in waiter] == [{"n": 4}]
+    log.close()
+
+    # A torn append is cut off on reopen, and consumers resume where they committed.
+    with open(os.path.join(directory, sorted(os.listdir(directory))[-2]), "ab") as segment:
+        segment.write(b"\x00\x00\x00\x30garbage")
+    log = EventLog(directory, segment_bytes=120, fsync_interval=0.01)
+    assert log.end_offset == 5
+    assert [offset for offset, _ in log.subscribe("slow").poll(max_records=10)] == [1, 2, 3, 4]
+    assert [offset for offset, _ in log.subscribe("fast").poll()] == [4]
+
+    log.commit("slow", 5)
+    log.append({"n": n, "pad": "x" * 60} for n in range(5, 8))
+    assert log.start_offset > 0
+    assert log.read(0, max_records=1)[0][0] == log.start_offset
+    log.close()
+
+
+def test_reads_skip_segments_deleted_while_reading(tmp_path):
+    log = EventLog(str(tmp_path / "log"), segment_bytes=64, fsync_interval=0)
+    log.append([{"n": 0}, {"n": 1}])
+    log.commit("consumer", 2)
+    first = log._segments[0]
+    read = first.read
+
+    def read_after_roll(index, size):
+        del first.read
+        log.append([{"n": 2}, {"n": 3}, {"n": 4}])
+        return read(index, size)
+
+    first.read = read_after_roll
+    assert [offset for offset, _ in log.read(0)] == [2, 3, 4]
+    assert not os.path.exists(first.path)
+    log.close()
+
+
+def test_receiver_acknowledges_once_events_are_logged(tmp_path):
+    log = EventLog(str(tmp_path / "log"))
+    receiver = WebhookReceiver(port=0, log=log)
+    receiver.expect("project-9")
+    receiver.start_in_thread()
+    try:
+        url = f"http://127.0.0.1:{receiver.port}/webhooks/project-9"
+        body = b'{"events": [{"action": "changed", "resource": {"gid": "1"}}, {"action": "added", "resource": {"gid": "2"}}]}'
+        with httpx.Client() as client:
+            client.post(url, headers={"X-Hook-Secret": "k"})
+            signature = hmac.new(b"k", body, hashlib.sha256).hexdigest()
+            assert client.post(url, content=body, headers={"X-Hook-Signature": signature}).status_code == 200
+        records = log.subscribe("consumer").poll(max_records=10)
+        assert [(record["key"], record["event"]["resource"]["gid"]) for _, record in records] == [("project-9", "1"), ("project-9", "2")]
+        assert receiver.get_blocking(timeout=0.05) is None
+        assert receiver.stats()["log"]["end_offset"] == 2
+    finally:
+        receiver.stop_in_thread()
+        log.close()
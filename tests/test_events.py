@@ -0,0 +1,228 @@
+import time
+from unittest.mock import MagicMock, patch
+
+import httpx
+
+from universal_mcp_asana.cache import ResponseCache
+from universal_mcp_asana.events import CacheCoherence, EventCoalescer, EventPoller
+
+BASE = "https://app.asana.com/api/1.0"
+
+
+def _put(cache, path, payload):
+    url = f"{BASE}{path}"
+    cache.put(url, None, httpx.Response(200, json=payload, request=httpx.Request("GET", url)))
+
+
+def _expired(sync):
+    request = httpx.Request("GET", f"{BASE}/events")
+    response = httpx.Response(412, json={"sync": sync}, request=request)
+    return httpx.HTTPStatusError("Precondition Failed", request=request, response=response)
+
+
+def test_events_evict_changed_entries_and_keep_the_rest():
+    cache = ResponseCache()
+    app = MagicMock()
+    coherence = CacheCoherence(app, cache)
+
+    _put(cache, "/projects/9", {"data": {"gid": "9"}})
+    app.get_events_on_aresource.side_effect = _expired("t0")
+    coherence.poll()
+    assert coherence.tokens == {"9": "t0"}
+    assert cache.stats()["entries"] == 0
+
+    _put(cache, "/projects/9/tasks", {"data": [{"gid": "1"}, {"gid": "2"}]})
+    _put(cache, "/tasks/2", {"data": {"gid": "2"}})
+    _put(cache, "/users/5", {"data": {"gid": "5"}})
+    app.get_events_on_aresource.side_effect = None
+    app.get_events_on_aresource.return_value = {"data": [], "sync": "t1", "has_more": False}
+    coherence.tokens = {"9": "t0", "2": "t0"}
+    assert coherence.poll() == 0
+
+    app.get_events_on_aresource.side_effect = lambda resource, sync: {
+        "data": [{"resource": {"gid": "1"}, "parent": {"gid": "9"}, "action": "changed"}] if resource == "9" else [],
+        "sync": "t2",
+    }
+    assert coherence.poll() == 1
+    assert cache.get(f"{BASE}/projects/9/tasks") is None
+    assert cache.get(f"{BASE}/tasks/2") is not None
+    assert cache.get(f"{BASE}/users/5") is not None
+    assert coherence.tokens == {"9": "t2", "2": "t2"}
+    coherence.poll()
+    assert coherence.tokens == {"2": "t2"}
+
+
+def test_expired_sync_token_drops_the_subtree():
+    cache = ResponseCache()
+    app = MagicMock()
+    coherence = CacheCoherence(app, cache)
+    _put(cache, "/projects/9", {"data": {"gid": "9"}})
+    _put(cache, "/workspaces/3/tasks/search", {"data": [{"gid": "4", "projects": [{"gid": "9"}]}]})
+    _put(cache, "/users/5", {"data": {"gid": "5"}})
+    coherence.tokens = {"9": "stale"}
+    app.get_events_on_aresource.side_effect = _expired("fresh")
+
+    assert coherence.poll() == 2
+    assert coherence.tokens == {"9": "fresh"}
+    assert coherence.stats() == {"watched": 1, "expired_tokens": 1}
+    assert cache.get(f"{BASE}/users/5") is not None
+
+
+
+def test_coherence_spreads_polls_under_a_request_cap():
+    cache = ResponseCache()
+    app = MagicMock()
+    app.get_events_on_aresource.return_value = {"data": [], "sync": "t", "has_more": False}
+    coherence = CacheCoherence(app, cache, max_requests=2)
+    for gid in range(5):
+        _put(cache, f"/projects/{gid}", {"data": {"gid": str(gid)}})
+    coherence.tokens = {str(gid): "t" for gid in range(5)}
+
+    polled = []
+    for _ in range(3):
+        app.get_events_on_aresource.reset_mock()
+        coherence.poll()
+        assert app.get_events_on_aresource.call_count == 2
+        polled += [call.kwargs["resource"] for call in app.get_events_on_aresource.call_args_list]
+    assert set(polled) == {str(gid) for gid in range(5)}
+
+def _missing():
+    request = httpx.Request("GET", f"{BASE}/events")
+    return httpx.HTTPStatusError("Not Found", request=request, response=httpx.Response(404, request=request))
+
+
+def _simulate(poller, clock, until):
+    polled = []
+    while (ready_at := poller.next_poll_at()) is not None and ready_at <= until:
+        clock[0] = max(clock[0], ready_at)
+        polled.append((clock[0], poller.poll_next()))
+    return polled
+
+
+def test_poller_adapts_to_event_rates_and_recovers_expired_tokens():
+    clock = [100.0]
+    app = MagicMock()
+    expire = set()
+
+    def events(resource, sync):
+        if sync is None or resource in expire:
+            expire.discard(resource)
+            raise _expired(f"{resource}-fresh")
+        if resource == "busy":
+            return {"data": [{"action": "changed", "resource": {"gid": "7"}}] * 3, "sync": f"{sync}+"}
+        return {"data": [], "sync": sync}
+
+    app.get_events_on_aresource.side_effect = events
+    received, resets = [], []
+    poller = EventPoller(app, budget=10, min_interval=1, max_interval=60)
+    with patch("universal_mcp_asana.events.time.monotonic", lambda: clock[0]):
+        poller.watch("busy", lambda gid, page: received.append((gid, len(page))), resets.append)
+        poller.watch("idle", lambda gid, page: received.append((gid, len(page))))
+        assert poller.poll_next() == "busy"
+        assert poller.poll_next() is None
+        polled = _simulate(poller, clock, 160)
+
+        counts = {gid: sum(1 for _, polled_gid in polled if polled_gid == gid) for gid in ("busy", "idle")}
+        assert counts["busy"] > 5 * counts["idle"]
+        assert poller._watches["busy"].interval == 1
+        assert poller._watches["idle"].interval >= 16
+        assert {gid for gid, _ in received} == {"busy"}
+
+        expire.add("busy")
+        _simulate(poller, clock, clock[0] + 2)
+        assert resets == ["busy"]
+        assert poller._watches["busy"].token.startswith("busy-fresh")
+        assert poller.stats()["expired_tokens"] == 1
+
+
+def test_poller_spaces_requests_and_redelivers_after_handler_failures():
+    clock = [0.0]
+    app = MagicMock()
+    app.get_events_on_aresource.side_effect = lambda resource, sync: {"data": [{"action": "added"}], "sync": "next"}
+    failing = [True]
+
+    def handler(gid, page):
+        if gid == "0" and failing[0]:
+            failing[0] = False
+            raise RuntimeError("consumer down")
+
+    poller = EventPoller(app, budget=2, min_interval=1, max_interval=30)
+    with patch("universal_mcp_asana.events.time.monotonic", lambda: clock[0]):
+        for gid in range(10):
+            poller.watch(str(gid), handler)
+        poller._watches["0"].token = "t0"
+        polled = _simulate(poller, clock, 20)
+        times = [at for at, _ in polled]
+        assert all(later - earlier >= 0.5 for earlier, later in zip(times, times[1:]))
+        assert len(polled) <= 41
+        assert {gid for _, gid in polled} == {str(gid) for gid in range(10)}
+        first_syncs = [call.kwargs["sync"] for call in app.get_events_on_aresource.call_args_list if call.kwargs["resource"] == "0"]
+        assert first_syncs[:2] == ["t0", "t0"]
+
+        app.get_events_on_aresource.side_effect = _missing()
+        _simulate(poller, clock, 40)
+        assert poller.stats()["watched"] == 0
+        assert poller.stats()["gone"] == 10
+
+
+def _event(action, gid, resource_type="task", field=None, at="2024-05-01T10:00:00.000Z", parent=None):
+    event = {"action": action, "resource": {"gid": gid, "resource_type": resource_type}, "created_at": at}
+    if field:
+        event["change"] = {"field": field, "action": "changed"}
+    if parent:
+        event["parent"] = {"gid": parent, "resource_type": "project"}
+    return event
+
+
+def test_coalescer_merges_a_burst_and_refetches_each_resource_once():
+    app = MagicMock()
+    app.cache = ResponseCache()
+    _put(app.cache, "/tasks/1", {"data": {"gid": "1", "name": "stale"}})
+    app.hydrate.side_effect = lambda gids, resource_type, opt_fields, max_concurrency: {
+        "data": [{"gid": gid, "resource_type": resource_type} for gid in gids],
+        "errors": [],
+    }
+    delivered = []
+    failures = [RuntimeError("consumer down")]
+
+    def consumer(changes):
+        if failures:
+            raise failures.pop()
+        delivered.extend(changes)
+
+    coalescer = EventCoalescer(app, consumer, window=60, opt_fields={"task": "name,notes"})
+    burst = [_event("changed", "1", field=field, at=f"2024-05-01T10:00:{second:02d}.000Z", parent="9") for second, field in enumerate(["name", "notes", "name"] * 10)]
+    coalescer.add("9", burst)
+    coalescer.add("1", [_event("added", "5", "story", at="2024-05-01T10:00:40.000Z"), _event("changed", "2"), _event("deleted", "2")])
+
+    assert coalescer.flush() == []
+    assert coalescer.stats()["pending"] == 4
+    changes = coalescer.flush()
+    assert delivered == changes
+    by_key = {(change["resource"]["gid"], change["action"]): change for change in changes}
+    assert by_key[("1", "changed")]["events"] == 30
+    assert by_key[("1", "changed")]["fields"] == ["name", "notes"]
+    assert by_key[("1", "changed")]["parents"] == ["9"]
+    assert (by_key[("1", "changed")]["first_at"], by_key[("1", "changed")]["last_at"]) == ("2024-05-01T10:00:00.000Z", "2024-05-01T10:00:29.000Z")
+    assert by_key[("1", "changed")]["record"] == {"gid": "1", "resource_type": "task"}
+    assert by_key[("5", "added")]["watched"] == ["1"]
+    assert by_key[("2", "deleted")]["record"] is None and by_key[("2", "changed")]["record"] is None
+    hydrated = [(call.args[0], call.args[1], call.kwargs["opt_fields"]) for call in app.hydrate.call_args_list]
+    assert hydrated[-2:] == [(["1"], "task", "name,notes"), (["5"], "story", None)]
+    assert app.cache.get(f"{BASE}/tasks/1") is None
+    assert coalescer.stats() == {"received": 33, "pending": 0, "delivered": 4, "refetched": 4}
+
+
+def test_coalescer_window_closes_on_its_own():
+    app = MagicMock()
+    app.cache = None
+    app.hydrate.return_value = {"data": [{"gid": "1"}], "errors": []}
+    delivered = []
+    coalescer = EventCoalescer(app, delivered.extend, window=0.05)
+    coalescer.add("9", [_event("changed", "1", field="name")])
+    coalescer.add("9", [_event("changed", "1", field="due_on")])
+    deadline = time.monotonic() + 2
+    while not delivered and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert [(change["events"], change["fields"]) for change in delivered] == [(2, ["due_on", "name"])]
+    assert app.hydrate.call_count == 1
@@ -0,0 +1,70 @@
+import json
+from unittest.mock import MagicMock
+
+import httpx
+import pytest
+
+from universal_mcp_asana.importer import TaskImporter, dependency_levels
+
+
+def _fake_batch(created, fail=()):
+    def submit_parallel_requests(data):
+        results = []
+        for action in data["actions"]:
+            name = action["data"].get("name")
+            if name in fail:
+                results.append({"status_code": 400, "body": {"errors": [{"message": "bad"}]}})
+                continue
+            gid = str(1000 + len(created))
+            created.append((action["relative_path"], name, action["data"]))
+            results.append({"status_code": 201, "body": {"data": {"gid": gid}}})
+        return {"data": results}
+
+    return submit_parallel_requests
+
+
+def test_dependency_levels_orders_parents_and_dependencies():
+    tasks = {"c": {"parent": "b"}, "a": {}, "b": {"dependencies": "a"}}
+    assert dependency_levels(tasks) == [["a"], ["b"], ["c"]]
+    with pytest.raises(ValueError, match="cycle"):
+        dependency_levels({"x": {"parent": "y"}, "y": {"dependencies": ["x"]}})
+
+
+def test_import_resumes_without_duplicates(tmp_path):
+    source = tmp_path / "plan.csv"
+    source.write_text("id,name,parent,dependencies\n1,Root,,\n2,Child,1,\n3,Follow-up,,\"1,2\"\n")
+    state = tmp_path / "state.ndjson"
+
+    created = []
+    app = MagicMock()
+    app.submit_parallel_requests.side_effect = _fake_batch(created, fail={"Child"})
+    report = TaskImporter(app, str(state), project="p").import_file(str(source))
+    assert report["created"] == 1
+    assert [failure["id"] for failure in report["failed"]] == ["2"]
+    assert report["blocked"] == ["3"]
+
+    app.submit_parallel_requests.side_effect = _fake_batch(created)
+    report = TaskImporter(app, str(state), project="p").import_file(str(source))
+    assert report == {"created": 2, "existing": 1, "failed": [], "blocked": []}
+    paths = [path for path, _, _ in created]
+    assert paths == ["/tasks", "/tasks/1000/subtasks", "/tasks", "/tasks/1002/addDependencies"]
+    assert created[-1][2] == {"dependencies": ["1000", "1001"]}
+    assert len([line for line in state.read_text().splitlines() if "gid" in json.loads(line)]) == 3
+
+
+def test_creates_are_not_resent_after_a_timeout(tmp_path):
+    created = []
+    create = _fake_batch(created)
+
+    def submit_parallel_requests(data):
+        create(data)
+        raise httpx.ReadTimeout("timed out")
+
+    app = MagicMock()
+    app.submit_parallel_requests.side_effect = submit_parallel_requests
+    importer = TaskImporter(app, str(tmp_path / "state.ndjson"), workspace="1")
+    report = importer.run({"a": {"name": "A"}})
+
+    assert len(created) == 1
+    assert app.submit_parallel_requests.call_count == 1
+    assert report["failed"][0]["id"] == "a" and report["failed"][0]["status_code"] == 503
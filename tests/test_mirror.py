@@ -0,0 +1,138 @@
+import threading
+import time
+from unittest.mock import MagicMock
+
+import httpx
+import pytest
+
+from universal_mcp_asana.app import AsanaApp
+from universal_mcp_asana.mirror import ProjectMirror
+
+
+def _expired(sync):
+    request = httpx.Request("GET", "https://app.asana.com/api/1.0/events")
+    response = httpx.Response(412, json={"sync": sync}, request=request)
+    return httpx.HTTPStatusError("Precondition Failed", request=request, response=response)
+
+
+def _task(gid, name, section=None, parent=None, **fields):
+    task = {"gid": gid, "name": name, "completed": False, "created_at": f"2024-01-0{gid}T00:00:00.000Z", **fields}
+    if section:
+        task["memberships"] = [{"project": {"gid": "9"}, "section": {"gid": section}}]
+    if parent:
+        task["parent"] = {"gid": parent}
+    return task
+
+
+@pytest.fixture
+def app():
+    app = MagicMock()
+    app.cache = None
+    app.get_events_on_aresource.side_effect = _expired("t0")
+    app.get_aproject.return_value = {"data": {"gid": "9", "name": "Launch"}}
+    app.iter_sections_in_aproject.return_value = [{"gid": "s1", "name": "Todo"}, {"gid": "s2", "name": "Done"}]
+    app.iter_tasks_from_aproject.return_value = [
+        _task(
+            "1",
+            "Write spec",
+            "s1",
+            num_subtasks=1,
+            assignee={"gid": "5", "name": "Ada", "email": "ada@example.com"},
+            custom_fields=[{"gid": "100", "name": "Priority", "display_value": "High"}],
+        ),
+        _task("2", "Ship it", "s2", completed=True),
+    ]
+    app.iter_subtasks_from_atask.side_effect = lambda gid, opt_fields: [_task("3", "Review spec", parent="1")] if gid == "1" else []
+    app.iter_stories_from_atask.side_effect = lambda gid, opt_fields: (
+        [{"gid": "70", "text": "Looks good", "created_at": "2024-01-05T00:00:00.000Z"}] if gid == "3" else []
+    )
+    return app
+
+
+def test_load_and_query(app, tmp_path):
+    mirror = ProjectMirror(app, str(tmp_path / "mirror.sqlite"))
+    report = mirror.load("9")
+    assert (report["tasks"], report["sections"], report["stories"]) == (3, 2, 1)
+    assert report["freshness"]["name"] == "Launch"
+
+    gids = lambda tasks: [task["gid"] for task in tasks]  # noqa: E731
+    assert gids(mirror.query_tasks("9")) == ["1", "2"]
+    assert gids(mirror.query_tasks("9", section="todo", include_subtasks=True)) == ["1", "3"]
+    assert gids(mirror.query_tasks("9", assignee="ADA@example.com")) == ["1"]
+    assert gids(mirror.query_tasks("9", custom_field="priority", custom_field_value="high")) == ["1"]
+    assert gids(mirror.query_tasks("9", completed=False, include_subtasks=True)) == ["1", "3"]
+    task = mirror.get_task("3")
+    assert task["stories"][0]["text"] == "Looks good"
+    assert mirror.projects_of("3") == ["9"]
+
+
+def test_sync_applies_events_and_reloads_on_expired_token(app, tmp_path):
+    mirror = ProjectMirror(app, str(tmp_path / "mirror.sqlite"))
+    mirror.load("9")
+    app.get_events_on_aresource.side_effect = None
+    app.get_events_on_aresource.return_value = {
+        "data": [
+            {"resource": {"gid": "2", "resource_type": "task"}, "action": "changed", "created_at": "2024-02-01T00:00:00.000Z"},
+            {"resource": {"gid": "1", "resource_type": "task"}, "action": "deleted", "created_at": "2024-02-02T00:00:00.000Z"},
+        ],
+        "sync": "t1",
+        "has_more": False,
+    }
+    app.hydrate.return_value = {"data": [_task("2", "Ship it", "s1")], "errors": []}
+
+    result = mirror.sync()
+    assert result["applied"] == {"9": 2}
+    app.get_events_on_aresource.assert_called_with(resource="9", sync="t0")
+    assert [task["gid"] for task in mirror.query_tasks("9", section="s1", include_subtasks=True)] == ["2"]
+    assert mirror.get_task("3") is None
+    assert result["freshness"]["9"]["last_event_at"] == "2024-02-02T00:00:00.000Z"
+
+    app.get_events_on_aresource.side_effect = [_expired("stale"), _expired("t2")]
+    assert mirror.sync(["9"])["reloaded"] == ["9"]
+    assert [task["gid"] for task in mirror.query_tasks("9")] == ["1", "2"]
+
+
+def test_sync_reports_failing_projects_and_syncs_the_rest(app, tmp_path):
+    mirror = ProjectMirror(app, str(tmp_path / "mirror.sqlite"))
+    mirror.load("8")
+    mirror.load("9")
+    request = httpx.Request("GET", "https://app.asana.com/api/1.0/events")
+    forbidden = httpx.HTTPStatusError("Forbidden", request=request, response=httpx.Response(403, request=request))
+    app.get_events_on_aresource.side_effect = lambda resource, sync: (
+        {"data": [], "sync": "t1", "has_more": False} if resource == "9" else (_ for _ in ()).throw(forbidden)
+    )
+
+    result = mirror.sync()
+    assert result["applied"] == {"9": 0}
+    assert result["errors"] == {"8": "HTTPStatusError: Forbidden"}
+
+
+def test_concurrent_syncs_of_a_project_apply_each_page_once(app, tmp_path):
+    mirror = ProjectMirror(app, str(tmp_path / "mirror.sqlite"))
+    mirror.load("9")
+    entered = threading.Event()
+    pages = {"t0": {"data": [{"resource": {"gid": "9", "resource_type": "project"}, "action": "changed"}], "sync": "t1"}}
+
+    def events(resource, sync):
+        entered.set()
+        time.sleep(0.05)
+        return pages.get(sync, {"data": [], "sync": sync})
+
+    app.get_events_on_aresource.side_effect = events
+    background = threading.Thread(target=mirror.sync)
+    background.start()
+    assert entered.wait(5)
+    mirror.sync(["9"])
+    background.join()
+    assert mirror.freshness(["9"])["9"]["events_applied"] == 1
+
+
+def test_tools_require_a_mirrored_project(tmp_path):
+    integration = MagicMock()
+    integration.get_credentials.return_value = {"access_token": "dummy_access_token"}
+    with pytest.raises(ValueError, match="not enabled"):
+        AsanaApp(integration=integration).get_mirror_status()
+    app = AsanaApp(integration=integration, mirror_path=str(tmp_path / "mirror.sqlite"))
+    assert app.get_mirror_status() == {"data": {}}
+    with pytest.raises(ValueError, match="not mirrored"):
+        app.query_mirrored_tasks("9")
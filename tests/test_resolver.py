@@ -0,0 +1,180 @@
+import threading
+import time
+from unittest.mock import MagicMock, patch
+
+import httpx
+import pytest
+
+from universal_mcp_asana.app import AsanaApp
+from universal_mcp_asana.resolver import CustomFieldCatalog, NameIndex, TypeaheadCache
+
+USERS = [
+    {"gid": "1", "name": "Alice Smith", "email": "alice@example.com"},
+    {"gid": "2", "name": "alice  smith", "email": "asmith@example.com"},
+    {"gid": "3", "name": "Alfred Jones", "email": "alfred@example.com"},
+]
+
+
+def test_lookup_tiers():
+    app = MagicMock()
+    app.iter_users_in_aworkspace_or_organization.return_value = USERS
+    index = NameIndex(app)
+
+    assert [m["gid"] for m in index.resolve("Alice Smith", "user", "9")] == ["1"]
+    assert [(m["gid"], m["match"]) for m in index.resolve("ALICE SMITH", "user", "9")] == [("1", "casefold"), ("2", "casefold")]
+    assert index.resolve("ASmith@example.com", "user", "9")[0]["gid"] == "2"
+    assert [m["gid"] for m in index.resolve("al", "user", "9")] == ["3", "1", "2"]
+    assert index.resolve("3", "user", "9")[0]["match"] == "gid"
+    app.iter_users_in_aworkspace_or_organization.assert_called_once_with("9", opt_fields="name,email")
+
+
+def test_misses_relist_at_most_once_per_interval():
+    app = MagicMock()
+    app.iter_tags_in_aworkspace.return_value = [{"gid": "5", "name": "urgent"}]
+    index = NameIndex(app, miss_refresh=60)
+    assert index.resolve("blocked", "tag", "9") == []
+    assert index.resolve("blocked", "tag", "9") == []
+    assert app.iter_tags_in_aworkspace.call_count == 1
+
+
+def test_renames_drop_the_old_name_from_the_index():
+    app = MagicMock()
+    app.iter_users_in_aworkspace_or_organization.return_value = USERS
+    index = NameIndex(app)
+    index.resolve("alice", "user", "9")
+
+    index.observe("PUT", "/users/1", {"data": {"gid": "1", "resource_type": "user", "name": "Alice Jones", "email": "aj@example.com"}})
+
+    assert [m["gid"] for m in index.resolve("alice smith", "user", "9")] == ["2"]
+    assert index.resolve("Alice Jones", "user", "9")[0]["match"] == "exact"
+    assert index.resolve("aj@example.com", "user", "9")[0]["gid"] == "1"
+    assert index.resolve("alice@example.com", "user", "9") == []
+
+
+def test_listing_does_not_block_lookups_in_other_scopes():
+    listing = threading.Event()
+    released = threading.Event()
+
+    def list_tags(workspace, opt_fields):
+        if workspace == "9":
+            listing.set()
+            released.wait(5)
+        return [{"gid": workspace, "name": "urgent"}]
+
+    app = MagicMock()
+    app.iter_tags_in_aworkspace.side_effect = list_tags
+    index = NameIndex(app)
+    index.resolve("urgent", "tag", "8")
+    slow = threading.Thread(target=index.resolve, args=("urgent", "tag", "9"))
+    slow.start()
+    assert listing.wait(5)
+    try:
+        started = time.monotonic()
+        assert index.resolve("urgent", "tag", "8")[0]["gid"] == "8"
+        assert time.monotonic() - started < 1
+    finally:
+        released.set()
+        slow.join()
+    assert index.resolve("urgent", "tag", "9")[0]["gid"] == "9"
+
+
+def test_writes_through_the_app_update_the_index():
+    integration = MagicMock()
+    integration.get_credentials.return_value = {"access_token": "dummy_access_token"}
+    app = AsanaApp(integration=integration)
+    app.iter_tags_in_aworkspace = MagicMock(return_value=[{"gid": "5", "name": "urgent"}])
+    assert app.resolve_names("urgent", "tag", workspace_gid="9")["data"][0]["matches"][0]["gid"] == "5"
+
+    created = {"data": {"gid": "6", "resource_type": "tag", "name": "blocked", "workspace": {"gid": "9"}}}
+    with patch("universal_mcp.applications.application.APIApplication._post") as network_post:
+        network_post.return_value = httpx.Response(200, json=created, request=httpx.Request("POST", f"{app.base_url}/tags"))
+        app.create_atag(data={"name": "blocked", "workspace": "9"})
+    with patch("universal_mcp.applications.application.APIApplication._delete") as network_delete:
+        network_delete.return_value = httpx.Response(200, json={"data": {}}, request=httpx.Request("DELETE", f"{app.base_url}/tags/5"))
+        app.delete_atag("5")
+
+    result = app.resolve_names(["blocked", "urgent"], "tag", workspace_gid="9")["data"]
+    assert result[0]["matches"] == [{"gid": "6", "name": "blocked", "match": "exact", "resource_type": "tag"}]
+    assert result[1]["matches"] == []
+    app.iter_tags_in_aworkspace.assert_called_once()
+
+
+PRIORITY = {
+    "gid": "100",
+    "name": "Priority",
+    "resource_subtype": "enum",
+    "enum_options": [{"gid": "101", "name": "High"}, {"gid": "102", "name": "Low"}],
+}
+LABELS = {
+    "gid": "200",
+    "name": "Labels",
+    "resource_subtype": "multi_enum",
+    "enum_options": [{"gid": "201", "name": "Bug"}, {"gid": "202", "name": "UX"}],
+}
+ESTIMATE = {"gid": "300", "name": "Estimate", "resource_subtype": "number"}
+
+
+def test_custom_field_names_and_labels_are_translated():
+    app = MagicMock()
+    app.iter_aproject_scustom_fields.return_value = [{"custom_field": PRIORITY}, {"custom_field": LABELS}]
+    app.iter_aworkspace_scustom_fields.return_value = [PRIORITY, LABELS, ESTIMATE]
+    catalog = CustomFieldCatalog(app)
+
+    translated = catalog.translate(
+        {"priority": "high", "Labels": "Bug, ux", "Estimate": 3, "100": "102"}, workspace="9", projects=["7"]
+    )
+    assert translated == {"100": "102", "200": ["201", "202"], "300": 3}
+    with pytest.raises(ValueError, match="Unknown option 'Urgent'"):
+        catalog.translate({"Priority": "Urgent"}, projects=["7"])
+    with pytest.raises(ValueError, match="Unknown custom field 'Owner'"):
+        catalog.translate({"Owner": "x"}, workspace="9")
+    assert app.iter_aproject_scustom_fields.call_count == 1
+    assert app.iter_aworkspace_scustom_fields.call_count == 1
+
+
+def test_update_atask_translates_before_sending():
+    integration = MagicMock()
+    integration.get_credentials.return_value = {"access_token": "dummy_access_token"}
+    app = AsanaApp(integration=integration)
+    app.iter_aworkspace_scustom_fields = MagicMock(return_value=[PRIORITY])
+    app.get_atask = MagicMock(return_value={"data": {"gid": "1", "workspace": {"gid": "9"}, "projects": []}})
+    with patch("universal_mcp.applications.application.APIApplication._put") as network_put:
+        network_put.return_value = httpx.Response(200, json={"data": {"gid": "1"}}, request=httpx.Request("PUT", f"{app.base_url}/tasks/1"))
+        app.update_atask("1", data={"custom_fields": {"Priority": "Low"}})
+    assert network_put.call_args.args[1] == {"data": {"custom_fields": {"100": "102"}}}
+
+
+def test_typeahead_trie_filters_complete_prefix_results():
+    cache = TypeaheadCache(ttl=10)
+    people = [
+        {"gid": "1", "name": "Alice Smith", "email": "alice@example.com"},
+        {"gid": "2", "name": "Alan Turing", "email": "turing@example.com"},
+        {"gid": "3", "name": "Sally Albright", "email": "sally@example.com"},
+    ]
+    cache.put("9", "user", "al", 20, None, people)
+    assert [r["gid"] for r in cache.get("9", "user", "ali")] == ["1"]
+    assert [r["gid"] for r in cache.get("9", "user", "Alb")] == ["3"]
+    assert cache.get("9", "user", "al", count=2) == people[:2]
+    assert cache.get("9", "project", "ali") is None
+
+    cache.put("9", "task", "a", 2, None, [{"gid": "4", "name": "Audit"}, {"gid": "5", "name": "Archive"}])
+    assert cache.get("9", "task", "au") is None
+    with patch("universal_mcp_asana.resolver.time.monotonic", return_value=time.monotonic() + 11):
+        assert cache.get("9", "user", "ali") is None
+
+
+def test_typeahead_tool_answers_longer_queries_locally():
+    integration = MagicMock()
+    integration.get_credentials.return_value = {"access_token": "dummy_access_token"}
+    app = AsanaApp(integration=integration, cache=True)
+    url = f"{app.base_url}/workspaces/9/typeahead"
+    with patch("universal_mcp.applications.application.APIApplication._get") as network_get:
+        network_get.return_value = httpx.Response(
+            200, json={"data": [{"gid": "7", "name": "Q3 Launch"}, {"gid": "8", "name": "Q4 Plan"}]}, request=httpx.Request("GET", url)
+        )
+        app.get_objects_via_typeahead("9", resource_type="project", query="q")
+        for query in ("q3", "q3 ", "q3 la", "q3 lau"):
+            assert app.get_objects_via_typeahead("9", resource_type="project", query=query)["data"] == [
+                {"gid": "7", "name": "Q3 Launch"}
+            ]
+    network_get.assert_called_once()
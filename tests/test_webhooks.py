@@ -0,0 +1,141 @@
+import hashlib
+import hmac
+import json
+
+from unittest.mock import MagicMock
+
+import httpx
+
+from universal_mcp_asana.webhooks import WebhookReceiver, WebhookReconciler
+
+
+def _sign(secret, body):
+    return hmac.new(secret.encode(), body, hashlib.sha256).hexdigest()
+
+
+def test_receiver_completes_handshakes_and_verifies_signatures(tmp_path):
+    secrets_path = str(tmp_path / "secrets.json")
+    receiver = WebhookReceiver(port=0, public_url="https://hooks.example.com/", secrets_path=secrets_path)
+    assert receiver.target_for("project-9") == "https://hooks.example.com/webhooks/project-9"
+    receiver.start_in_thread()
+    try:
+        url = f"http://127.0.0.1:{receiver.port}/webhooks/project-9"
+        with httpx.Client() as client:
+            assert client.post(url, headers={"X-Hook-Secret": "s3cret"}).status_code == 403
+            receiver.expect("project-9")
+            handshake = client.post(url, headers={"X-Hook-Secret": "s3cret"})
+            assert handshake.status_code == 200
+            assert handshake.headers["X-Hook-Secret"] == "s3cret"
+            assert client.post(url, headers={"X-Hook-Secret": "hijack"}).status_code == 403
+
+            body = json.dumps({"events": [{"action": "changed", "resource": {"gid": "1"}}]}).encode()
+            assert client.post(url, content=body, headers={"X-Hook-Signature": _sign("hijack", body)}).status_code == 401
+            assert client.post(url, content=body).status_code == 401
+            assert client.post(url, content=body, headers={"X-Hook-Signature": _sign("s3cret", body)}).status_code == 200
+            heartbeat = b'{"events": []}'
+            assert client.post(url, content=heartbeat, headers={"X-Hook-Signature": _sign("s3cret", heartbeat)}).status_code == 200
+            assert client.get(url).status_code == 405
+            assert client.post(f"http://127.0.0.1:{receiver.port}/other/project-9").status_code == 404
+
+            receiver.expect("project-9")
+            assert client.post(url, headers={"X-Hook-Secret": "rotated"}).status_code == 200
+
+        delivery = receiver.get_blocking(timeout=1)
+        assert delivery["key"] == "project-9"
+        assert delivery["events"] == [{"action": "changed", "resource": {"gid": "1"}}]
+        assert receiver.get_blocking(timeout=0.05) is None
+        assert receiver.stats() == {
+            "handshakes": 2,
+            "deliveries": 1,
+            "events": 1,
+            "heartbeats": 1,
+            "rejected": 4,
+            "refused": 0,
+            "queued": 0,
+            "webhooks": 1,
+        }
+    finally:
+        receiver.stop_in_thread()
+    assert WebhookReceiver(secrets_path=secrets_path).secrets.get("project-9") == "rotated"
+
+
+def test_full_queue_refuses_deliveries_until_drained():
+    receiver = WebhookReceiver(port=0, max_queue=1, enqueue_timeout=0.05)
+    receiver.start_in_thread()
+    try:
+        url = f"http://127.0.0.1:{receiver.port}/webhooks/tasks"
+        body = b'{"events": [{"action": "added"}]}'
+        headers = {"X-Hook-Signature": _sign("k", body)}
+        with httpx.Client() as client:
+            assert client.post(url, headers={"X-Hook-Secret": "k"}).status_code == 403
+            receiver.expect("tasks")
+            assert client.post(url, headers={"X-Hook-Secret": "k"}).status_code == 200
+            assert client.post(url, content=body, headers=headers).status_code == 200
+            refused = client.post(url, content=body, headers=headers)
+            assert refused.status_code == 503
+            assert refused.headers["Retry-After"] == "1"
+            assert receiver.get_blocking(timeout=1)["events"] == [{"action": "added"}]
+            assert client.post(url, content=body, headers=headers).status_code == 200
+        assert receiver.stats()["refused"] == 1
+    finally:
+        receiver.stop_in_thread()
+
+
+def _webhook(gid, resource, filters=None, target=None, **health):
+    return {
+        "gid": gid,
+        "resource": {"gid": resource},
+        "target": target or f"https://hooks.example.com/asana/{resource}",
+        "filters": filters or [],
+        "active": True,
+        "created_at": f"2024-01-0{gid[-1]}T00:00:00.000Z",
+        **health,
+    }
+
+
+def test_reconciler_applies_the_minimal_changes():
+    due = [{"resource_type": "task", "action": "changed", "fields": ["due_on", "due_at"]}]
+    app = MagicMock()
+    app.iter_multiple_webhooks.return_value = [
+        _webhook("w1", "1", [{"action": "changed", "fields": ["due_at", "due_on"], "resource_type": "task", "resource_subtype": None}]),
+        _webhook("w2", "2", [{"resource_type": "task", "action": "added"}]),
+        _webhook("w3", "3", last_success_at="2024-02-01T00:00:00.000Z", last_failure_at="2024-02-02T00:00:00.000Z"),
+        _webhook("w4", "4"),
+        _webhook("w5", "5"),
+        _webhook("w6", "5"),
+        _webhook("w7", "7", target="https://elsewhere.example.com/7"),
+    ]
+    app.submit_parallel_requests.side_effect = lambda data: {
+        "data": [{"status_code": 404 if action["relative_path"] == "/webhooks/w4" else 200, "body": {"data": {}}} for action in data["actions"]]
+    }
+    app.establish_awebhook.side_effect = lambda data: {"data": {"gid": f"new-{data['resource']}"}}
+    reconciler = WebhookReconciler(app, "1331", target="https://hooks.example.com/asana/{resource}")
+    subscriptions = [{"resource": gid, "filters": due if gid in ("1", "2") else None} for gid in ("1", "2", "3", "5", "6")]
+
+    plan = reconciler.reconcile(subscriptions, dry_run=True)
+    assert {(item["gid"], item["reason"]) for item in plan["delete"]} == {("w3", "unhealthy"), ("w4", "undeclared"), ("w5", "duplicate")}
+    assert [item["gid"] for item in plan["update"]] == ["w2"]
+    assert [item["gid"] for item in plan["unhealthy"]] == ["w3"]
+    assert plan["unchanged"] == 2
+    assert not app.submit_parallel_requests.called and not app.establish_awebhook.called
+
+    report = reconciler.reconcile(subscriptions)
+    assert sorted(report["deleted"]) == ["w3", "w4", "w5"]
+    assert report["updated"] == ["w2"]
+    assert sorted(item["gid"] for item in report["created"]) == ["new-3", "new-6"]
+    assert report["failed"] == []
+    actions = [action for call in app.submit_parallel_requests.call_args_list for action in call.kwargs["data"]["actions"]]
+    assert {"relative_path": "/webhooks/w2", "method": "put", "data": {"filters": [{"resource_type": "task", "action": "changed", "fields": ["due_at", "due_on"]}]}} in actions
+    created = {call.kwargs["data"]["resource"]: call.kwargs["data"] for call in app.establish_awebhook.call_args_list}
+    assert created["6"] == {"resource": "6", "target": "https://hooks.example.com/asana/6"}
+
+
+def test_reconciler_expects_handshakes_on_its_receiver():
+    receiver = WebhookReceiver(public_url="https://hooks.example.com")
+    app = MagicMock()
+    app.iter_multiple_webhooks.return_value = []
+    app.establish_awebhook.side_effect = lambda data: {"data": {"gid": "w9"}}
+    report = WebhookReconciler(app, "1331", receiver=receiver).reconcile([{"resource": "9"}])
+    assert report["created"] == [{"resource": "9", "gid": "w9"}]
+    assert app.establish_awebhook.call_args.kwargs["data"]["target"] == "https://hooks.example.com/webhooks/9"
+    assert "9" in receiver._expected